@@ -1,5 +1,22 @@
 from .hypy import Hypy
 from .hypy_async import HypyAsync
+from .auctions import AuctionSnapshot, AuctionDiffer, AuctionEvent, AuctionTable, EndingSoonScheduler
+from .catalog import ItemCatalog
+from .columns import MemberColumns, extract_member_columns
+from .export import SQLiteSink
+from .normalize import canonical_key, group_auctions
+from .orderbook import OrderBook
+from .player_cache import PlayerCache
+from .replay import ResponseArchive
+from .revalidate import StaleWhileRevalidate
+from .resilience import AdaptiveConcurrency, CircuitBreaker, HedgePolicy
+from .scheduler import PriorityScheduler
+from .shared_cache import SharedResponseCache
+from .levels import LevelTable, LevelTables
+from .snapshots import ProfileTracker
+from .stats import PriceAggregator, QuantileSketch, Ewma
+from .watcher import Watcher, Subscription
+from .valuation import PriceTable, ValuationEngine, Valuation
 from .exceptions import (
     HypixelAPIError,
     HypixelRequestError,
@@ -11,7 +28,9 @@ from .exceptions import (
     HypixelInvalidResponseError,
     HypixelBadRequestError,
     HypixelUnprocessableEntityError,
-    HypixelServiceUnavailableError
+    HypixelServiceUnavailableError,
+    HypixelCircuitOpenError,
+    HypixelDeadlineExceededError
 )
 from .modals import (
     BazaarResponse,
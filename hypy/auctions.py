@@ -0,0 +1,313 @@
+import time
+import heapq
+import asyncio
+from dataclasses import dataclass
+from itertools import count
+from typing import Optional, List, Dict, Set, Tuple, Iterable, Iterator, Callable, Awaitable, Any
+
+from hypy.modals import ActiveAuctionsResponse, AuctionsDetails, RequestAuctionsBids, datetime_to_timestamp
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+def auction_fingerprint(auction: AuctionsDetails) -> int:
+    """
+    Returns a cheap fingerprint of the mutable fields of an auction (bids, price, end and claim state).
+    :param auction: AuctionsDetails
+    :return: int
+    """
+    return hash((auction.highest_bid_amount, auction.starting_bid, len(auction.bids or ()), auction.end, auction.claimed))
+
+
+@dataclass(slots=True)
+class AuctionEvent:
+    kind: str
+    uuid: str
+    auction: AuctionsDetails
+    previous: Optional[AuctionsDetails] = None
+
+
+class AuctionSnapshot:
+    """
+    Active auctions of one sweep keyed on ``uuid``, together with their fingerprints.
+    """
+    def __init__(self, pages: Iterable[ActiveAuctionsResponse] = ()):
+        self.auctions: Dict[str, AuctionsDetails] = {}
+        self.fingerprints: Dict[str, int] = {}
+        for page in pages:
+            self.add_page(page)
+
+    def __len__(self) -> int:
+        return len(self.auctions)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self.auctions
+
+    def get(self, uuid: str) -> Optional[AuctionsDetails]:
+        return self.auctions.get(uuid)
+
+    def add_page(self, page: ActiveAuctionsResponse):
+        for auction in page.auctions or []:
+            self.add(auction)
+
+    def add(self, auction: AuctionsDetails):
+        if auction.uuid is None:
+            return
+        self.auctions[auction.uuid] = auction
+        self.fingerprints[auction.uuid] = auction_fingerprint(auction)
+
+    def diff(self, newer: "AuctionSnapshot") -> List[AuctionEvent]:
+        """
+        Returns the events turning this snapshot into a newer one.
+        :param newer: AuctionSnapshot of a later sweep
+        :return: List[AuctionEvent]
+        """
+        old, new = self.fingerprints, newer.fingerprints
+        events = [AuctionEvent(ADDED, uuid, newer.auctions[uuid]) for uuid in new.keys() - old.keys()]
+        events.extend(AuctionEvent(REMOVED, uuid, self.auctions[uuid]) for uuid in old.keys() - new.keys())
+        events.extend(
+            AuctionEvent(CHANGED, uuid, newer.auctions[uuid], self.auctions[uuid])
+            for uuid in new.keys() & old.keys() if new[uuid] != old[uuid]
+        )
+        return events
+
+
+_BID_FIELDS = tuple(RequestAuctionsBids.model_fields)
+
+
+def auction_rows(page: ActiveAuctionsResponse) -> List[Tuple[Any, ...]]:
+    """
+    Returns the auctions of a validated page as ``AuctionTable`` rows.
+    :param page: ActiveAuctionsResponse
+    :return: List[Tuple[Any, ...]]
+    """
+    fields = AuctionTable.FIELDS
+    bids = fields.index("bids")
+    rows = []
+    for auction in page.auctions or []:
+        row = [getattr(auction, field) for field in fields]
+        row[bids] = tuple(tuple(getattr(bid, field) for field in _BID_FIELDS) for bid in row[bids] or ())
+        rows.append(tuple(row))
+    return rows
+
+
+class AuctionTable:
+    """
+    Auctions of a sweep as plain tuples with one value per ``AuctionTable.FIELDS`` entry, validated like
+    AuctionsDetails. Bids are tuples of the RequestAuctionsBids fields.\n
+    Tuples are far cheaper than models to send back from a process pool and to keep for a whole sweep.
+    ``column`` extracts one field, ``auctions`` and ``to_response`` build the models for code that needs them.
+    """
+    FIELDS = tuple(AuctionsDetails.model_fields)
+
+    def __init__(self, rows: List[Tuple[Any, ...]], total_pages: Optional[int] = None, totalAuctions: Optional[int] = None,
+                 lastUpdated: Optional[str] = None):
+        self.rows = rows
+        self.total_pages = total_pages
+        self.totalAuctions = totalAuctions
+        self.lastUpdated = lastUpdated
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return iter(self.rows)
+
+    def column(self, field: str) -> List[Any]:
+        """
+        Returns the values of one field, in row order.
+        :param field: Field of ``FIELDS``
+        :return: List[Any]
+        """
+        index = self.FIELDS.index(field)
+        return [row[index] for row in self.rows]
+
+    def auctions(self) -> List[AuctionsDetails]:
+        """
+        Builds the AuctionsDetails of every row without validating them again.
+        :return: List[AuctionsDetails]
+        """
+        fields = self.FIELDS
+        bids = fields.index("bids")
+        auctions = []
+        for row in self.rows:
+            values = dict(zip(fields, row))
+            values["bids"] = [RequestAuctionsBids.model_construct(**dict(zip(_BID_FIELDS, bid))) for bid in row[bids]]
+            auctions.append(AuctionsDetails.model_construct(**values))
+        return auctions
+
+    def to_response(self) -> ActiveAuctionsResponse:
+        """
+        Returns the sweep as one ActiveAuctionsResponse, e.g. for AuctionSnapshot, SQLiteSink or group_auctions.
+        :return: ActiveAuctionsResponse
+        """
+        return ActiveAuctionsResponse.model_construct(
+            success=True,
+            page=None,
+            total_pages=self.total_pages,
+            totalAuctions=self.totalAuctions,
+            lastUpdated=self.lastUpdated,
+            auctions=self.auctions()
+        )
+
+
+class AuctionDiffer:
+    """
+    Streaming diff between consecutive auction house sweeps.\n
+    ``feed`` returns added and changed auctions as soon as each page arrives, ``finish`` returns the auctions
+    that disappeared once the sweep is complete and makes the new sweep the baseline for the next one.
+    :param previous: Snapshot to diff the first sweep against, an empty one by default.
+    """
+    def __init__(self, previous: Optional[AuctionSnapshot] = None):
+        self.previous = previous or AuctionSnapshot()
+        self.current = AuctionSnapshot()
+
+    def feed(self, page: ActiveAuctionsResponse) -> List[AuctionEvent]:
+        events = []
+        previous, current = self.previous, self.current
+        for auction in page.auctions or []:
+            uuid = auction.uuid
+            if uuid is None or uuid in current.fingerprints:
+                continue
+            current.add(auction)
+            old = previous.fingerprints.get(uuid)
+            if old is None:
+                events.append(AuctionEvent(ADDED, uuid, auction))
+            elif old != current.fingerprints[uuid]:
+                events.append(AuctionEvent(CHANGED, uuid, auction, previous.auctions[uuid]))
+        return events
+
+    def finish(self) -> List[AuctionEvent]:
+        previous, current = self.previous, self.current
+        events = [AuctionEvent(REMOVED, uuid, previous.auctions[uuid]) for uuid in previous.fingerprints.keys() - current.fingerprints.keys()]
+        self.previous = current
+        self.current = AuctionSnapshot()
+        return events
+
+
+class EndingSoonScheduler:
+    """
+    Fires a callback ``lead`` seconds before every tracked auction ends.\n
+    Auctions are kept in a heap keyed by fire time: scheduling is O(log n) and only the auctions that are due are
+    touched, instead of rescanning the whole snapshot. Rescheduled and cancelled auctions are dropped lazily when they
+    reach the top of the heap. Feed it the events of an AuctionDiffer with ``apply`` to keep it in sync with the
+    auction house. A single event loop timer is armed for the earliest fire time.
+    :param callback: Coroutine function called with the AuctionsDetails of every auction about to end.
+    :param lead: Seconds before the end of an auction at which the callback fires (default is 5).
+    """
+    def __init__(self, callback: Callable[[AuctionsDetails], Awaitable[None]], lead: float = 5.0):
+        self.callback = callback
+        self.lead = lead
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scheduled: Dict[str, Tuple[float, int, AuctionsDetails]] = {}
+        self._sequence = count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at: Optional[float] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._scheduled
+
+    def schedule(self, auction: AuctionsDetails) -> bool:
+        """
+        Schedules an auction, replacing its previous schedule. BIN auctions and auctions that already ended are ignored.
+        :param auction: AuctionsDetails
+        :return: True if the auction is scheduled
+        """
+        if auction.uuid is None or auction.end is None or auction.bin or auction.claimed:
+            self.cancel(auction.uuid)
+            return False
+        end = datetime_to_timestamp(auction.end) / 1000
+        if end <= time.time():
+            self.cancel(auction.uuid)
+            return False
+        fire_at = end - self.lead
+        current = self._scheduled.get(auction.uuid)
+        if current is not None and current[0] == fire_at:
+            self._scheduled[auction.uuid] = (fire_at, current[1], auction)
+            return True
+        sequence = next(self._sequence)
+        self._scheduled[auction.uuid] = (fire_at, sequence, auction)
+        heapq.heappush(self._heap, (fire_at, sequence, auction.uuid))
+        self._arm()
+        return True
+
+    def cancel(self, uuid: Optional[str]):
+        self._scheduled.pop(uuid, None)
+
+    def load(self, auctions: Iterable[AuctionsDetails]):
+        for auction in auctions:
+            self.schedule(auction)
+
+    def apply(self, events: Iterable[AuctionEvent]):
+        """
+        Updates the schedule from AuctionDiffer events: added and changed auctions are (re)scheduled, removed ones cancelled.
+        """
+        for event in events:
+            if event.kind == REMOVED:
+                self.cancel(event.uuid)
+            else:
+                self.schedule(event.auction)
+
+    def next_fire_time(self) -> Optional[float]:
+        """
+        Returns the wall clock time of the next callback, or None if nothing is scheduled.
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def due(self, now: Optional[float] = None) -> List[AuctionsDetails]:
+        """
+        Removes and returns the auctions whose fire time has passed, earliest first.
+        :param now: Wall clock time, defaults to now
+        :return: List[AuctionsDetails]
+        """
+        now = time.time() if now is None else now
+        auctions = []
+        while self._heap and self._heap[0][0] <= now:
+            _, sequence, uuid = heapq.heappop(self._heap)
+            current = self._scheduled.get(uuid)
+            if current is not None and current[1] == sequence:
+                del self._scheduled[uuid]
+                auctions.append(current[2])
+        return auctions
+
+    async def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = self._timer_at = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _discard_stale(self):
+        heap, scheduled = self._heap, self._scheduled
+        while heap and (heap[0][2] not in scheduled or scheduled[heap[0][2]][1] != heap[0][1]):
+            heapq.heappop(heap)
+
+    def _arm(self):
+        fire_at = self.next_fire_time()
+        if fire_at is None or self._timer_at is not None and self._timer_at <= fire_at:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside an event loop the schedule is only kept, the timer is armed by the next schedule or fire.
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_at = fire_at
+        self._timer = loop.call_later(max(fire_at - time.time(), 0), self._fire)
+
+    def _fire(self):
+        self._timer = self._timer_at = None
+        for auction in self.due():
+            task = asyncio.ensure_future(self.callback(auction))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._arm()
@@ -0,0 +1,99 @@
+import re
+from bisect import bisect_left
+from typing import Optional, List, Dict
+
+from hypy.modals import ItemsResponse, ItemsDetails
+from hypy.normalize import strip_formatting
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes an item name for lookups: formatting codes are removed, whitespace is collapsed and the name is lowercased.
+    :param name: Item name
+    :return: str
+    """
+    return _WHITESPACE.sub(" ", strip_formatting(name)).strip().casefold()
+
+
+class ItemCatalog:
+    """
+    Indexed view of the items resource.\n
+    Items are indexed by ID, by normalized name (with prefix search) and grouped by tier and material.
+    The indexes are built once per ``lastUpdated`` and reused until ``update`` receives a newer catalog.
+    """
+    def __init__(self, response: Optional[ItemsResponse] = None):
+        self.version: Optional[str] = None
+        self._by_id: Dict[str, ItemsDetails] = {}
+        self._by_name: Dict[str, List[ItemsDetails]] = {}
+        self._names: List[str] = []
+        self._by_tier: Dict[str, List[ItemsDetails]] = {}
+        self._by_material: Dict[str, List[ItemsDetails]] = {}
+        if response is not None:
+            self.update(response)
+
+    def update(self, response: ItemsResponse) -> bool:
+        """
+        Rebuilds the indexes if the response is a different catalog version than the one currently indexed.
+        :param response: ItemsResponse
+        :return: True if the indexes were rebuilt
+        """
+        if self._by_id and response.lastUpdated == self.version:
+            return False
+        by_id, by_name, by_tier, by_material = {}, {}, {}, {}
+        for item in response.items or []:
+            if item.id is not None:
+                by_id[item.id] = item
+            if item.name:
+                by_name.setdefault(normalize_name(item.name), []).append(item)
+            by_tier.setdefault(item.tier, []).append(item)
+            by_material.setdefault(item.material, []).append(item)
+        self._by_id = by_id
+        self._by_name = by_name
+        self._names = sorted(by_name)
+        self._by_tier = by_tier
+        self._by_material = by_material
+        self.version = response.lastUpdated
+        return True
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._by_id
+
+    def __getitem__(self, item_id: str) -> ItemsDetails:
+        return self._by_id[item_id]
+
+    def get(self, item_id: str) -> Optional[ItemsDetails]:
+        return self._by_id.get(item_id)
+
+    def by_name(self, name: str) -> List[ItemsDetails]:
+        """
+        Returns the items whose normalized name matches exactly.
+        :param name: Item name, case and formatting codes are ignored
+        :return: List[ItemsDetails]
+        """
+        return list(self._by_name.get(normalize_name(name), ()))
+
+    def search(self, prefix: str, limit: int = 10) -> List[ItemsDetails]:
+        """
+        Returns items whose normalized name starts with the given prefix, in alphabetical order.
+        :param prefix: Name prefix, case and formatting codes are ignored
+        :param limit: Maximum number of items returned (default is 10)
+        :return: List[ItemsDetails]
+        """
+        prefix = normalize_name(prefix)
+        results = []
+        index = bisect_left(self._names, prefix)
+        while index < len(self._names) and len(results) < limit and self._names[index].startswith(prefix):
+            results.extend(self._by_name[self._names[index]][:limit - len(results)])
+            index += 1
+        return results
+
+    def by_tier(self, tier: Optional[str]) -> List[ItemsDetails]:
+        return list(self._by_tier.get(tier, ()))
+
+    def by_material(self, material: Optional[str]) -> List[ItemsDetails]:
+        return list(self._by_material.get(material, ()))
@@ -0,0 +1,124 @@
+import math
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from pydantic import BaseModel
+
+from hypy.modals import ProfilesResponse
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_REDUCERS = {
+    "max": max,
+    "min": min,
+    "sum": lambda current, value: current + value,
+    "first": lambda current, value: current,
+    "last": lambda current, value: value,
+}
+
+
+def _walk(value: Any, keys: Tuple[str, ...]) -> float:
+    for key in keys:
+        if value is None:
+            return math.nan
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, BaseModel):
+            value = getattr(value, key, None)
+        else:
+            return math.nan
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return math.nan
+    return float(value)
+
+
+class MemberColumns:
+    """
+    Member statistics as aligned NumPy columns: ``columns[path][i]`` belongs to ``uuids[i]``, missing values are NaN.
+    """
+    def __init__(self, uuids: List[str], columns: Dict[str, Any]):
+        self.uuids = uuids
+        self.columns = columns
+        self._index = {uuid: row for row, uuid in enumerate(uuids)}
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __getitem__(self, path: str) -> Any:
+        return self.columns[path]
+
+    def row(self, uuid: str) -> Dict[str, float]:
+        index = self._index[uuid]
+        return {path: float(column[index]) for path, column in self.columns.items()}
+
+    def top_k(self, path: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the ``k`` members with the highest value of a column, highest first. Missing values are never ranked.
+        :param path: Column
+        :param k: Number of members (default is 10)
+        :return: List[Tuple[str, float]]
+        """
+        column = numpy.nan_to_num(self.columns[path], nan=-numpy.inf)
+        k = min(k, len(column))
+        if k <= 0:
+            return []
+        candidates = numpy.argpartition(column, len(column) - k)[len(column) - k:]
+        ranked = candidates[numpy.argsort(column[candidates])[::-1]]
+        return [(self.uuids[row], float(column[row])) for row in ranked if column[row] != -numpy.inf]
+
+    def percentile(self, path: str, q: Any) -> Any:
+        """
+        Returns percentiles (0-100) of a column, ignoring missing values.
+        """
+        return numpy.nanpercentile(self.columns[path], q)
+
+    def percentile_of(self, uuid: str, path: str) -> float:
+        """
+        Returns the share (0-100) of members with a lower value than the given member.
+        """
+        column = self.columns[path]
+        value = column[self._index[uuid]]
+        present = column[~numpy.isnan(column)]
+        if math.isnan(value) or not len(present):
+            return math.nan
+        return float((present < value).sum() * 100 / len(present))
+
+
+def extract_member_columns(responses: Iterable[ProfilesResponse], paths: Iterable[str], reduce: str = "max", dtype: Optional[Any] = None) -> MemberColumns:
+    """
+    Extracts member statistics from many ProfilesResponse results into aligned NumPy columns keyed by member UUID.\n
+    Paths are dotted and walk both models and raw dicts from a member, e.g. ``slayer.slayer_bosses.zombie.xp`` or
+    ``currencies.coin_purse``. A member that appears in several profiles is combined with ``reduce``.
+    Requires the optional ``numpy`` dependency.
+    :param responses: ProfilesResponse results
+    :param paths: Dotted field paths
+    :param reduce: ``max``, ``min``, ``sum``, ``first`` or ``last`` (default is ``max``).
+    :param dtype: NumPy dtype of the columns (default is float64).
+    :return: MemberColumns
+    """
+    if numpy is None:
+        raise ImportError("extract_member_columns requires numpy, install it with: pip install hypixelv2.py[numpy]")
+    if reduce not in _REDUCERS:
+        raise ValueError(f"Unknown reduce: {reduce}")
+    combine = _REDUCERS[reduce]
+    paths = list(paths)
+    compiled = [tuple(path.split(".")) for path in paths]
+    rows: Dict[str, List[float]] = {}
+    for response in responses:
+        for profile in response.profiles or []:
+            for uuid, member in profile.members.items():
+                values = [_walk(member, keys) for keys in compiled]
+                current = rows.get(uuid)
+                if current is None:
+                    rows[uuid] = values
+                    continue
+                for index, value in enumerate(values):
+                    if math.isnan(current[index]):
+                        current[index] = value
+                    elif not math.isnan(value):
+                        current[index] = combine(current[index], value)
+    uuids = list(rows)
+    matrix = numpy.array(list(rows.values()), dtype=dtype or numpy.float64).reshape(len(uuids), len(paths))
+    return MemberColumns(uuids, {path: matrix[:, index].copy() for index, path in enumerate(paths)})
@@ -1,4 +1,6 @@
+import json
 import httpx
+from contextlib import contextmanager
 from pydantic import BaseModel, ValidationError
 from typing import Type
 
@@ -56,3 +58,28 @@ class HypixelValidationError(HypixelAPIError):
 
 class HypixelInvalidResponseError(HypixelAPIError):
     pass
+
+class HypixelCircuitOpenError(HypixelAPIError):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker is open, retry in {retry_after:.1f}s")
+
+class HypixelDeadlineExceededError(HypixelAPIError):
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        super().__init__(f"Deadline exceeded while requesting {endpoint}")
+
+@contextmanager
+def translate_errors():
+    try:
+        yield
+    except httpx.RequestError as e:
+        raise HypixelRequestError(e) from e
+    except httpx.HTTPStatusError as e:
+        raise HypixelHTTPError(e.response) from e
+    except json.JSONDecodeError as e:
+        raise HypixelInvalidResponseError(f"Failed to decode JSON response: {e}") from e
+    except HypixelAPIError:
+        raise
+    except Exception as e:
+        raise HypixelAPIError(f"An unexpected error occurred: {e}") from e
@@ -0,0 +1,187 @@
+import sqlite3
+from itertools import islice
+from typing import Iterable, Iterator, Tuple, Any, Union
+
+from hypy.modals import (
+    ActiveAuctionsResponse,
+    AuctionsDetails,
+    BazaarResponse,
+    RecentlyEndedAuctionsResponse,
+    datetime_to_timestamp
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS auctions (
+    uuid TEXT PRIMARY KEY,
+    auctioneer TEXT,
+    profile_id TEXT,
+    start INTEGER,
+    end INTEGER,
+    item_name TEXT,
+    tier TEXT,
+    starting_bid INTEGER,
+    highest_bid_amount INTEGER,
+    bid_count INTEGER,
+    bin INTEGER,
+    claimed INTEGER,
+    extra TEXT,
+    item_lore TEXT,
+    item_bytes TEXT,
+    snapshot INTEGER
+);
+CREATE TABLE IF NOT EXISTS auction_snapshots (
+    snapshot INTEGER NOT NULL,
+    uuid TEXT NOT NULL,
+    auctioneer TEXT,
+    profile_id TEXT,
+    start INTEGER,
+    end INTEGER,
+    item_name TEXT,
+    tier TEXT,
+    starting_bid INTEGER,
+    highest_bid_amount INTEGER,
+    bid_count INTEGER,
+    bin INTEGER,
+    claimed INTEGER,
+    extra TEXT,
+    item_lore TEXT,
+    item_bytes TEXT,
+    PRIMARY KEY (snapshot, uuid)
+);
+CREATE TABLE IF NOT EXISTS ended_auctions (
+    auction_id TEXT PRIMARY KEY,
+    seller TEXT,
+    seller_profile TEXT,
+    buyer TEXT,
+    buyer_profile TEXT,
+    time INTEGER,
+    price INTEGER,
+    bin INTEGER,
+    item_bytes TEXT
+);
+CREATE TABLE IF NOT EXISTS bazaar (
+    product_id TEXT NOT NULL,
+    last_updated INTEGER NOT NULL,
+    sell_price REAL,
+    sell_volume INTEGER,
+    sell_moving_week INTEGER,
+    sell_orders INTEGER,
+    buy_price REAL,
+    buy_volume REAL,
+    buy_moving_week INTEGER,
+    buy_orders INTEGER,
+    PRIMARY KEY (product_id, last_updated)
+);
+"""
+
+_AUCTION_COLUMNS = (
+    "uuid", "auctioneer", "profile_id", "start", "end", "item_name", "tier", "starting_bid", "highest_bid_amount",
+    "bid_count", "bin", "claimed", "extra", "item_lore", "item_bytes", "snapshot"
+)
+_UPSERT_AUCTION = (
+    f"INSERT INTO auctions ({', '.join(_AUCTION_COLUMNS)}) VALUES ({', '.join('?' * len(_AUCTION_COLUMNS))}) "
+    f"ON CONFLICT(uuid) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in _AUCTION_COLUMNS[1:])}"
+)
+_APPEND_AUCTION = (
+    f"INSERT OR REPLACE INTO auction_snapshots ({', '.join(_AUCTION_COLUMNS)}) VALUES ({', '.join('?' * len(_AUCTION_COLUMNS))})"
+)
+_INSERT_ENDED = "INSERT OR IGNORE INTO ended_auctions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_BAZAAR = "INSERT OR REPLACE INTO bazaar VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+AuctionPages = Union[ActiveAuctionsResponse, Iterable[ActiveAuctionsResponse]]
+
+
+class SQLiteSink:
+    """
+    Bulk writer for auction house and bazaar snapshots.\n
+    Rows are written with batched ``executemany`` calls, the database runs in WAL mode and every snapshot is written
+    in a single transaction, so readers never see half a sweep.
+    :param path: Path of the SQLite database, ``:memory:`` is accepted.
+    :param wal: Enable write-ahead logging (default is True).
+    :param batch_size: Number of rows handed to each ``executemany`` call (default is 5000).
+    """
+    def __init__(self, path: str, wal: bool = True, batch_size: int = 5000):
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(path)
+        if wal:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_auctions(self, pages: AuctionPages, upsert: bool = True) -> int:
+        """
+        Writes one active auctions snapshot, either a single page or every page of a sweep.\n
+        With ``upsert`` the ``auctions`` table keeps the latest state of every auction keyed on ``uuid``,
+        otherwise every row is appended to ``auction_snapshots`` together with the snapshot's ``lastUpdated``.
+        :param pages: ActiveAuctionsResponse or an iterable of them
+        :param upsert: Update existing auctions in place instead of appending (default is True).
+        :return: Number of rows written
+        """
+        if isinstance(pages, ActiveAuctionsResponse):
+            pages = (pages,)
+        return self._write(_UPSERT_AUCTION if upsert else _APPEND_AUCTION, self._auction_rows(pages))
+
+    def write_ended_auctions(self, response: RecentlyEndedAuctionsResponse) -> int:
+        """
+        Writes ended auctions, auctions that are already stored are skipped.
+        :param response: RecentlyEndedAuctionsResponse
+        :return: Number of rows handed to the database
+        """
+        rows = (
+            (auction.auction_id, auction.seller, auction.seller_profile, auction.buyer, auction.buyer_profile,
+             datetime_to_timestamp(auction.time), auction.price, auction.bin, auction.item_bytes)
+            for auction in response.auctions or []
+        )
+        return self._write(_INSERT_ENDED, rows)
+
+    def write_bazaar(self, response: BazaarResponse) -> int:
+        """
+        Writes the quick status of every bazaar product, keyed on product ID and ``lastUpdated``.
+        :param response: BazaarResponse
+        :return: Number of rows written
+        """
+        last_updated = response.last_updated
+        rows = (
+            (status.product_id, last_updated, status.sell_price, status.sell_volume, status.sell_moving_week, status.sell_orders,
+             status.buy_price, status.buy_volume, status.buy_moving_week, status.buy_orders)
+            for status in (product.quick_status for product in response.products.values())
+        )
+        return self._write(_INSERT_BAZAAR, rows)
+
+    def _write(self, statement: str, rows: Iterator[Tuple[Any, ...]]) -> int:
+        written = 0
+        with self._connection:
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    return written
+                self._connection.executemany(statement, batch)
+                written += len(batch)
+
+    @staticmethod
+    def _auction_rows(pages: Iterable[ActiveAuctionsResponse]) -> Iterator[Tuple[Any, ...]]:
+        for page in pages:
+            snapshot = datetime_to_timestamp(page.lastUpdated)
+            for auction in page.auctions or []:
+                yield _auction_row(auction, snapshot)
+
+
+def _auction_row(auction: AuctionsDetails, snapshot: int) -> Tuple[Any, ...]:
+    return (
+        auction.uuid, auction.auctioneer, auction.profile_id, datetime_to_timestamp(auction.start), datetime_to_timestamp(auction.end),
+        auction.item_name, auction.tier, auction.starting_bid, auction.highest_bid_amount, len(auction.bids or ()),
+        auction.bin, auction.claimed, auction.extra, auction.item_lore, auction.item_bytes, snapshot
+    )
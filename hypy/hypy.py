@@ -1,11 +1,8 @@
-import json
+import threading
 import httpx
 from pydantic import BaseModel, ValidationError
 from typing import Type, TypeVar, Optional, Any, Dict
 from hypy.exceptions import (
-    HypixelAPIError,
-    HypixelRequestError,
-    HypixelHTTPError,
     HypixelRateLimitError,
     HypixelForbiddenError,
     HypixelNotFoundError,
@@ -13,7 +10,9 @@ from hypy.exceptions import (
     HypixelInvalidResponseError,
     HypixelBadRequestError,
     HypixelUnprocessableEntityError,
-    HypixelServiceUnavailableError
+    HypixelServiceUnavailableError,
+    HypixelHTTPError,
+    translate_errors
 )
 from hypy.modals import (
     BazaarResponse,
@@ -33,12 +32,26 @@ from hypy.modals import (
     ActiveAuctionsResponse,
     RecentlyEndedAuctionsResponse
 )
+from hypy.levels import LevelTables
+from hypy.catalog import ItemCatalog
+from hypy.shared_cache import SharedResponseCache, cached_response
+from hypy.player_cache import PlayerCache
+from hypy.revalidate import StaleWhileRevalidate
+from hypy.replay import ResponseArchive
 
 T = TypeVar('T', bound=BaseModel)
 
 class Hypy:
     URL = "https://api.hypixel.net/v2/"
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, shared_cache: Optional[SharedResponseCache] = None, player_cache: Optional[PlayerCache] = None,
+                 revalidate: Optional[StaleWhileRevalidate] = None, archive: Optional[ResponseArchive] = None):
+        """
+        :param api_key: Hypixel API key
+        :param shared_cache: SharedResponseCache letting processes on the same host share downloaded payloads.
+        :param player_cache: PlayerCache keeping recently fetched player data in memory.
+        :param revalidate: StaleWhileRevalidate serving ``bazaar()`` and ``active_auctions(0)`` from memory while they are refreshed in the background.
+        :param archive: ResponseArchive recording every response, or replaying recorded responses instead of sending requests.
+        """
         if not api_key:
             raise ValueError("API key is required")
         self.api_key = api_key
@@ -46,50 +59,123 @@ class Hypy:
         self.headers = {
             "API-Key": self.api_key
         }
+        self.shared_cache = shared_cache
+        self.player_cache = player_cache
+        self.revalidate = revalidate
+        self.archive = archive
+        self._level_tables: Optional[LevelTables] = None
+        self._item_catalog = ItemCatalog()
 
     def close(self):
         self._client.close()
 
     def _make_request(self, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> T | Dict[str, Any]:
-        full_url = self.URL + endpoint.lstrip("/")
-        current_headers = self.headers if requires_auth else None
+        revalidate = self.revalidate
+        if revalidate is not None:
+            key = revalidate.key(endpoint, params)
+            if key is not None:
+                return self._revalidating_request(key, endpoint, model, params, requires_auth)
+        cache = self.player_cache
+        # Only validated models are cached, raw dicts are the caller's to modify.
+        key = cache.key(endpoint, params) if cache is not None and model is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        with translate_errors():
+            try:
+                response = self._fetch(endpoint, params=params, requires_auth=requires_auth)
+            except PlayerCache.NEGATIVE_ERRORS as e:
+                if key is not None:
+                    cache.put_error(key, e)
+                raise
+            result = self._decode(response, model)
+        if key is not None:
+            cache.put(key, result, len(response.content))
+        return result
+
+    def _load(self, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool) -> T | Dict[str, Any]:
+        with translate_errors():
+            response = self._fetch(endpoint, params=params, requires_auth=requires_auth)
+            return self._decode(response, model)
+
+    def _revalidating_request(self, key: Any, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool) -> T | Dict[str, Any]:
+        revalidate = self.revalidate
+        entry = revalidate.get(key)
+        while entry is None:
+            if revalidate.begin_refresh(key):
+                return self._refresh(key, endpoint, model, params, requires_auth, raise_errors=True)
+            # Another thread is loading the same response, wait for it instead of sending the same request.
+            revalidate.wait_refresh(key)
+            entry = revalidate.get(key)
+            error = revalidate.error(key)
+            if entry is None and error is not None:
+                raise error
+        if not revalidate.is_fresh(entry) and revalidate.begin_refresh(key):
+            threading.Thread(target=self._refresh, args=(key, endpoint, model, params, requires_auth), daemon=True).start()
+        return entry.value
+
+    def _refresh(self, key: Any, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool, raise_errors: bool = False) -> Optional[T | Dict[str, Any]]:
+        revalidate = self.revalidate
         try:
-            response = self._client.get(full_url, params=params, headers=current_headers)
-            if response.status_code == 400:
-                raise HypixelBadRequestError(response)
-            if response.status_code == 422:
-                raise HypixelUnprocessableEntityError(response)
-            if response.status_code == 429:
-                raise HypixelRateLimitError(response)
-            if response.status_code == 403:
-                raise HypixelForbiddenError(response)
-            if response.status_code == 404:
-                raise HypixelNotFoundError(response)
-            if response.status_code == 503:
-                raise HypixelServiceUnavailableError(response)
-            response.raise_for_status()
-            data = response.json()
-            if not data.get("success"):
-                cause = data.get("cause", "Unknown error")
-                raise HypixelInvalidResponseError(f"API request was not successful: {cause}")
-            if model:
-                try:
-                    return model.model_validate(data)
-                except ValidationError as e:
-                    raise HypixelValidationError(model, e) from e
-            else:
-                return data
-
-        except httpx.RequestError as e:
-            raise HypixelRequestError(e) from e
-        except httpx.HTTPStatusError as e:
-            raise HypixelHTTPError(e.response) from e
-        except json.JSONDecodeError as e:
-            raise HypixelInvalidResponseError(f"Failed to decode JSON response: {e}") from e
-        except HypixelAPIError:
-            raise
+            result = self._load(endpoint, model, params, requires_auth)
+            revalidate.put(key, result)
+            return result
         except Exception as e:
-            raise HypixelAPIError(f"An unexpected error occurred: {e}") from e
+            revalidate.fail(key, e)
+            if raise_errors:
+                raise
+        finally:
+            revalidate.end_refresh(key)
+
+    def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        archive = self.archive
+        if archive is not None and archive.replaying:
+            return self._check(archive.replay(self.URL + endpoint.lstrip("/"), endpoint, params))
+        cache = self.shared_cache
+        if cache is None or cache.ttl(endpoint) is None:
+            return self._get(endpoint, params=params, requires_auth=requires_auth)
+        content = cache.fetch(endpoint, params, lambda: self._get(endpoint, params=params, requires_auth=requires_auth).content)
+        return cached_response(self.URL + endpoint.lstrip("/"), content)
+
+    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        full_url = self.URL + endpoint.lstrip("/")
+        current_headers = self.headers if requires_auth else None
+        response = self._client.get(full_url, params=params, headers=current_headers)
+        if self.archive is not None:
+            self.archive.record(endpoint, params, response)
+        return self._check(response)
+
+    def _check(self, response: httpx.Response) -> httpx.Response:
+        if response.status_code == 400:
+            raise HypixelBadRequestError(response)
+        if response.status_code == 422:
+            raise HypixelUnprocessableEntityError(response)
+        if response.status_code == 429:
+            raise HypixelRateLimitError(response)
+        if response.status_code == 403:
+            raise HypixelForbiddenError(response)
+        if response.status_code == 404:
+            raise HypixelNotFoundError(response)
+        if response.status_code == 503:
+            raise HypixelServiceUnavailableError(response)
+        if response.status_code >= 500:
+            raise HypixelHTTPError(response)
+        response.raise_for_status()
+        return response
+
+    def _decode(self, response: httpx.Response, model: Optional[Type[T]]) -> T | Dict[str, Any]:
+        data = response.json()
+        if not data.get("success"):
+            cause = data.get("cause", "Unknown error")
+            raise HypixelInvalidResponseError(f"API request was not successful: {cause}")
+        if model:
+            try:
+                return model.model_validate(data)
+            except ValidationError as e:
+                raise HypixelValidationError(model, e) from e
+        else:
+            return data
 
     def bazaar(self) -> BazaarResponse:
         """
@@ -111,21 +197,23 @@ class Hypy:
         """
         return self._make_request(endpoint="skyblock/bazaar", model=BazaarResponse, requires_auth=False)
 
-    def profile(self, profile_uuid: str) -> ProfileResponse:
+    def profile(self, profile_uuid: str, raw: bool = False) -> ProfileResponse | Dict[str, Any]:
         """
         SkyBlock profile data, such as stats, objectives etc. The data returned can differ depending on the players in-game API settings.
         :param profile_uuid:
+        :param raw: Return the response dict as sent by the API, including fields the models don't declare (default is False).
         :return: ProfileResponse
         """
-        return self._make_request(endpoint="skyblock/profile", model=ProfileResponse, requires_auth=True, params={"profile": profile_uuid})
+        return self._make_request(endpoint="skyblock/profile", model=None if raw else ProfileResponse, requires_auth=True, params={"profile": profile_uuid})
 
-    def profiles(self, player_uuid: str):
+    def profiles(self, player_uuid: str, raw: bool = False):
         """
         SkyBlock profile data, such as stats, objectives etc. The data returned can differ depending on the players in-game API settings.
         :param player_uuid:
+        :param raw: Return the response dict as sent by the API, including fields the models don't declare (default is False).
         :return: ProfilesResponse
         """
-        return self._make_request(endpoint="skyblock/profiles", model=ProfilesResponse, requires_auth=True, params={"uuid": player_uuid})
+        return self._make_request(endpoint="skyblock/profiles", model=None if raw else ProfilesResponse, requires_auth=True, params={"uuid": player_uuid})
 
     def museum(self, profile_uuid: str):
         """
@@ -175,6 +263,21 @@ class Hypy:
         """
         return self._make_request(endpoint="resources/skyblock/skills", model=SkillsResponse, requires_auth=False)
 
+    def level_tables(self, refresh: bool = False) -> LevelTables:
+        """
+        Returns bisect-ready XP-to-level and amount-to-tier lookup tables for every skill and collection.\n
+        The tables are built on the first call and cached on the client. With ``refresh`` the resources are fetched again,
+        and the tables are only rebuilt if their ``lastUpdated`` changed.\n
+        **Doesn't require an API key.**
+        :param refresh: Fetch the skills and collections resources again (default is False).
+        :return: LevelTables
+        """
+        if self._level_tables is None or refresh:
+            skills, collections = self.skills(), self.collections()
+            if self._level_tables is None or self._level_tables.version != LevelTables.version_of(skills, collections):
+                self._level_tables = LevelTables.from_responses(skills, collections)
+        return self._level_tables
+
     def items(self):
         """
         Information regarding items in the SkyBlock game.\n
@@ -183,6 +286,19 @@ class Hypy:
         """
         return self._make_request(endpoint="resources/skyblock/items", model=ItemsResponse, requires_auth=False)
 
+    def item_catalog(self, refresh: bool = False) -> ItemCatalog:
+        """
+        Returns an indexed catalog of every SkyBlock item, with lookups by ID, name prefix, tier and material.\n
+        The catalog is fetched on the first call and cached on the client. With ``refresh`` the items resource is fetched again,
+        and the indexes are only rebuilt if its ``lastUpdated`` changed.\n
+        **Doesn't require an API key.**
+        :param refresh: Fetch the items resource again (default is False).
+        :return: ItemCatalog
+        """
+        if not self._item_catalog or refresh:
+            self._item_catalog.update(self.items())
+        return self._item_catalog
+
     def elections(self):
         """
         Information regarding the current mayor and ongoing election in SkyBlock.\n
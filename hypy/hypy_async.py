@@ -1,11 +1,12 @@
 import json
+import time
+import asyncio
 import httpx
+from collections import OrderedDict
+from concurrent.futures import Executor
 from pydantic import BaseModel, ValidationError
-from typing import Type, TypeVar, Optional, Any, Dict
+from typing import Type, TypeVar, Optional, Any, Dict, List, Tuple, AsyncIterator
 from hypy.exceptions import (
-    HypixelAPIError,
-    HypixelRequestError,
-    HypixelHTTPError,
     HypixelRateLimitError,
     HypixelForbiddenError,
     HypixelNotFoundError,
@@ -13,7 +14,10 @@ from hypy.exceptions import (
     HypixelInvalidResponseError,
     HypixelBadRequestError,
     HypixelUnprocessableEntityError,
-    HypixelServiceUnavailableError
+    HypixelServiceUnavailableError,
+    HypixelHTTPError,
+    HypixelDeadlineExceededError,
+    translate_errors
 )
 from hypy.modals import (
     BazaarResponse,
@@ -31,14 +35,62 @@ from hypy.modals import (
     NewsResponse,
     RequestAuctionsResponse,
     ActiveAuctionsResponse,
-    RecentlyEndedAuctionsResponse
+    RecentlyEndedAuctionsResponse,
+    RecentlyAuctionsDetails,
+    datetime_to_timestamp
 )
+from hypy.levels import LevelTables
+from hypy.catalog import ItemCatalog
+from hypy.auctions import AuctionTable, auction_rows
+from hypy.resilience import AdaptiveConcurrency, CircuitBreaker, HedgePolicy, current_deadline, deadline, remaining_time, is_overload, is_outage, is_transient
+from hypy.scheduler import PriorityScheduler
+from hypy.shared_cache import SharedResponseCache, cached_response
+from hypy.player_cache import PlayerCache
+from hypy.revalidate import StaleWhileRevalidate
+from hypy.replay import ResponseArchive
 
 T = TypeVar('T', bound=BaseModel)
 
+def _decode_payload(content: bytes, model: Optional[Type[T]]) -> T | Dict[str, Any]:
+    data = json.loads(content)
+    if model is None or not isinstance(data, dict) or not data.get("success"):
+        return data
+    try:
+        return model.model_validate(data)
+    except ValidationError:
+        # Returned as plain data so the caller re-validates and raises HypixelValidationError, which can't be pickled back from a process pool.
+        return data
+
+def _decode_auction_rows(content: bytes) -> Optional[Tuple[Optional[int], Optional[int], Optional[str], List[Tuple[Any, ...]]]]:
+    page = _decode_payload(content, ActiveAuctionsResponse)
+    if not isinstance(page, ActiveAuctionsResponse):
+        # The caller decodes the page again on the event loop to raise the usual error.
+        return None
+    return page.total_pages, page.totalAuctions, page.lastUpdated, auction_rows(page)
+
 class HypyAsync:
     URL = "https://api.hypixel.net/v2/"
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, executor: Optional[Executor] = None, offload_threshold: int = 64 * 1024,
+                 concurrency: Optional[AdaptiveConcurrency] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+                 scheduler: Optional[PriorityScheduler] = None, shared_cache: Optional[SharedResponseCache] = None,
+                 max_retries: int = 0, retry_backoff: float = 0.5, hedge: Optional[HedgePolicy] = None,
+                 player_cache: Optional[PlayerCache] = None, revalidate: Optional[StaleWhileRevalidate] = None,
+                 archive: Optional[ResponseArchive] = None):
+        """
+        :param api_key: Hypixel API key
+        :param executor: Thread or process pool used to decode and validate large payloads off the event loop.
+        :param offload_threshold: Payload size in bytes from which decoding is offloaded to ``executor`` (default is 64 KiB).
+        :param concurrency: AdaptiveConcurrency limiting the number of requests in flight.
+        :param circuit_breaker: CircuitBreaker failing requests fast while the API is down.
+        :param scheduler: PriorityScheduler sharing the key's rate budget between priority classes.
+        :param shared_cache: SharedResponseCache letting processes on the same host share downloaded payloads.
+        :param max_retries: Number of times a request failing with a 429, 5xx or connection error is retried (default is 0).
+        :param retry_backoff: Delay in seconds before the first retry, doubled for every following one (default is 0.5).
+        :param hedge: HedgePolicy sending a second copy of requests that are slower than usual.
+        :param player_cache: PlayerCache keeping recently fetched player data in memory.
+        :param revalidate: StaleWhileRevalidate serving ``bazaar()`` and ``active_auctions(0)`` from memory while they are refreshed in the background.
+        :param archive: ResponseArchive recording every response, or replaying recorded responses instead of sending requests.
+        """
         if not api_key:
             raise ValueError("API key is required")
         self.api_key = api_key
@@ -46,50 +98,259 @@ class HypyAsync:
         self.headers = {
             "API-Key": self.api_key
         }
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.concurrency = concurrency
+        self.circuit_breaker = circuit_breaker
+        self.scheduler = scheduler
+        self.shared_cache = shared_cache
+        self.player_cache = player_cache
+        self.revalidate = revalidate
+        self.archive = archive
+        self._refreshes: Dict[Any, asyncio.Task] = {}
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.hedge = hedge
+        self._level_tables: Optional[LevelTables] = None
+        self._item_catalog = ItemCatalog()
 
     async def close(self):
+        for task in self._refreshes.values():
+            task.cancel()
         await self._client.aclose()
 
+    def priority(self, name: str):
+        """
+        Context manager running the requests made inside it with the given priority class of the client's scheduler.\n
+        ``with client.priority("background"): await client.profiles(uuid)``
+        :param name: Priority class
+        """
+        if self.scheduler is None:
+            raise ValueError("Client was created without a scheduler")
+        return self.scheduler.priority(name)
+
+    def deadline(self, seconds: float):
+        """
+        Context manager giving the requests made inside it at most ``seconds`` in total, retries and hedges included.
+        Requests still running when it expires raise HypixelDeadlineExceededError.\n
+        ``with client.deadline(1.5): await client.profile(profile_id)``
+        :param seconds: Time budget in seconds
+        """
+        return deadline(seconds)
+
     async def _make_request(self, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> T | Dict[str, Any]:
-        full_url = self.URL + endpoint.lstrip("/")
-        current_headers = self.headers if requires_auth else None
-        try:
-            response = await self._client.get(full_url, params=params, headers=current_headers)
-            if response.status_code == 400:
-                raise HypixelBadRequestError(response)
-            if response.status_code == 422:
-                raise HypixelUnprocessableEntityError(response)
-            if response.status_code == 429:
-                raise HypixelRateLimitError(response)
-            if response.status_code == 403:
-                raise HypixelForbiddenError(response)
-            if response.status_code == 404:
-                raise HypixelNotFoundError(response)
-            if response.status_code == 503:
-                raise HypixelServiceUnavailableError(response)
-            response.raise_for_status()
-            data = response.json()
-            if not data.get("success"):
-                cause = data.get("cause", "Unknown error")
-                raise HypixelInvalidResponseError(f"API request was not successful: {cause}")
-            if model:
-                try:
-                    return model.model_validate(data)
-                except ValidationError as e:
-                    raise HypixelValidationError(model, e) from e
-            else:
-                return data
+        revalidate = self.revalidate
+        if revalidate is not None:
+            key = revalidate.key(endpoint, params)
+            if key is not None:
+                return await self._revalidating_request(key, endpoint, model, params, requires_auth)
+        cache = self.player_cache
+        # Only validated models are cached, raw dicts are the caller's to modify.
+        key = cache.key(endpoint, params) if cache is not None and model is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        with translate_errors():
+            try:
+                response = await self._fetch(endpoint, params=params, requires_auth=requires_auth)
+            except PlayerCache.NEGATIVE_ERRORS as e:
+                if key is not None:
+                    cache.put_error(key, e)
+                raise
+            result = await self._decode(response, model)
+        if key is not None:
+            cache.put(key, result, len(response.content))
+        return result
 
-        except httpx.RequestError as e:
-            raise HypixelRequestError(e) from e
-        except httpx.HTTPStatusError as e:
-            raise HypixelHTTPError(e.response) from e
-        except json.JSONDecodeError as e:
-            raise HypixelInvalidResponseError(f"Failed to decode JSON response: {e}") from e
-        except HypixelAPIError:
+    async def _load(self, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool) -> T | Dict[str, Any]:
+        with translate_errors():
+            response = await self._fetch(endpoint, params=params, requires_auth=requires_auth)
+            return await self._decode(response, model)
+
+    async def _revalidating_request(self, key: Any, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool) -> T | Dict[str, Any]:
+        revalidate = self.revalidate
+        entry = revalidate.get(key)
+        if entry is not None and revalidate.is_fresh(entry):
+            return entry.value
+        refresh = self._refreshes.get(key)
+        if refresh is None and revalidate.begin_refresh(key):
+            refresh = self._refreshes[key] = asyncio.create_task(self._refresh(key, endpoint, model, params, requires_auth, background=entry is not None))
+            refresh.add_done_callback(lambda task: self._refresh_done(key, task))
+        if entry is not None:
+            return entry.value
+        if refresh is None:
+            # Another client sharing the StaleWhileRevalidate is loading it.
+            return await self._load(endpoint, model, params, requires_auth)
+        # Every caller without a response to serve waits for the same request, shielded so one caller giving up doesn't cancel it for the others.
+        return await asyncio.shield(refresh)
+
+    async def _refresh(self, key: Any, endpoint: str, model: Optional[Type[T]], params: Optional[Dict[str, Any]], requires_auth: bool, background: bool) -> T | Dict[str, Any]:
+        if background:
+            # The refresh outlives the request that started it, so it must not inherit its deadline.
+            current_deadline.set(None)
+        revalidate = self.revalidate
+        try:
+            result = await self._load(endpoint, model, params, requires_auth)
+            revalidate.put(key, result)
+            return result
+        except Exception as e:
+            revalidate.fail(key, e)
             raise
+        finally:
+            revalidate.end_refresh(key)
+
+    def _refresh_done(self, key: Any, task: asyncio.Task):
+        self._refreshes.pop(key, None)
+        if not task.cancelled():
+            # Background refresh errors are kept in StaleWhileRevalidate, retrieving them silences asyncio's warning.
+            task.exception()
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        archive = self.archive
+        if archive is not None and archive.replaying:
+            return self._check(await archive.replay_async(self.URL + endpoint.lstrip("/"), endpoint, params))
+        cache = self.shared_cache
+        if cache is None or cache.ttl(endpoint) is None:
+            return await self._send(endpoint, params=params, requires_auth=requires_auth)
+
+        async def load() -> bytes:
+            return (await self._send(endpoint, params=params, requires_auth=requires_auth)).content
+
+        content = await cache.fetch_async(endpoint, params, load)
+        return cached_response(self.URL + endpoint.lstrip("/"), content)
+
+    async def _send(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        retries = 0
+        while True:
+            try:
+                return await self._attempt(endpoint, params, requires_auth)
+            except HypixelDeadlineExceededError:
+                raise
+            except Exception as e:
+                if retries >= self.max_retries or not (is_overload(e) or is_outage(e)):
+                    raise
+                backoff = self.retry_backoff * 2 ** retries
+                remaining = remaining_time()
+                if remaining is not None and remaining <= backoff:
+                    raise
+                retries += 1
+                await asyncio.sleep(backoff)
+
+    async def _attempt(self, endpoint: str, params: Optional[Dict[str, Any]], requires_auth: bool) -> httpx.Response:
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise HypixelDeadlineExceededError(endpoint)
+        if self.hedge is None:
+            request = self._send_once(endpoint, params=params, requires_auth=requires_auth)
+        else:
+            request = self._hedged(endpoint, params, requires_auth)
+        if remaining is None:
+            return await request
+        try:
+            return await asyncio.wait_for(request, remaining)
+        except asyncio.TimeoutError:
+            raise HypixelDeadlineExceededError(endpoint) from None
+
+    async def _hedged(self, endpoint: str, params: Optional[Dict[str, Any]], requires_auth: bool) -> httpx.Response:
+        hedge = self.hedge
+        delay = hedge.delay(endpoint)
+        started: Dict[asyncio.Task, float] = {}
+
+        def start():
+            task = asyncio.ensure_future(self._send_once(endpoint, params=params, requires_auth=requires_auth))
+            started[task] = time.monotonic()
+
+        start()
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(started, timeout=delay)
+                if not done and hedge.try_hedge():
+                    start()
+            while True:
+                done, _ = await asyncio.wait(started, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        hedge.observe(endpoint, time.monotonic() - started.pop(task))
+                        return task.result()
+                    del started[task]
+                if not started:
+                    raise error
+        finally:
+            for task in started:
+                task.cancel()
+
+    async def _send_once(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        if self.scheduler is not None:
+            await self.scheduler.acquire()
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request()
+        try:
+            if self.concurrency is None:
+                response = await self._get(endpoint, params=params, requires_auth=requires_auth)
+            else:
+                async with self.concurrency.slot():
+                    response = await self._get(endpoint, params=params, requires_auth=requires_auth)
         except Exception as e:
-            raise HypixelAPIError(f"An unexpected error occurred: {e}") from e
+            if breaker is not None:
+                breaker.record(e)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+        if breaker is not None:
+            breaker.record()
+        return response
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, requires_auth: bool = True) -> httpx.Response:
+        full_url = self.URL + endpoint.lstrip("/")
+        current_headers = self.headers if requires_auth else None
+        response = await self._client.get(full_url, params=params, headers=current_headers)
+        if self.archive is not None:
+            await self.archive.record_async(endpoint, params, response)
+        return self._check(response)
+
+    def _check(self, response: httpx.Response) -> httpx.Response:
+        if response.status_code == 400:
+            raise HypixelBadRequestError(response)
+        if response.status_code == 422:
+            raise HypixelUnprocessableEntityError(response)
+        if response.status_code == 429:
+            raise HypixelRateLimitError(response)
+        if response.status_code == 403:
+            raise HypixelForbiddenError(response)
+        if response.status_code == 404:
+            raise HypixelNotFoundError(response)
+        if response.status_code == 503:
+            raise HypixelServiceUnavailableError(response)
+        if response.status_code >= 500:
+            raise HypixelHTTPError(response)
+        response.raise_for_status()
+        return response
+
+    async def _decode(self, response: httpx.Response, model: Optional[Type[T]], executor: Optional[Executor] = None, offload_threshold: Optional[int] = None) -> T | Dict[str, Any]:
+        executor = executor or self.executor
+        offload_threshold = self.offload_threshold if offload_threshold is None else offload_threshold
+        if executor is not None and len(response.content) >= offload_threshold:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(executor, _decode_payload, response.content, model)
+            if isinstance(data, BaseModel):
+                return data
+        else:
+            data = response.json()
+        if not data.get("success"):
+            cause = data.get("cause", "Unknown error")
+            raise HypixelInvalidResponseError(f"API request was not successful: {cause}")
+        if model:
+            try:
+                return model.model_validate(data)
+            except ValidationError as e:
+                raise HypixelValidationError(model, e) from e
+        else:
+            return data
 
     async def bazaar(self) -> BazaarResponse:
         """
@@ -111,21 +372,23 @@ class HypyAsync:
         """
         return await self._make_request(endpoint="skyblock/bazaar", model=BazaarResponse, requires_auth=False)
 
-    async def profile(self, profile_uuid: str) -> ProfileResponse:
+    async def profile(self, profile_uuid: str, raw: bool = False) -> ProfileResponse | Dict[str, Any]:
         """
         SkyBlock profile data, such as stats, objectives etc. The data returned can differ depending on the players in-game API settings.
         :param profile_uuid:
+        :param raw: Return the response dict as sent by the API, including fields the models don't declare (default is False).
         :return: ProfileResponse
         """
-        return await self._make_request(endpoint="skyblock/profile", model=ProfileResponse, requires_auth=True, params={"profile": profile_uuid})
+        return await self._make_request(endpoint="skyblock/profile", model=None if raw else ProfileResponse, requires_auth=True, params={"profile": profile_uuid})
 
-    async def profiles(self, player_uuid: str):
+    async def profiles(self, player_uuid: str, raw: bool = False):
         """
         SkyBlock profile data, such as stats, objectives etc. The data returned can differ depending on the players in-game API settings.
         :param player_uuid:
+        :param raw: Return the response dict as sent by the API, including fields the models don't declare (default is False).
         :return: ProfilesResponse
         """
-        return await self._make_request(endpoint="skyblock/profiles", model=ProfilesResponse, requires_auth=True, params={"uuid": player_uuid})
+        return await self._make_request(endpoint="skyblock/profiles", model=None if raw else ProfilesResponse, requires_auth=True, params={"uuid": player_uuid})
 
     async def museum(self, profile_uuid: str):
         """
@@ -175,6 +438,21 @@ class HypyAsync:
         """
         return await self._make_request(endpoint="resources/skyblock/skills", model=SkillsResponse, requires_auth=False)
 
+    async def level_tables(self, refresh: bool = False) -> LevelTables:
+        """
+        Returns bisect-ready XP-to-level and amount-to-tier lookup tables for every skill and collection.\n
+        The tables are built on the first call and cached on the client. With ``refresh`` the resources are fetched again,
+        and the tables are only rebuilt if their ``lastUpdated`` changed.\n
+        **Doesn't require an API key.**
+        :param refresh: Fetch the skills and collections resources again (default is False).
+        :return: LevelTables
+        """
+        if self._level_tables is None or refresh:
+            skills, collections = await asyncio.gather(self.skills(), self.collections())
+            if self._level_tables is None or self._level_tables.version != LevelTables.version_of(skills, collections):
+                self._level_tables = LevelTables.from_responses(skills, collections)
+        return self._level_tables
+
     async def items(self):
         """
         Information regarding items in the SkyBlock game.\n
@@ -183,6 +461,19 @@ class HypyAsync:
         """
         return await self._make_request(endpoint="resources/skyblock/items", model=ItemsResponse, requires_auth=False)
 
+    async def item_catalog(self, refresh: bool = False) -> ItemCatalog:
+        """
+        Returns an indexed catalog of every SkyBlock item, with lookups by ID, name prefix, tier and material.\n
+        The catalog is fetched on the first call and cached on the client. With ``refresh`` the items resource is fetched again,
+        and the indexes are only rebuilt if its ``lastUpdated`` changed.\n
+        **Doesn't require an API key.**
+        :param refresh: Fetch the items resource again (default is False).
+        :return: ItemCatalog
+        """
+        if not self._item_catalog or refresh:
+            self._item_catalog.update(await self.items())
+        return self._item_catalog
+
     async def elections(self):
         """
         Information regarding the current mayor and ongoing election in SkyBlock.\n
@@ -232,6 +523,69 @@ class HypyAsync:
         """
         return await self._make_request(endpoint="skyblock/auctions", model=ActiveAuctionsResponse, requires_auth=False, params={"page": page})
 
+    async def iter_active_auctions(self, concurrency: int = 8) -> AsyncIterator[ActiveAuctionsResponse]:
+        """
+        Yields every page of the active auctions as soon as it is downloaded.\n
+        The first page is fetched to learn ``total_pages``, the remaining pages are fetched concurrently
+        and yielded in completion order, so consumers such as ``AuctionDiffer`` can start working before the sweep ends.
+        The first page is always downloaded, never served stale by ``revalidate``, so every page belongs to the same snapshot.\n
+        **Doesn't require an API key.**
+        :param concurrency: Maximum number of pages downloaded at once (default is 8).
+        :return: AsyncIterator[ActiveAuctionsResponse]
+        """
+        first = await self._load("skyblock/auctions", ActiveAuctionsResponse, {"page": 0}, requires_auth=False)
+        yield first
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> ActiveAuctionsResponse:
+            async with semaphore:
+                return await self.active_auctions(page)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(1, first.total_pages or 1)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def sweep_auctions(self, executor: Optional[Executor] = None, concurrency: int = 8) -> AuctionTable:
+        """
+        Downloads every page of the active auctions and merges them into a single AuctionTable.\n
+        Pages are downloaded concurrently and each page is handed to ``executor`` as soon as it arrives, where it is
+        decoded, validated and flattened into plain tuples. With a ``ProcessPoolExecutor`` this runs on every core
+        instead of the event loop's, and only the tuples are pickled back, so the merge in the parent stays cheap.
+        Use ``AuctionTable.to_response()`` where an ActiveAuctionsResponse is needed.\n
+        **Doesn't require an API key.**
+        :param executor: Pool used to decode pages, defaults to the client's executor. Pages are decoded on the event loop if neither is set.
+        :param concurrency: Maximum number of pages downloaded at once (default is 8).
+        :return: AuctionTable containing the auctions of every page
+        """
+        executor = executor or self.executor
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def load(page: int) -> Tuple[Optional[int], Optional[int], Optional[str], List[Tuple[Any, ...]]]:
+            async with semaphore:
+                response = await self._fetch("skyblock/auctions", params={"page": page}, requires_auth=False)
+            if executor is not None:
+                result = await loop.run_in_executor(executor, _decode_auction_rows, response.content)
+            else:
+                result = _decode_auction_rows(response.content)
+            if result is None:
+                # Decoded on the event loop, raises HypixelInvalidResponseError or HypixelValidationError.
+                decoded = await self._decode(response, ActiveAuctionsResponse, offload_threshold=len(response.content) + 1)
+                result = decoded.total_pages, decoded.totalAuctions, decoded.lastUpdated, auction_rows(decoded)
+            return result
+
+        with translate_errors():
+            first = await load(0)
+            rest = await asyncio.gather(*(load(page) for page in range(1, first[0] or 1)))
+        rows = list(first[3])
+        for page in rest:
+            rows.extend(page[3])
+        return AuctionTable(rows, total_pages=first[0], totalAuctions=first[1], lastUpdated=first[2])
+
     async def recently_ended_auction(self):
         """
         SkyBlock auctions which ended in the last 60 seconds.
@@ -239,3 +593,50 @@ class HypyAsync:
         :return: RecentlyEndedAuctionResponse
         """
         return await self._make_request(endpoint="skyblock/auctions_ended", model=RecentlyEndedAuctionsResponse, requires_auth=False)
+
+    async def tail_ended_auctions(self, poll_interval: float = 60.0, retry_interval: float = 5.0, seen_ttl: float = 180.0, max_seen: int = 10000) -> AsyncIterator[RecentlyAuctionsDetails]:
+        """
+        Continuously yields auctions that ended, each exactly once.\n
+        The ended auctions endpoint is polled in step with its ``lastUpdated`` field, so a new request is only made
+        once the next refresh is due. Auctions already yielded are remembered by ``auction_id`` in a bounded set whose
+        entries expire after ``seen_ttl`` seconds, which is enough to cover the overlap between consecutive 60 second windows.
+        Polling only happens when the consumer asks for the next item, so a slow consumer never builds up a backlog.
+        Transient errors (429, 5xx, connection errors, timeouts) don't end the tail: polling is retried after
+        ``retry_interval`` seconds, doubled on every consecutive failure up to ``poll_interval``.\n
+        **Doesn't require an API key.**
+        :param poll_interval: Seconds between two refreshes of the endpoint on Hypixel's side (default is 60).
+        :param retry_interval: Seconds to wait before polling again when the data has not been refreshed yet (default is 5).
+        :param seen_ttl: Seconds an auction ID is remembered for deduplication (default is 180).
+        :param max_seen: Maximum number of auction IDs remembered at once (default is 10000).
+        :return: AsyncIterator[RecentlyAuctionsDetails]
+        """
+        seen: OrderedDict[str, float] = OrderedDict()
+        last_updated = None
+        failures = 0
+        while True:
+            try:
+                response = await self.recently_ended_auction()
+            except Exception as e:
+                if not is_transient(e):
+                    raise
+                failures += 1
+                delay = min(retry_interval * 2 ** (failures - 1), max(poll_interval, retry_interval))
+                await asyncio.sleep(max(delay, getattr(e, "retry_after", 0)))
+                continue
+            failures = 0
+            now = time.monotonic()
+            while seen and next(iter(seen.values())) <= now:
+                seen.popitem(last=False)
+            for auction in response.auctions or []:
+                if auction.auction_id in seen:
+                    continue
+                seen[auction.auction_id] = now + seen_ttl
+                if len(seen) > max_seen:
+                    seen.popitem(last=False)
+                yield auction
+            updated = datetime_to_timestamp(response.lastUpdated)
+            delay = retry_interval
+            if updated is not None and updated != last_updated:
+                last_updated = updated
+                delay = max(updated / 1000 + poll_interval - time.time(), retry_interval)
+            await asyncio.sleep(delay)
@@ -0,0 +1,132 @@
+from bisect import bisect_right
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from hypy.modals import SkillsResponse, CollectionsResponse
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class LevelTable:
+    """
+    Sorted cumulative thresholds of a single skill or collection, ready for bisecting.\n
+    ``thresholds[i]`` is the total amount required to reach ``levels[i]``.
+    """
+    __slots__ = ("thresholds", "levels", "_by_index", "_arrays")
+
+    def __init__(self, thresholds: Iterable[float], levels: Iterable[int]):
+        pairs = sorted(zip(thresholds, levels))
+        self.thresholds: List[float] = [threshold for threshold, _ in pairs]
+        self.levels: List[int] = [level for _, level in pairs]
+        self._by_index = [0] + self.levels
+        self._arrays = None
+
+    @property
+    def max_level(self) -> int:
+        return self.levels[-1] if self.levels else 0
+
+    def level(self, amount: float) -> int:
+        """
+        Returns the level reached with the given total amount.
+        :param amount: Total XP or collection amount
+        :return: int
+        """
+        return self._by_index[bisect_right(self.thresholds, amount)]
+
+    def levels_for(self, amounts: Iterable[float]) -> Any:
+        """
+        Maps many amounts to levels at once.\n
+        NumPy arrays are resolved with a single ``searchsorted`` call and a NumPy array is returned,
+        any other iterable is resolved with bisect and a list is returned.
+        :param amounts: Total XP or collection amounts
+        :return: List[int] or numpy.ndarray
+        """
+        if numpy is not None and isinstance(amounts, numpy.ndarray):
+            if self._arrays is None:
+                self._arrays = (numpy.asarray(self.thresholds, dtype=numpy.float64), numpy.asarray(self._by_index, dtype=numpy.int64))
+            thresholds, by_index = self._arrays
+            return by_index[numpy.searchsorted(thresholds, amounts, side="right")]
+        thresholds, by_index = self.thresholds, self._by_index
+        return [by_index[bisect_right(thresholds, amount)] for amount in amounts]
+
+    def progress(self, amount: float) -> Tuple[int, float]:
+        """
+        Returns the level reached and the fraction of the way to the next level.
+        :param amount: Total XP or collection amount
+        :return: Tuple[int, float]
+        """
+        index = bisect_right(self.thresholds, amount)
+        if index >= len(self.thresholds):
+            return self._by_index[index], 1.0
+        floor = self.thresholds[index - 1] if index else 0.0
+        return self._by_index[index], (amount - floor) / (self.thresholds[index] - floor)
+
+
+def skill_tables(response: SkillsResponse) -> Dict[str, LevelTable]:
+    """
+    Builds a LevelTable for every skill of a SkillsResponse.
+    :param response: SkillsResponse
+    :return: Dict[str, LevelTable]
+    """
+    tables = {}
+    for name, skill in (response.skills or {}).items():
+        levels = skill.get("levels") or skill.get("skills") or []
+        tables[name] = LevelTable(
+            (level.get("totalExpRequired") or 0.0 for level in levels),
+            (level.get("level") or 0 for level in levels)
+        )
+    return tables
+
+
+def collection_tables(response: CollectionsResponse) -> Dict[str, LevelTable]:
+    """
+    Builds a LevelTable for every collection item of a CollectionsResponse, keyed by item ID.
+    :param response: CollectionsResponse
+    :return: Dict[str, LevelTable]
+    """
+    tables = {}
+    for category in (response.collections or {}).values():
+        for item_id, item in (category.items or {}).items():
+            tiers = item.tiers or []
+            tables[item_id] = LevelTable(
+                (tier.amountRequired or 0 for tier in tiers),
+                (tier.tier or 0 for tier in tiers)
+            )
+    return tables
+
+
+class LevelTables:
+    """
+    Lookup tables for every skill and collection, built once from SkillsResponse and CollectionsResponse.
+    """
+    def __init__(self, skills: Optional[Dict[str, LevelTable]] = None, collections: Optional[Dict[str, LevelTable]] = None,
+                 version: Tuple[Optional[str], Optional[str]] = (None, None)):
+        self.skills = skills or {}
+        self.collections = collections or {}
+        self.version = version
+
+    @classmethod
+    def from_responses(cls, skills: Optional[SkillsResponse] = None, collections: Optional[CollectionsResponse] = None) -> "LevelTables":
+        return cls(
+            skill_tables(skills) if skills else None,
+            collection_tables(collections) if collections else None,
+            cls.version_of(skills, collections)
+        )
+
+    @staticmethod
+    def version_of(skills: Optional[SkillsResponse], collections: Optional[CollectionsResponse]) -> Tuple[Optional[str], Optional[str]]:
+        return (skills.lastUpdated if skills else None, collections.lastUpdated if collections else None)
+
+    def skill_level(self, skill: str, xp: float) -> int:
+        return self.skills[skill].level(xp)
+
+    def skill_levels(self, skill: str, xps: Iterable[float]) -> Any:
+        return self.skills[skill].levels_for(xps)
+
+    def collection_tier(self, item_id: str, amount: float) -> int:
+        return self.collections[item_id].level(amount)
+
+    def collection_tiers(self, item_id: str, amounts: Iterable[float]) -> Any:
+        return self.collections[item_id].levels_for(amounts)
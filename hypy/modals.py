@@ -13,6 +13,20 @@ def timestamp_to_datetime(timestamp: Optional[int]) -> Optional[str]:
     except (ValueError, OSError) as e:
         raise ValueError(f"Invalid timestamp: {timestamp}") from e
 
+def datetime_to_timestamp(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        dt_obj = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    except ValueError as e:
+        raise ValueError(f"Invalid datetime: {value}") from e
+    return int(dt_obj.timestamp() * 1000)
+
+def unwrap_item_bytes(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get("data")
+    return value
+
 # Bazaar Modals
 
 class SummaryOrder(BaseModel):
@@ -102,6 +116,7 @@ class MembersDetails(BaseModel):
     profile: Optional[Dict[str, Any]] = None
     player_id: Optional[str] = None
     pets_data: Optional[PetsData] = None
+    inventory: Optional[Dict[str, Any]] = None
     class Config:
         extra = "ignore"
         validate_by_name = True
@@ -428,6 +443,8 @@ class AuctionsDetails(BaseModel):
     claimed_bidders: Optional[List[str]] = Field(default_factory=list)
     highest_bid_amount: Optional[int] = None
     bids: Optional[List[RequestAuctionsBids]] = Field(default_factory=list)
+    bin: Optional[bool] = None
+    item_bytes: Annotated[Optional[str], BeforeValidator(unwrap_item_bytes)] = None
 
 class RequestAuctionsResponse(BaseModel):
     success: bool
@@ -441,7 +458,7 @@ class RequestAuctionsResponse(BaseModel):
 class ActiveAuctionsResponse(BaseModel):
     success: bool
     page: Optional[int] = None
-    total_pages: Optional[int] = None
+    total_pages: Optional[int] = Field(alias="totalPages", default=None)
     totalAuctions: Optional[int] = None
     lastUpdated: Annotated[Optional[str], BeforeValidator(timestamp_to_datetime)]
     auctions: Optional[List[AuctionsDetails]] = None
@@ -460,7 +477,7 @@ class RecentlyAuctionsDetails(BaseModel):
     time: Annotated[Optional[str], BeforeValidator(timestamp_to_datetime)] = Field(alias="timestamp")
     price: Optional[int] = None
     bin: Optional[bool] = None
-    item_bytes: Optional[str] = None
+    item_bytes: Annotated[Optional[str], BeforeValidator(unwrap_item_bytes)] = None
 
 class RecentlyEndedAuctionsResponse(BaseModel):
     success: bool
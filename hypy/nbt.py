@@ -0,0 +1,154 @@
+import gzip
+import base64
+import struct
+from typing import Optional, List, Dict, Any
+
+# Minimal reader for the gzip compressed NBT blobs (``item_bytes``, museum and inventory ``data``) returned by the API.
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+_SCALARS = {
+    TAG_BYTE: struct.Struct(">b"),
+    TAG_SHORT: struct.Struct(">h"),
+    TAG_INT: struct.Struct(">i"),
+    TAG_LONG: struct.Struct(">q"),
+    TAG_FLOAT: struct.Struct(">f"),
+    TAG_DOUBLE: struct.Struct(">d"),
+}
+_LENGTH = struct.Struct(">i")
+_STRING_LENGTH = struct.Struct(">H")
+
+
+class _Reader:
+    __slots__ = ("buffer", "offset")
+
+    def __init__(self, buffer: bytes):
+        self.buffer = buffer
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> Any:
+        value = fmt.unpack_from(self.buffer, self.offset)[0]
+        self.offset += fmt.size
+        return value
+
+    def string(self) -> str:
+        length = self.unpack(_STRING_LENGTH)
+        value = self.buffer[self.offset:self.offset + length].decode("utf-8", errors="replace")
+        self.offset += length
+        return value
+
+    def array(self, fmt: str, size: int) -> List[int]:
+        length = self.unpack(_LENGTH)
+        values = struct.unpack_from(f">{length}{fmt}", self.buffer, self.offset)
+        self.offset += length * size
+        return list(values)
+
+    def payload(self, tag: int) -> Any:
+        scalar = _SCALARS.get(tag)
+        if scalar is not None:
+            return self.unpack(scalar)
+        if tag == TAG_STRING:
+            return self.string()
+        if tag == TAG_COMPOUND:
+            compound = {}
+            while True:
+                child = self.unpack(_SCALARS[TAG_BYTE])
+                if child == TAG_END:
+                    return compound
+                name = self.string()
+                compound[name] = self.payload(child)
+        if tag == TAG_LIST:
+            child = self.unpack(_SCALARS[TAG_BYTE])
+            length = self.unpack(_LENGTH)
+            return [self.payload(child) for _ in range(length)]
+        if tag == TAG_BYTE_ARRAY:
+            return self.array("b", 1)
+        if tag == TAG_INT_ARRAY:
+            return self.array("i", 4)
+        if tag == TAG_LONG_ARRAY:
+            return self.array("q", 8)
+        raise ValueError(f"Unknown NBT tag: {tag}")
+
+
+def parse_nbt(raw: bytes) -> Dict[str, Any]:
+    """
+    Parses an uncompressed NBT document into nested dicts and lists.
+    :param raw: Uncompressed NBT bytes
+    :return: Dict[str, Any]
+    """
+    reader = _Reader(raw)
+    try:
+        tag = reader.unpack(_SCALARS[TAG_BYTE])
+        if tag != TAG_COMPOUND:
+            raise ValueError(f"Root tag must be a compound, got {tag}")
+        reader.string()
+        return reader.payload(TAG_COMPOUND)
+    except struct.error as e:
+        raise ValueError(f"Truncated NBT data: {e}") from e
+
+
+def decode_item_bytes(data: str | bytes) -> Dict[str, Any]:
+    """
+    Decodes a base64 encoded, gzip compressed NBT blob such as ``item_bytes``.
+    :param data: Base64 string or raw gzip bytes
+    :return: Dict[str, Any]
+    """
+    raw = base64.b64decode(data) if isinstance(data, str) else data
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return parse_nbt(raw)
+
+
+def item_stacks(data: str | bytes) -> List[Dict[str, Any]]:
+    """
+    Returns the item stacks stored in an encoded item blob. Empty slots are kept as empty dicts so slot indexes line up.
+    :param data: Base64 string or raw gzip bytes
+    :return: List[Dict[str, Any]]
+    """
+    return decode_item_bytes(data).get("i", [])
+
+
+def skyblock_id(stack: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the SkyBlock item ID (``ExtraAttributes.id``) of a decoded item stack.
+    :param stack: Decoded item stack
+    :return: Optional[str]
+    """
+    return stack.get("tag", {}).get("ExtraAttributes", {}).get("id")
+
+
+def stack_count(stack: Dict[str, Any]) -> int:
+    """
+    Returns the amount of items in a decoded item stack.
+    :param stack: Decoded item stack
+    :return: int
+    """
+    return stack.get("Count", 1)
+
+
+def first_item_id(data: Optional[str]) -> Optional[str]:
+    """
+    Returns the SkyBlock item ID of the first stack in an encoded item blob, or None if it can't be decoded.
+    :param data: Base64 string
+    :return: Optional[str]
+    """
+    if not data:
+        return None
+    try:
+        stacks = item_stacks(data)
+    except (ValueError, OSError, EOFError):
+        return None
+    return skyblock_id(stacks[0]) if stacks else None
+
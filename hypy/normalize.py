@@ -0,0 +1,188 @@
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List, Dict, Iterable, Tuple
+
+from hypy.modals import ActiveAuctionsResponse, AuctionsDetails
+from hypy.nbt import item_stacks
+from hypy.valuation import BlobCache, pet_key, stack_key
+
+if TYPE_CHECKING:
+    from hypy.catalog import ItemCatalog
+
+_FORMATTING_CODES = re.compile(r"§.")
+_PET_LEVEL = re.compile(r"^\[Lvl \d+\]\s*")
+_STARS = re.compile(r"[✪⍟➊➋➌➍➎✦]+")
+_NON_WORD = re.compile(r"[^0-9A-Za-z]+")
+_MISSING = object()
+
+REFORGES = frozenset((
+    "Ancient", "Awkward", "Blessed", "Bountiful", "Bulky", "Candied", "Clean", "Deadly", "Demonic", "Epic", "Fabled",
+    "Fair", "Fast", "Fierce", "Fine", "Fleet", "Forceful", "Fruitful", "Gentle", "Giant", "Godly", "Grand", "Hasty",
+    "Heavy", "Heroic", "Hurtful", "Itchy", "Keen", "Legendary", "Light", "Loving", "Magnetic", "Menacing", "Mithraic",
+    "Moil", "Mythic", "Neat", "Necrotic", "Odd", "Perfect", "Pleasant", "Precise", "Pretty", "Pure", "Rapid", "Reinforced",
+    "Renowned", "Rich", "Ridiculous", "Rooted", "Salty", "Shaded", "Sharp", "Shiny", "Silky", "Smart", "Spicy", "Spiked",
+    "Spiritual", "Strange", "Strong", "Submerged", "Superior", "Suspicious", "Titanic", "Treacherous", "Unpleasant",
+    "Unreal", "Unstable", "Very", "Warped", "Waxed", "Wise", "Withered", "Zealous", "Auspicious", "Blazing", "Fortunate",
+    "Glistening", "Jaded", "Lucky", "Lush", "Stellar", "Toil", "Undead", "Jerry's", "Gilded", "Excellent", "Sturdy",
+))
+
+
+def strip_formatting(text: str) -> str:
+    """
+    Removes Minecraft formatting codes (``§a``, ``§l``...) from a text such as ``item_lore``.
+    :param text: Formatted text
+    :return: str
+    """
+    return _FORMATTING_CODES.sub("", text)
+
+
+@lru_cache(maxsize=65536)
+def _clean_name(item_name: str) -> Tuple[str, bool]:
+    name = strip_formatting(item_name)
+    is_pet = _PET_LEVEL.match(name) is not None
+    return _STARS.sub("", _PET_LEVEL.sub("", name)).strip(), is_pet
+
+
+@lru_cache(maxsize=65536)
+def _name_key(name: str) -> str:
+    return _NON_WORD.sub("_", name).strip("_").upper()
+
+
+def base_name(item_name: str, catalog: Optional["ItemCatalog"] = None) -> str:
+    """
+    Strips formatting codes, pet levels and stars from an auction's ``item_name``.\n
+    A leading reforge is only stripped with a ``catalog``, and only if the rest of the name is a known item while the
+    whole name isn't, so items such as ``Undead Sword`` or ``Fine Jade Gemstone`` keep their name.
+    :param item_name: Raw item name
+    :param catalog: ItemCatalog used to tell reforges from item names
+    :return: str
+    """
+    name = _clean_name(item_name)[0]
+    if catalog is not None:
+        reforge, _, rest = name.partition(" ")
+        if rest and reforge in REFORGES and catalog.by_name(rest) and not catalog.by_name(name):
+            return rest
+    return name
+
+
+def canonical_key(item_name: Optional[str], tier: Optional[str] = None,
+                  catalog: Optional["ItemCatalog"] = None) -> Optional[str]:
+    """
+    Returns the grouping key of an item name, e.g. ``HYPERION`` for ``Heroic Hyperion ✪✪✪✪✪`` with a catalog.
+    Pets are keyed by type and rarity like ``pet_key``, e.g. ``PET:ENDER_DRAGON:LEGENDARY`` for ``[Lvl 100] Ender Dragon``.
+    Reforges are only stripped with a ``catalog``, see ``base_name``. Prefer ``auction_key``, which uses the item ID.
+    :param item_name: Raw item name
+    :param tier: Item rarity, only used for pets
+    :param catalog: ItemCatalog used to tell reforges from item names
+    :return: Optional[str]
+    """
+    if not item_name:
+        return None
+    is_pet = _clean_name(item_name)[1]
+    key = _name_key(base_name(item_name, catalog))
+    if not key:
+        return None
+    return pet_key(key, tier) if is_pet else key
+
+
+def item_bytes_key(data: Optional[str], cache: Optional[BlobCache] = None) -> Optional[str]:
+    """
+    Returns the price key (``ExtraAttributes.id``, or the pet key for pets) of the first stack of an encoded item blob,
+    or None if it can't be decoded.
+    :param data: Base64 string
+    :param cache: BlobCache reusing blobs decoded earlier, e.g. by the previous sweep
+    :return: Optional[str]
+    """
+    if not data:
+        return None
+    if cache is not None:
+        items = cache.items(data)
+        return items[0][0] if items else None
+    try:
+        stacks = item_stacks(data)
+    except (ValueError, OSError, EOFError):
+        return None
+    return stack_key(stacks[0]) if stacks and stacks[0] else None
+
+
+def catalog_key(item_name: str, catalog: "ItemCatalog") -> Optional[str]:
+    """
+    Returns the ID of the only catalog item an auction's ``item_name`` can refer to, with or without a leading reforge,
+    or None for pets and for names that are unknown or match several items.
+    :param item_name: Raw item name
+    :param catalog: ItemCatalog
+    :return: Optional[str]
+    """
+    name, is_pet = _clean_name(item_name)
+    if is_pet:
+        return None
+    items = catalog.by_name(name)
+    reforge, _, rest = name.partition(" ")
+    if rest and reforge in REFORGES:
+        items += catalog.by_name(rest)
+    ids = {item.id for item in items}
+    return ids.pop() if len(ids) == 1 else None
+
+
+def auction_key(auction: AuctionsDetails, catalog: Optional["ItemCatalog"] = None,
+                cache: Optional[BlobCache] = None) -> Optional[str]:
+    """
+    Returns the grouping key of an auction: its item ID.\n
+    With a ``catalog`` the ID is looked up by name when the name can only be one item, otherwise it is decoded from
+    ``item_bytes``. Auctions without a decodable item fall back to ``canonical_key`` of their name (or ``extra``).
+    :param auction: Auction
+    :param catalog: ItemCatalog resolving names to item IDs
+    :param cache: BlobCache reusing decoded ``item_bytes``
+    :return: Optional[str]
+    """
+    return canonical_keys((auction,), catalog, cache)[0]
+
+
+def canonical_keys(auctions: Iterable[AuctionsDetails], catalog: Optional["ItemCatalog"] = None,
+                   cache: Optional[BlobCache] = None,
+                   resolved: Optional[Dict[str, Optional[str]]] = None) -> List[Optional[str]]:
+    """
+    Returns the grouping key of every auction, in order, see ``auction_key``.
+    Names are resolved against the catalog once per call, so only auctions with ambiguous names are decoded.
+    :param auctions: Auctions, e.g. the ``auctions`` of an ActiveAuctionsResponse
+    :param catalog: ItemCatalog resolving names to item IDs
+    :param cache: BlobCache reusing decoded ``item_bytes``
+    :param resolved: Catalog keys of names resolved by earlier calls, filled in by this one
+    :return: List[Optional[str]]
+    """
+    resolved = {} if resolved is None else resolved
+    keys = []
+    for auction in auctions:
+        name = auction.item_name
+        key = None
+        if catalog is not None and name:
+            key = resolved.get(name, _MISSING)
+            if key is _MISSING:
+                key = resolved[name] = catalog_key(name, catalog)
+        if key is None:
+            key = item_bytes_key(auction.item_bytes, cache)
+        if key is None:
+            key = canonical_key(name or auction.extra, auction.tier, catalog)
+        keys.append(key)
+    return keys
+
+
+def group_auctions(pages: ActiveAuctionsResponse | Iterable[ActiveAuctionsResponse], catalog: Optional["ItemCatalog"] = None,
+                   cache: Optional[BlobCache] = None) -> Dict[str, List[AuctionsDetails]]:
+    """
+    Groups the auctions of one or more pages by ``auction_key``. Auctions without a usable item or name are skipped.
+    :param pages: ActiveAuctionsResponse or an iterable of them
+    :param catalog: ItemCatalog resolving names to item IDs
+    :param cache: BlobCache reusing decoded ``item_bytes``
+    :return: Dict[str, List[AuctionsDetails]]
+    """
+    if isinstance(pages, ActiveAuctionsResponse):
+        pages = (pages,)
+    groups: Dict[str, List[AuctionsDetails]] = {}
+    resolved: Dict[str, Optional[str]] = {}
+    for page in pages:
+        auctions = page.auctions or []
+        for auction, key in zip(auctions, canonical_keys(auctions, catalog, cache, resolved)):
+            if key is not None:
+                groups.setdefault(key, []).append(auction)
+    return groups
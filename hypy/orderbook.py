@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any
+
+from hypy.modals import BazaarResponse
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BUY = "buy"
+SELL = "sell"
+
+
+@dataclass(slots=True)
+class Fill:
+    """
+    Result of filling a quantity against every product at once, one entry per product.\n
+    ``slippage`` is the relative difference between the average fill price and the best price,
+    positive when the fill is worse than the best order.
+    """
+    filled: Any
+    cost: Any
+    vwap: Any
+    worst_price: Any
+    slippage: Any
+
+
+class OrderBook:
+    """
+    Bazaar order summaries of every product packed into padded ``(products, depth)`` NumPy arrays.\n
+    ``side="buy"`` uses ``buy_summary`` (the orders filled when buying, cheapest first),
+    ``side="sell"`` uses ``sell_summary`` (the orders filled when selling, highest first).
+    Requires the optional ``numpy`` dependency.
+    """
+    def __init__(self, product_ids: List[str], prices: Any, amounts: Any, side: str = BUY):
+        self.product_ids = product_ids
+        self.side = side
+        self.prices = prices
+        self.amounts = amounts
+        self.cumulative_amounts = numpy.cumsum(amounts, axis=1)
+        self.cumulative_costs = numpy.cumsum(prices * amounts, axis=1)
+        self._index: Dict[str, int] = {product_id: index for index, product_id in enumerate(product_ids)}
+
+    @classmethod
+    def from_bazaar(cls, response: BazaarResponse, side: str = BUY, depth: int = 30) -> "OrderBook":
+        """
+        Packs the order summaries of a BazaarResponse.
+        :param response: BazaarResponse
+        :param side: ``buy`` or ``sell`` (default is ``buy``).
+        :param depth: Number of order levels kept per product (default is 30).
+        :return: OrderBook
+        """
+        if numpy is None:
+            raise ImportError("OrderBook requires numpy, install it with: pip install hypixelv2.py[numpy]")
+        if side not in (BUY, SELL):
+            raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+        product_ids = list(response.products)
+        prices = numpy.zeros((len(product_ids), depth), dtype=numpy.float64)
+        amounts = numpy.zeros((len(product_ids), depth), dtype=numpy.float64)
+        for row, product in enumerate(response.products.values()):
+            orders = (product.buy_summary if side == BUY else product.sell_summary)[:depth]
+            if orders:
+                prices[row, :len(orders)] = [order.price_per_unit for order in orders]
+                amounts[row, :len(orders)] = [order.amount for order in orders]
+        return cls(product_ids, prices, amounts, side)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def index(self, product_id: str) -> int:
+        return self._index[product_id]
+
+    @property
+    def best_prices(self) -> Any:
+        return numpy.where(self.amounts[:, 0] > 0, self.prices[:, 0], numpy.nan)
+
+    @property
+    def depth(self) -> Any:
+        """
+        Total amount available in the summary of every product.
+        """
+        return self.cumulative_amounts[:, -1]
+
+    def depth_within(self, slippage: float) -> Any:
+        """
+        Amount available per product at prices within ``slippage`` of the best price.
+        :param slippage: Relative price tolerance, e.g. 0.05 for 5%
+        :return: numpy.ndarray
+        """
+        best = self.best_prices[:, None]
+        limit = best * (1 + slippage) if self.side == BUY else best * (1 - slippage)
+        within = self.prices <= limit if self.side == BUY else self.prices >= limit
+        return numpy.where(within, self.amounts, 0).sum(axis=1)
+
+    def fill(self, quantity: Any) -> Fill:
+        """
+        Fills ``quantity`` units of every product against its order levels in one vectorized pass.
+        Products that don't have enough depth are filled partially, check ``filled``.
+        :param quantity: Units per product, a scalar or an array with one entry per product
+        :return: Fill
+        """
+        quantity = numpy.broadcast_to(numpy.asarray(quantity, dtype=numpy.float64), (len(self.product_ids),))
+        filled = numpy.minimum(quantity, self.depth)
+        rows = numpy.arange(len(self.product_ids))
+        level = numpy.argmax(self.cumulative_amounts >= filled[:, None], axis=1)
+        previous_amount = numpy.where(level > 0, self.cumulative_amounts[rows, level - 1], 0.0)
+        previous_cost = numpy.where(level > 0, self.cumulative_costs[rows, level - 1], 0.0)
+        worst_price = self.prices[rows, level]
+        cost = previous_cost + (filled - previous_amount) * worst_price
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            vwap = numpy.where(filled > 0, cost / filled, numpy.nan)
+            slippage = vwap / self.best_prices - 1
+        if self.side == SELL:
+            slippage = -slippage
+        return Fill(filled, cost, vwap, numpy.where(filled > 0, worst_price, numpy.nan), slippage)
+
+    def fill_cost(self, product_id: str, quantity: float) -> Optional[float]:
+        """
+        Total cost of filling ``quantity`` units of one product, or None if the summary is not deep enough.
+        """
+        row = self.index(product_id)
+        cumulative = self.cumulative_amounts[row]
+        if cumulative[-1] < quantity:
+            return None
+        level = int(numpy.searchsorted(cumulative, quantity))
+        previous_amount = cumulative[level - 1] if level else 0.0
+        previous_cost = self.cumulative_costs[row, level - 1] if level else 0.0
+        return float(previous_cost + (quantity - previous_amount) * self.prices[row, level])
@@ -0,0 +1,132 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Type
+
+import httpx
+
+from hypy.exceptions import HypixelAPIError, HypixelNotFoundError, HypixelUnprocessableEntityError
+
+Key = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+# Bookkeeping cost of an entry, so small negative entries still count towards the budget.
+_ENTRY_OVERHEAD = 256
+
+
+class _Entry:
+    __slots__ = ("expires", "size", "value", "error", "response")
+
+    def __init__(self, expires: float, size: int, value: Any = None, error: Optional[Type[HypixelAPIError]] = None,
+                 response: Optional[httpx.Response] = None):
+        self.expires = expires
+        self.size = size
+        self.value = value
+        self.error = error
+        self.response = response
+
+
+class PlayerCache:
+    """
+    In-memory LRU cache of validated player data bounded by size in bytes instead of number of entries.\n
+    Every entry is weighed by the size of the payload it was decoded from, so one multi-megabyte profile counts as much
+    as hundreds of small garden responses, and the least recently used entries are evicted once ``max_bytes`` is exceeded.
+    Lookups that failed with HypixelNotFoundError or HypixelUnprocessableEntityError are cached for ``negative_ttl``
+    seconds and raise the same error again without spending a request. Cached models are shared between callers and must
+    not be modified. Only endpoints listed in ``ttls`` are cached.
+    :param max_bytes: Total payload size kept in memory (default is 64 MiB).
+    :param ttls: Seconds a response stays fresh, keyed by endpoint.
+    :param negative_ttl: Seconds a not found or malformed UUID result is cached (default is 30).
+    """
+    TTLS = {
+        "skyblock/profile": 60.0,
+        "skyblock/profiles": 60.0,
+        "skyblock/museum": 300.0,
+        "skyblock/garden": 300.0,
+        "skyblock/bingo": 300.0,
+    }
+    NEGATIVE_ERRORS = (HypixelNotFoundError, HypixelUnprocessableEntityError)
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttls: Optional[Dict[str, float]] = None, negative_ttl: float = 30.0):
+        self.max_bytes = max_bytes
+        self.ttls = self.TTLS if ttls is None else ttls
+        self.negative_ttl = negative_ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Key, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Key]:
+        """
+        Returns the cache key of a request, or None if the endpoint isn't cached.
+        """
+        endpoint = endpoint.lstrip("/")
+        if endpoint not in self.ttls:
+            return None
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def get(self, key: Key) -> Optional[Any]:
+        """
+        Returns the cached value, raises the cached error, or returns None on a miss.
+        :param key: Key returned by ``key``
+        :return: Optional[Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        if entry.error is not None:
+            raise entry.error(entry.response)
+        return entry.value
+
+    def put(self, key: Key, value: Any, size: int):
+        """
+        Caches a validated response.
+        :param key: Key returned by ``key``
+        :param value: Validated response
+        :param size: Size in bytes of the payload it was decoded from
+        """
+        self._store(key, _Entry(time.monotonic() + self.ttls[key[0]], size + _ENTRY_OVERHEAD, value=value))
+
+    def put_error(self, key: Key, error: HypixelAPIError):
+        """
+        Caches a not found or malformed UUID error, other errors are ignored.
+        """
+        if self.negative_ttl <= 0 or not isinstance(error, self.NEGATIVE_ERRORS):
+            return
+        size = len(error.response.content) + _ENTRY_OVERHEAD
+        self._store(key, _Entry(time.monotonic() + self.negative_ttl, size, error=type(error), response=error.response))
+
+    def invalidate(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
+        key = self.key(endpoint, params)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _store(self, key: Key, entry: _Entry):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Key):
+        self.size -= self._entries.pop(key).size
@@ -0,0 +1,135 @@
+import os
+import json
+import asyncio
+import time
+import zlib
+import threading
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+import httpx
+
+from hypy.exceptions import HypixelAPIError
+from hypy.shared_cache import request_key
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class ResponseArchive:
+    """
+    Records raw API responses to disk and replays them later without touching the network.\n
+    In ``record`` mode every response the client receives (errors included) is compressed with zlib and appended to
+    ``responses.bin``, and its offset is appended to ``index.jsonl``. In ``replay`` mode the client reads responses back
+    from the archive instead of sending requests, and they go through the same status checks, decoding and validation
+    as live ones, so parsing changes can be run over recorded history at disk speed without spending rate limit.
+    By default the latest recording of a request is replayed. With ``sequential`` every call returns the next recording
+    of that request in recording order, and HypixelAPIError is raised once they are exhausted.
+    :param directory: Directory holding the archive, created if missing.
+    :param mode: ``record`` or ``replay`` (default is ``record``).
+    :param sequential: Replay recordings one after the other instead of always the latest (default is False).
+    :param level: zlib compression level (default is 6).
+    """
+    def __init__(self, directory: str, mode: str = RECORD, sequential: bool = False, level: int = 6):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"mode must be '{RECORD}' or '{REPLAY}'")
+        self.directory = directory
+        self.mode = mode
+        self.sequential = sequential
+        self.level = level
+        self._index: Dict[str, List[Tuple[int, int, int, float]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._data_path = os.path.join(directory, "responses.bin")
+        self._index_path = os.path.join(directory, "index.jsonl")
+        self._load_index()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def __len__(self) -> int:
+        return sum(len(recordings) for recordings in self._index.values())
+
+    def record(self, endpoint: str, params: Optional[Dict[str, Any]], response: httpx.Response):
+        """
+        Appends a raw response to the archive.
+        :param endpoint: Endpoint
+        :param params: Query parameters
+        :param response: Response as received from the API
+        """
+        key = request_key(endpoint, params)
+        compressed = zlib.compress(response.content, self.level)
+        recorded_at = time.time()
+        with self._lock:
+            with open(self._data_path, "ab") as data:
+                offset = data.tell()
+                data.write(compressed)
+            with open(self._index_path, "a", encoding="utf-8") as index:
+                index.write(json.dumps([key, offset, len(compressed), response.status_code, recorded_at], separators=(",", ":")) + "\n")
+            self._index.setdefault(key, []).append((offset, len(compressed), response.status_code, recorded_at))
+
+    async def record_async(self, endpoint: str, params: Optional[Dict[str, Any]], response: httpx.Response):
+        """
+        Async version of ``record``: the response is compressed and written in a thread so the event loop keeps running.
+        """
+        await asyncio.to_thread(self.record, endpoint, params, response)
+
+    def replay(self, url: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        Returns the recorded response of a request as an ``httpx.Response``.
+        :param url: Full URL of the request, attached to the response
+        :param endpoint: Endpoint
+        :param params: Query parameters
+        :return: httpx.Response
+        """
+        key = request_key(endpoint, params)
+        with self._lock:
+            recordings = self._index.get(key)
+            if not recordings:
+                raise HypixelAPIError(f"No recorded response for {key}")
+            if self.sequential:
+                position = self._cursors.get(key, 0)
+                if position >= len(recordings):
+                    raise HypixelAPIError(f"All {len(recordings)} recorded responses for {key} were replayed")
+                self._cursors[key] = position + 1
+            else:
+                position = -1
+            offset, length, status_code, _ = recordings[position]
+        with open(self._data_path, "rb") as data:
+            data.seek(offset)
+            content = zlib.decompress(data.read(length))
+        return httpx.Response(status_code, content=content, request=httpx.Request("GET", url, params=params))
+
+    async def replay_async(self, url: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        Async version of ``replay``: the recording is read and decompressed in a thread so the event loop keeps running.
+        """
+        return await asyncio.to_thread(self.replay, url, endpoint, params)
+
+    def recordings(self, endpoint: Optional[str] = None) -> Iterator[Tuple[str, float]]:
+        """
+        Yields the request key (``endpoint?params``) and recording time of every recording, in recording order per request.
+        :param endpoint: Only yield recordings of this endpoint
+        """
+        for key, recordings in self._index.items():
+            if endpoint is None or key.split("?", 1)[0] == endpoint.lstrip("/"):
+                for recording in recordings:
+                    yield key, recording[3]
+
+    def rewind(self):
+        """
+        Restarts sequential replay from the first recording of every request.
+        """
+        with self._lock:
+            self._cursors.clear()
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, encoding="utf-8") as index:
+            for line in index:
+                if not line.strip():
+                    continue
+                key, offset, length, status_code, recorded_at = json.loads(line)
+                self._index.setdefault(key, []).append((offset, length, status_code, recorded_at))
@@ -0,0 +1,236 @@
+import time
+import asyncio
+from bisect import insort
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Dict, AsyncIterator, Iterator, Deque
+
+import httpx
+
+from hypy.exceptions import (
+    HypixelHTTPError,
+    HypixelRateLimitError,
+    HypixelRequestError,
+    HypixelServiceUnavailableError,
+    HypixelCircuitOpenError,
+    HypixelDeadlineExceededError
+)
+
+current_deadline: ContextVar[Optional[float]] = ContextVar("hypy_deadline", default=None)
+
+
+def is_overload(error: Optional[BaseException]) -> bool:
+    """
+    Returns True for errors that mean the API wants fewer requests (429 and 503).
+    """
+    return isinstance(error, (HypixelRateLimitError, HypixelServiceUnavailableError))
+
+
+def is_outage(error: Optional[BaseException]) -> bool:
+    """
+    Returns True for errors that mean the API is unreachable or failing (connection errors, 503 and other 5xx).
+    """
+    if isinstance(error, (HypixelServiceUnavailableError, HypixelRequestError, httpx.RequestError)):
+        return True
+    return isinstance(error, HypixelHTTPError) and error.response.status_code >= 500
+
+
+def is_transient(error: Optional[BaseException]) -> bool:
+    """
+    Returns True for errors that may go away by retrying later (overload, outage, open circuit and exceeded deadlines).
+    """
+    return is_overload(error) or is_outage(error) or isinstance(error, (HypixelCircuitOpenError, HypixelDeadlineExceededError))
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on the number of requests in flight.\n
+    Every successful request raises the limit by ``increase / limit`` (about ``increase`` per round trip),
+    while a 429/503 or queueing on the API's side multiplies it by ``decrease``. Queueing is detected on the smoothed
+    latency of successful requests: it counts as congestion once it exceeds ``latency_tolerance`` times the baseline,
+    the lowest latency observed, or ``latency_target`` if set. The baseline drifts up slowly so a single unusually fast
+    response doesn't hold the limit down forever. Decreases are applied at most once per ``cooldown`` seconds so one
+    burst of errors only counts once.
+    :param initial: Starting limit (default is 8).
+    :param minimum: Lowest limit (default is 1).
+    :param maximum: Highest limit (default is 64).
+    :param increase: Additive increase per round trip (default is 1).
+    :param decrease: Multiplicative decrease factor (default is 0.5).
+    :param latency_target: Smoothed latency in seconds above which requests count as congestion regardless of the baseline.
+    :param latency_tolerance: Ratio of smoothed latency to baseline above which requests count as congestion (default is 2).
+    :param cooldown: Minimum seconds between two decreases (default is 1).
+    """
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 64, increase: float = 1.0, decrease: float = 0.5,
+                 latency_target: Optional[float] = None, latency_tolerance: float = 2.0, cooldown: float = 1.0):
+        if not minimum <= initial <= maximum:
+            raise ValueError("initial must be between minimum and maximum")
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self._last_decrease = -float("inf")
+        self._condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency: float, error: Optional[BaseException] = None):
+        self.in_flight -= 1
+        if error is None:
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            baseline = self.baseline
+            self.baseline = latency if baseline is None else min(latency, baseline + 0.01 * (latency - baseline))
+        if is_overload(error) or (error is None and self._queueing()):
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self._last_decrease = now
+                self.limit = max(float(self.minimum), self.limit * self.decrease)
+        elif error is None:
+            self.limit = min(float(self.maximum), self.limit + self.increase / self.limit)
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _queueing(self) -> bool:
+        if self.latency_target is not None and self.latency > self.latency_target:
+            return True
+        return self.latency > self.baseline * self.latency_tolerance
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            await self.release(time.monotonic() - started, e)
+            raise
+        await self.release(time.monotonic() - started)
+
+
+class CircuitBreaker:
+    """
+    Fails fast with HypixelCircuitOpenError while the API is down.\n
+    After ``failure_threshold`` consecutive outage errors the circuit opens for ``reset_timeout`` seconds.
+    Then a single probe request is let through: if it succeeds the circuit closes, otherwise it opens again.
+    :param failure_threshold: Consecutive failures that open the circuit (default is 5).
+    :param reset_timeout: Seconds the circuit stays open before probing (default is 30).
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+
+    def before_request(self):
+        if self.state == self.CLOSED:
+            return
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+            return
+        raise HypixelCircuitOpenError(max(remaining, 0.0))
+
+    def record(self, error: Optional[BaseException] = None):
+        if not is_outage(error):
+            self.state = self.CLOSED
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def abandon(self):
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic() - self.reset_timeout
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Gives every request made inside the block, retries included, at most ``seconds`` to complete in total.
+    Nested deadlines can only shorten the outer one.
+    :param seconds: Time budget in seconds
+    :return: The absolute deadline on the ``time.monotonic`` clock
+    """
+    expires = time.monotonic() + seconds
+    outer = current_deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = current_deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, or None if no deadline is set.
+    """
+    expires = current_deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+class HedgePolicy:
+    """
+    Decides when to send a hedged (second) request for an idempotent GET.\n
+    Latencies of successful requests are tracked per endpoint. Once ``min_samples`` are known, a request that is still
+    running after the ``quantile`` latency gets a second copy, and whichever answers first wins. At most ``budget``
+    of all requests are hedged so stragglers are cut without doubling the load on the key.
+    :param quantile: Latency quantile after which a request is hedged (default is 0.95).
+    :param budget: Maximum share of requests that may be hedged (default is 0.05).
+    :param min_samples: Latencies needed for an endpoint before hedging it (default is 20).
+    :param window: Number of latencies kept per endpoint (default is 200).
+    """
+    def __init__(self, quantile: float = 0.95, budget: float = 0.05, min_samples: int = 20, window: int = 200):
+        self.quantile = quantile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+        self.requests = 0
+        self.hedges = 0
+        self._recent: Dict[str, Deque[float]] = {}
+        self._sorted: Dict[str, List[float]] = {}
+
+    def observe(self, endpoint: str, latency: float):
+        recent = self._recent.setdefault(endpoint, deque())
+        ordered = self._sorted.setdefault(endpoint, [])
+        recent.append(latency)
+        insort(ordered, latency)
+        if len(recent) > self.window:
+            ordered.remove(recent.popleft())
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Returns how long to wait before hedging a request to the endpoint, or None if it can't be hedged yet.
+        """
+        self.requests += 1
+        ordered = self._sorted.get(endpoint)
+        if not ordered or len(ordered) < self.min_samples:
+            return None
+        return ordered[min(int(self.quantile * len(ordered)), len(ordered) - 1)]
+
+    def try_hedge(self) -> bool:
+        if self.hedges + 1 > self.budget * self.requests:
+            return False
+        self.hedges += 1
+        return True
@@ -0,0 +1,147 @@
+import time
+import threading
+from typing import Optional, Dict, Any, Set, Tuple
+
+from hypy.modals import datetime_to_timestamp
+
+Key = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def _last_updated(value: Any) -> Optional[int]:
+    if isinstance(value, dict):
+        last_updated = value.get("lastUpdated")
+    else:
+        last_updated = getattr(value, "last_updated", None) or getattr(value, "lastUpdated", None)
+    if isinstance(last_updated, str):
+        return datetime_to_timestamp(last_updated)
+    return last_updated
+
+
+class _Entry:
+    __slots__ = ("value", "published", "expected", "fresh_until")
+
+    def __init__(self, value: Any, published: float, expected: float, fresh_until: float):
+        self.value = value
+        self.published = published
+        self.expected = expected
+        self.fresh_until = fresh_until
+
+
+class StaleWhileRevalidate:
+    """
+    Serves the last validated ``bazaar()`` and ``active_auctions(0)`` response immediately while one background refresh
+    fetches the next one.\n
+    A response is fresh until its ``lastUpdated`` plus the endpoint's update cadence, i.e. until Hypixel is expected to
+    have published newer data. Reads of a stale response return it right away and start a refresh unless one is already
+    running. If a refresh brings back the same data, the next one waits at least ``min_interval`` seconds. If it fails,
+    the stale response is served for ``min_interval`` seconds before the next attempt, doubled after every consecutive
+    failure up to ``max_backoff``. Responses more than ``max_stale`` seconds past their expected update are not served
+    anymore and the caller waits for the request instead, sharing it with every other caller of the same request.
+    :param cadences: Seconds between two updates of the data, keyed by endpoint.
+    :param min_interval: Minimum seconds between two refreshes of the same response (default is 2).
+    :param max_stale: Seconds a stale response may still be served (default is 300).
+    :param max_backoff: Maximum seconds between two refreshes while they keep failing (default is 60).
+    """
+    CADENCES = {
+        "skyblock/bazaar": 10.0,
+        "skyblock/auctions": 60.0,
+    }
+
+    def __init__(self, cadences: Optional[Dict[str, float]] = None, min_interval: float = 2.0, max_stale: float = 300.0,
+                 max_backoff: float = 60.0):
+        self.cadences = self.CADENCES if cadences is None else cadences
+        self.min_interval = min_interval
+        self.max_stale = max_stale
+        self.max_backoff = max_backoff
+        self.last_error: Optional[BaseException] = None
+        self._entries: Dict[Key, _Entry] = {}
+        self._refreshing: Set[Key] = set()
+        self._failures: Dict[Key, Tuple[int, BaseException]] = {}
+        self._lock = threading.Lock()
+        self._refreshed = threading.Condition(self._lock)
+
+    def key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Key]:
+        """
+        Returns the cache key of a request, or None if it isn't served stale-while-revalidate.
+        Only the first page of paginated endpoints is.
+        """
+        endpoint = endpoint.lstrip("/")
+        if endpoint not in self.cadences or params and params != {"page": 0}:
+            return None
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def get(self, key: Key) -> Optional[_Entry]:
+        """
+        Returns the entry of a request if it may still be served.
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.time() > entry.expected + self.max_stale:
+            return None
+        return entry
+
+    def is_fresh(self, entry: _Entry) -> bool:
+        return time.time() < entry.fresh_until
+
+    def put(self, key: Key, value: Any):
+        """
+        Stores a validated response.
+        :param key: Key returned by ``key``
+        :param value: Validated response
+        """
+        now = time.time()
+        last_updated = _last_updated(value)
+        published = last_updated / 1000 if last_updated else now
+        expected = published + self.cadences[key[0]]
+        previous = self._entries.get(key)
+        fresh_until = expected
+        if previous is not None and previous.published >= published:
+            fresh_until = max(expected, now + self.min_interval)
+        self._entries[key] = _Entry(value, published, expected, fresh_until)
+        self._failures.pop(key, None)
+        self.last_error = None
+
+    def fail(self, key: Key, error: BaseException):
+        """
+        Records a failed refresh and postpones the next one, backing off while refreshes keep failing.
+        :param key: Key returned by ``key``
+        :param error: Error the refresh failed with
+        """
+        failures = self._failures.get(key, (0, None))[0] + 1
+        self._failures[key] = failures, error
+        self.last_error = error
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.fresh_until = time.time() + min(self.min_interval * 2 ** (failures - 1), self.max_backoff)
+
+    def error(self, key: Key) -> Optional[BaseException]:
+        """
+        Returns the error the last refresh of a request failed with, or None if it succeeded.
+        """
+        failure = self._failures.get(key)
+        return failure[1] if failure is not None else None
+
+    def begin_refresh(self, key: Key) -> bool:
+        """
+        Returns True if the caller should refresh the request, False if a refresh is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Key):
+        with self._lock:
+            self._refreshing.discard(key)
+            self._refreshed.notify_all()
+
+    def wait_refresh(self, key: Key):
+        """
+        Blocks until the running refresh of a request, if any, is done.
+        """
+        with self._lock:
+            self._refreshed.wait_for(lambda: key not in self._refreshing)
+
+    def clear(self):
+        self._entries.clear()
+        self._failures.clear()
@@ -0,0 +1,141 @@
+import time
+import heapq
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Optional, List, Dict, Iterator, Tuple
+
+current_priority: ContextVar[Optional[str]] = ContextVar("hypy_priority", default=None)
+
+
+class _Bucket:
+    __slots__ = ("rate", "capacity", "tokens", "waiting")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.waiting = 0
+
+    def refill(self, elapsed: float):
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+
+class PriorityScheduler:
+    """
+    Shares one API key's rate budget between labeled priority classes.\n
+    Every class owns a token bucket refilled with its reserved share of ``rate``, so background work always progresses.
+    When a class runs out of tokens it may borrow from a class that has nobody waiting, and higher priority classes
+    may always borrow from lower priority ones, which lets interactive calls skip ahead of queued background work.
+    Waiting requests are served in priority order, then in arrival order.
+    :param rate: Requests per second allowed for the key (default is 1.0, i.e. 300 per 5 minutes).
+    :param burst: Maximum number of requests sent in a burst (default is 10).
+    :param classes: Reserved share of every class, in decreasing priority order (default is 70% interactive, 30% background).
+    :param default: Class used when no priority is set (default is the highest priority class).
+    """
+    def __init__(self, rate: float = 1.0, burst: float = 10.0, classes: Optional[Dict[str, float]] = None, default: Optional[str] = None):
+        classes = classes or {"interactive": 0.7, "background": 0.3}
+        total = sum(classes.values())
+        if total <= 0:
+            raise ValueError("Class shares must add up to a positive number")
+        self.rate = rate
+        self.burst = burst
+        self.order: List[str] = list(classes)
+        self.default = default or self.order[0]
+        if self.default not in classes:
+            raise ValueError(f"Unknown priority class: {self.default}")
+        self._buckets = {name: _Bucket(rate * share / total, max(burst * share / total, 1.0)) for name, share in classes.items()}
+        self._waiters: List[Tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = count()
+        self._updated = time.monotonic()
+        self._dispatcher: Optional[asyncio.TimerHandle] = None
+
+    @contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Runs the requests made inside the block (including tasks created inside it) with the given priority class.
+        :param name: Priority class
+        """
+        if name not in self._buckets:
+            raise ValueError(f"Unknown priority class: {name}")
+        token = current_priority.set(name)
+        try:
+            yield
+        finally:
+            current_priority.reset(token)
+
+    def tokens(self, name: str) -> float:
+        self._refill()
+        return self._buckets[name].tokens
+
+    async def acquire(self, name: Optional[str] = None):
+        """
+        Waits until a request of the given class may be sent.
+        :param name: Priority class, defaults to the current context's priority or the default class.
+        """
+        name = name or current_priority.get() or self.default
+        if name not in self._buckets:
+            raise ValueError(f"Unknown priority class: {name}")
+        self._refill()
+        rank = self.order.index(name)
+        ahead = any(self._buckets[other].waiting for other in self.order[:rank + 1])
+        if not ahead and self._take(name):
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._sequence), name, future))
+        self._buckets[name].waiting += 1
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                self._waiters = [waiter for waiter in self._waiters if waiter[3] is not future]
+                heapq.heapify(self._waiters)
+                self._buckets[name].waiting -= 1
+            raise
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        for bucket in self._buckets.values():
+            bucket.refill(elapsed)
+
+    def _take(self, name: str) -> bool:
+        own = self._buckets[name]
+        if own.tokens >= 1:
+            own.tokens -= 1
+            return True
+        rank = self.order.index(name)
+        for other in reversed(self.order):
+            bucket = self._buckets[other]
+            if other != name and bucket.tokens >= 1 and (bucket.waiting == 0 or self.order.index(other) > rank):
+                bucket.tokens -= 1
+                return True
+        return False
+
+    def _dispatch(self):
+        self._dispatcher = None
+        self._refill()
+        pending = []
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            _, _, name, future = waiter
+            if future.done():
+                continue
+            self._buckets[name].waiting -= 1
+            if self._take(name):
+                future.set_result(None)
+            else:
+                self._buckets[name].waiting += 1
+                pending.append(waiter)
+        for waiter in pending:
+            heapq.heappush(self._waiters, waiter)
+        self._schedule()
+
+    def _schedule(self):
+        if self._dispatcher is not None or not self._waiters:
+            return
+        delays = [(1 - bucket.tokens) / bucket.rate for bucket in self._buckets.values() if bucket.rate > 0 and bucket.tokens < 1]
+        self._dispatcher = asyncio.get_running_loop().call_later(min(delays, default=0.01), self._dispatch)
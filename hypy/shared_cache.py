@@ -0,0 +1,189 @@
+import os
+import mmap
+import time
+import struct
+import asyncio
+import hashlib
+import weakref
+import tempfile
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable, Awaitable, Iterator
+
+import httpx
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_HEADER = struct.Struct(">dQ")
+# Seconds between two attempts to take a lock file held by another process, doubled up to the maximum.
+_LOCK_POLL = 0.005
+_MAX_LOCK_POLL = 0.1
+
+
+def request_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Returns the canonical ``endpoint?name=value`` key of a request, with parameters sorted by name.
+    """
+    return endpoint.lstrip("/") + "?" + "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+
+
+def _open_lock(path: str) -> int:
+    return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+
+def _lock_file(path: str) -> int:
+    fd = _open_lock(path)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+async def _lock_file_async(path: str) -> int:
+    # Polls with LOCK_NB instead of blocking an executor thread in flock, the lock holder may need those threads.
+    fd = _open_lock(path)
+    delay = _LOCK_POLL
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_LOCK_POLL)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _unlock_file(fd: int):
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def cached_response(url: str, content: bytes) -> httpx.Response:
+    """
+    Wraps a cached payload in a 200 response so it goes through the client's normal decoding and validation.
+    """
+    return httpx.Response(200, content=content, request=httpx.Request("GET", url))
+
+
+class SharedResponseCache:
+    """
+    Response cache shared by every process on the host, e.g. the workers of a gunicorn or uvicorn server.\n
+    Raw payloads are stored in one file per endpoint and parameters under ``directory`` and read back through ``mmap``,
+    so the payload lives once in the page cache instead of once per worker. Refreshes take an exclusive ``flock`` on the
+    entry: one worker downloads while the others wait and then read its result instead of downloading it again.
+    Only endpoints listed in ``ttls`` are cached.
+    :param directory: Directory holding the cache files, created if missing.
+    :param ttls: Seconds a payload stays fresh, keyed by endpoint.
+    """
+    TTLS = {
+        "skyblock/bazaar": 10.0,
+        "skyblock/auctions": 30.0,
+        "resources/skyblock/items": 3600.0,
+        "resources/skyblock/skills": 3600.0,
+        "resources/skyblock/collections": 3600.0,
+    }
+
+    def __init__(self, directory: str, ttls: Optional[Dict[str, float]] = None):
+        if fcntl is None:
+            raise RuntimeError("SharedResponseCache requires fcntl and is only available on Unix")
+        self.directory = directory
+        self.ttls = self.TTLS if ttls is None else ttls
+        self._async_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        os.makedirs(directory, exist_ok=True)
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        return self.ttls.get(endpoint.lstrip("/"))
+
+    def path(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return os.path.join(self.directory, hashlib.sha1(request_key(endpoint, params).encode()).hexdigest())
+
+    def read(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """
+        Returns the cached payload if it is still fresh.
+        :param endpoint: Endpoint
+        :param params: Query parameters
+        :return: Optional[bytes]
+        """
+        ttl = self.ttl(endpoint)
+        try:
+            with open(self.path(endpoint, params), "rb") as file:
+                if os.fstat(file.fileno()).st_size < _HEADER.size:
+                    return None
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    stored_at, length = _HEADER.unpack_from(view)
+                    if ttl is None or time.time() - stored_at > ttl:
+                        return None
+                    return view[_HEADER.size:_HEADER.size + length]
+        except FileNotFoundError:
+            return None
+
+    def write(self, endpoint: str, params: Optional[Dict[str, Any]], content: bytes):
+        """
+        Atomically replaces the cached payload.
+        """
+        fd, temporary = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_HEADER.pack(time.time(), len(content)))
+                file.write(content)
+            os.replace(temporary, self.path(endpoint, params))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @contextmanager
+    def lock(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        fd = _lock_file(self.path(endpoint, params) + ".lock")
+        try:
+            yield
+        finally:
+            _unlock_file(fd)
+
+    def fetch(self, endpoint: str, params: Optional[Dict[str, Any]], load: Callable[[], bytes]) -> bytes:
+        """
+        Returns the fresh cached payload, or calls ``load`` under the entry's lock and caches its result.
+        """
+        content = self.read(endpoint, params)
+        if content is not None:
+            return content
+        with self.lock(endpoint, params):
+            content = self.read(endpoint, params)
+            if content is None:
+                content = load()
+                self.write(endpoint, params, content)
+        return content
+
+    async def fetch_async(self, endpoint: str, params: Optional[Dict[str, Any]], load: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Async version of ``fetch``. Coroutines of the same process queue on an ``asyncio.Lock`` per entry, so only one of
+        them polls the lock file, without blocking the event loop or an executor thread while another process holds it.
+        """
+        content = self.read(endpoint, params)
+        if content is not None:
+            return content
+        path = self.path(endpoint, params)
+        local = self._async_locks.get(path)
+        if local is None:
+            local = self._async_locks[path] = asyncio.Lock()
+        async with local:
+            content = self.read(endpoint, params)
+            if content is not None:
+                return content
+            fd = await _lock_file_async(path + ".lock")
+            try:
+                content = self.read(endpoint, params)
+                if content is None:
+                    content = await load()
+                    self.write(endpoint, params, content)
+            finally:
+                _unlock_file(fd)
+        return content
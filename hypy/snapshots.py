@@ -0,0 +1,209 @@
+import os
+import copy
+import json
+import time
+from bisect import bisect_right
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+_MISSING = object()
+
+Delta = List[List[Any]]
+
+
+def diff(old: Any, new: Any, path: Tuple[str, ...] = ()) -> Delta:
+    """
+    Returns the structural delta turning ``old`` into ``new``.\n
+    Dicts are compared key by key, any other value (including lists) is replaced as a whole when it changed.
+    Operations are ``["set", path, value]`` and ``["del", path]``.
+    :param old: Previous JSON document
+    :param new: Current JSON document
+    :return: Delta
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations = []
+        for key, value in new.items():
+            previous = old.get(key, _MISSING)
+            if previous is _MISSING:
+                operations.append(["set", [*path, key], value])
+            elif previous != value:
+                operations.extend(diff(previous, value, (*path, key)))
+        operations.extend(["del", [*path, key]] for key in old.keys() - new.keys())
+        return operations
+    if old == new:
+        return []
+    return [["set", list(path), new]]
+
+
+def apply(document: Any, delta: Delta) -> Any:
+    """
+    Applies a delta created by ``diff`` in place and returns the document.
+    :param document: JSON document
+    :param delta: Delta
+    :return: Any
+    """
+    for operation in delta:
+        path = operation[1]
+        if not path:
+            document = copy.deepcopy(operation[2])
+            continue
+        parent = document
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        if operation[0] == "set":
+            parent[path[-1]] = copy.deepcopy(operation[2])
+        else:
+            parent.pop(path[-1], None)
+    return document
+
+
+class _History:
+    __slots__ = ("timestamps", "entries", "offsets", "checkpoints", "latest", "since_checkpoint")
+
+    def __init__(self):
+        self.timestamps: List[float] = []
+        # Entries are kept in memory without a directory, otherwise only their offsets in the history file are.
+        self.entries: List[Tuple[str, Any]] = []
+        self.offsets: List[int] = []
+        self.checkpoints: List[int] = []
+        self.latest: Optional[Dict[str, Any]] = None
+        self.since_checkpoint = 0
+
+
+class ProfileTracker:
+    """
+    Keeps the history of periodically fetched profiles as structural deltas.\n
+    Only the latest snapshot of every profile is kept in full, every new fetch is stored as the delta from the previous one
+    and a full checkpoint is written every ``checkpoint_every`` deltas so any point in time is rebuilt from the nearest
+    checkpoint instead of from the very first snapshot. Profiles are recorded as the raw API dicts (``profiles(uuid,
+    raw=True)``) so fields the models don't declare are tracked too. With a ``directory`` every entry is appended to
+    ``<profile_id>.jsonl`` and only the latest snapshot and the offsets of the entries are kept in memory, older entries
+    are read back from the file when a past snapshot is rebuilt.
+    :param directory: Directory for the append-only history files, histories are kept in memory only by default.
+    :param checkpoint_every: Number of deltas between two full checkpoints (default is 50).
+    """
+    def __init__(self, directory: Optional[str] = None, checkpoint_every: int = 50):
+        self.directory = directory
+        self.checkpoint_every = checkpoint_every
+        self._histories: Dict[str, _History] = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, profile_id: str, profile: Dict[str, Any], timestamp: Optional[float] = None) -> int:
+        """
+        Records a fetched profile.
+        :param profile_id: Profile ID
+        :param profile: Raw profile dict
+        :param timestamp: Fetch time in seconds, defaults to now
+        :return: Number of delta operations stored (0 if nothing changed), or -1 if a full checkpoint was stored
+        """
+        if not isinstance(profile, dict):
+            raise TypeError("ProfileTracker records raw profile dicts, fetch them with raw=True")
+        document = copy.deepcopy(profile)
+        timestamp = time.time() if timestamp is None else timestamp
+        history = self._history(profile_id)
+        if history.timestamps and timestamp < history.timestamps[-1]:
+            raise ValueError("Snapshots must be recorded in chronological order")
+        delta = diff(history.latest, document) if history.latest is not None else None
+        if delta == []:
+            return 0
+        history.latest = document
+        if delta is None or history.since_checkpoint >= self.checkpoint_every:
+            self._append(profile_id, history, timestamp, "full", document)
+            history.checkpoints.append(len(history.timestamps) - 1)
+            history.since_checkpoint = 0
+            return -1
+        self._append(profile_id, history, timestamp, "delta", delta)
+        history.since_checkpoint += 1
+        return len(delta)
+
+    def record_profiles(self, response: Dict[str, Any], timestamp: Optional[float] = None):
+        """
+        Records every profile of a raw ``profiles`` response (or the profile of a raw ``profile`` response).
+        :param response: Response of ``profiles(uuid, raw=True)`` or ``profile(profile_id, raw=True)``
+        :param timestamp: Fetch time in seconds, defaults to now
+        """
+        if not isinstance(response, dict):
+            raise TypeError("ProfileTracker records raw responses, fetch them with raw=True")
+        profiles = response["profiles"] if "profiles" in response else [response.get("profile")]
+        for profile in profiles or []:
+            if profile is not None:
+                self.record(profile["profile_id"], profile, timestamp)
+
+    def latest(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        history = self._history(profile_id)
+        return copy.deepcopy(history.latest) if history.latest is not None else None
+
+    def timestamps(self, profile_id: str) -> List[float]:
+        return list(self._history(profile_id).timestamps)
+
+    def at(self, profile_id: str, timestamp: float) -> Optional[Dict[str, Any]]:
+        """
+        Rebuilds a profile as it was at the given time.
+        :param profile_id: Profile ID
+        :param timestamp: Time in seconds
+        :return: The profile dict, or None if it wasn't tracked yet
+        """
+        history = self._history(profile_id)
+        end = bisect_right(history.timestamps, timestamp)
+        if end == 0:
+            return None
+        checkpoint = history.checkpoints[bisect_right(history.checkpoints, end - 1) - 1]
+        entries = self._entries(profile_id, history, checkpoint, end)
+        document = copy.deepcopy(next(entries)[1])
+        for _, delta in entries:
+            document = apply(document, delta)
+        return document
+
+    def _history(self, profile_id: str) -> _History:
+        history = self._histories.get(profile_id)
+        if history is None:
+            history = self._histories[profile_id] = self._load(profile_id)
+        return history
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.jsonl")
+
+    def _append(self, profile_id: str, history: _History, timestamp: float, kind: str, payload: Any):
+        history.timestamps.append(timestamp)
+        if self.directory is None:
+            history.entries.append((kind, payload))
+            return
+        with open(self._path(profile_id), "ab") as file:
+            history.offsets.append(file.tell())
+            file.write(json.dumps([timestamp, kind, payload], separators=(",", ":")).encode() + b"\n")
+
+    def _entries(self, profile_id: str, history: _History, start: int, end: int) -> Iterator[Tuple[str, Any]]:
+        if self.directory is None:
+            yield from history.entries[start:end]
+            return
+        with open(self._path(profile_id), "rb") as file:
+            file.seek(history.offsets[start])
+            for _ in range(end - start):
+                _, kind, payload = json.loads(file.readline())
+                yield kind, payload
+
+    def _load(self, profile_id: str) -> _History:
+        history = _History()
+        if self.directory is None or not os.path.exists(self._path(profile_id)):
+            return history
+        offset = 0
+        with open(self._path(profile_id), "rb") as file:
+            # Only the timestamp and kind of every entry are parsed here, the payloads since the last checkpoint are
+            # decoded afterwards to rebuild the latest snapshot.
+            for line in file:
+                if line.strip():
+                    timestamp, kind, _ = line[1:].split(b",", 2)
+                    history.timestamps.append(float(timestamp))
+                    history.offsets.append(offset)
+                    if kind == b'"full"':
+                        history.checkpoints.append(len(history.timestamps) - 1)
+                        history.since_checkpoint = 0
+                    else:
+                        history.since_checkpoint += 1
+                offset += len(line)
+        if history.checkpoints:
+            entries = self._entries(profile_id, history, history.checkpoints[-1], len(history.timestamps))
+            history.latest = next(entries)[1]
+            for _, delta in entries:
+                history.latest = apply(history.latest, delta)
+        return history
@@ -0,0 +1,277 @@
+import math
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Optional, Dict, Iterable, Callable, Tuple, List
+
+from hypy.modals import RecentlyAuctionsDetails, datetime_to_timestamp
+from hypy.nbt import item_stacks, skyblock_id, stack_count
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a fixed relative accuracy (DDSketch style log buckets).\n
+    Bucket counts are kept in a dense list indexed by ``key - offset``, so adding a value is a single index update and
+    queries never sort. Memory is bounded by ``max_buckets``: when the keys span more buckets than that, the lowest
+    buckets are collapsed into one, so accuracy is only lost on the cheapest values.
+    """
+    __slots__ = ("relative_accuracy", "max_buckets", "_gamma_log", "_offset", "_bins", "_zero_count", "count", "min", "max", "_cumulative")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 512):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be at least 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma_log = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self._offset = 0
+        self._bins: List[int] = []
+        self._zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._cumulative: Optional[List[int]] = None
+
+    def add(self, value: float, count: int = 1):
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        if value == 0:
+            self._zero_count += count
+        else:
+            self._bins[self._index(math.ceil(math.log(value) / self._gamma_log))] += count
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self._cumulative = None
+
+    def merge(self, other: "QuantileSketch"):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with a different relative accuracy")
+        # Adding the highest buckets first sets the final range, so lower ones are never placed and then collapsed again.
+        for position in range(len(other._bins) - 1, -1, -1):
+            if other._bins[position]:
+                self._bins[self._index(other._offset + position)] += other._bins[position]
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._cumulative = None
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self._zero_count:
+            return 0.0
+        if self._cumulative is None:
+            self._cumulative = list(accumulate(self._bins, initial=self._zero_count))[1:]
+        totals = self._cumulative
+        index = min(bisect_left(totals, rank + 1), len(totals) - 1)
+        value = 2 * math.exp((self._offset + index) * self._gamma_log) / (1 + math.exp(self._gamma_log))
+        return min(max(value, self.min), self.max)
+
+    def _index(self, key: int) -> int:
+        bins = self._bins
+        if not bins:
+            self._offset = key
+            bins.append(0)
+            return 0
+        top = self._offset + len(bins) - 1
+        if key > top:
+            bins.extend([0] * (key - top))
+            excess = len(bins) - self.max_buckets
+            if excess > 0:
+                collapsed = sum(bins[:excess + 1])
+                del bins[:excess]
+                bins[0] = collapsed
+                self._offset += excess
+            return key - self._offset
+        if key < self._offset:
+            lowest = max(key, top - self.max_buckets + 1)
+            if lowest < self._offset:
+                bins[:0] = [0] * (self._offset - lowest)
+                self._offset = lowest
+            return max(key, self._offset) - self._offset
+        return key - self._offset
+
+
+class Ewma:
+    """
+    Time based exponentially weighted moving average for irregularly spaced observations.\n
+    ``half_life`` is the number of seconds after which an observation weighs half as much.
+    Observations may arrive out of order and two averages over the same half life can be merged.
+    """
+    __slots__ = ("half_life", "_weighted_sum", "_weight", "timestamp")
+
+    def __init__(self, half_life: float):
+        self.half_life = half_life
+        self._weighted_sum = 0.0
+        self._weight = 0.0
+        self.timestamp: Optional[float] = None
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._weighted_sum / self._weight if self._weight else None
+
+    def add(self, value: float, timestamp: float, weight: float = 1.0):
+        if self.timestamp is None or timestamp >= self.timestamp:
+            self._decay_to(timestamp)
+        else:
+            weight *= 0.5 ** ((self.timestamp - timestamp) / self.half_life)
+        self._weighted_sum += value * weight
+        self._weight += weight
+
+    def merge(self, other: "Ewma"):
+        if other.timestamp is None:
+            return
+        if other.half_life != self.half_life:
+            raise ValueError("Cannot merge averages with a different half life")
+        latest = other.timestamp if self.timestamp is None else max(self.timestamp, other.timestamp)
+        self._decay_to(latest)
+        decay = 0.5 ** ((latest - other.timestamp) / self.half_life)
+        self._weighted_sum += other._weighted_sum * decay
+        self._weight += other._weight * decay
+
+    def _decay_to(self, timestamp: float):
+        if self.timestamp is not None and timestamp > self.timestamp:
+            decay = 0.5 ** ((timestamp - self.timestamp) / self.half_life)
+            self._weighted_sum *= decay
+            self._weight *= decay
+        self.timestamp = timestamp
+
+
+class ItemPriceStats:
+    __slots__ = ("sketch", "ewmas", "count", "last_price", "last_sold")
+
+    def __init__(self, windows: Iterable[float], relative_accuracy: float, max_buckets: int):
+        self.sketch = QuantileSketch(relative_accuracy, max_buckets)
+        self.ewmas = {window: Ewma(window) for window in windows}
+        self.count = 0
+        self.last_price: Optional[float] = None
+        self.last_sold: Optional[float] = None
+
+    def add(self, price: float, timestamp: float):
+        self.sketch.add(price)
+        for ewma in self.ewmas.values():
+            ewma.add(price, timestamp)
+        self.count += 1
+        if self.last_sold is None or timestamp >= self.last_sold:
+            self.last_price = price
+            self.last_sold = timestamp
+
+    def merge(self, other: "ItemPriceStats"):
+        self.sketch.merge(other.sketch)
+        for window, ewma in other.ewmas.items():
+            if window in self.ewmas:
+                self.ewmas[window].merge(ewma)
+        self.count += other.count
+        if other.last_sold is not None and (self.last_sold is None or other.last_sold >= self.last_sold):
+            self.last_price = other.last_price
+            self.last_sold = other.last_sold
+
+
+def ended_auction_item(auction: RecentlyAuctionsDetails) -> Tuple[Optional[str], int]:
+    """
+    Returns the SkyBlock item ID and stack size of an ended auction by decoding its ``item_bytes``.
+    :param auction: Ended auction
+    :return: Tuple[Optional[str], int]
+    """
+    if not auction.item_bytes:
+        return None, 1
+    try:
+        stacks = item_stacks(auction.item_bytes)
+    except (ValueError, OSError, EOFError):
+        return None, 1
+    if not stacks:
+        return None, 1
+    return skyblock_id(stacks[0]), stack_count(stacks[0]) or 1
+
+
+class PriceAggregator:
+    """
+    Streaming per-item price statistics built from ended auctions.\n
+    Every item keeps a quantile sketch and one EWMA per configured window, so memory per item is fixed
+    no matter how many sales are consumed. Aggregators built on different workers can be combined with ``merge``.
+    :param windows: EWMA half lives in seconds (default is one hour and one day).
+    :param relative_accuracy: Relative accuracy of the quantile sketches (default is 1%).
+    :param max_buckets: Maximum number of buckets per sketch (default is 512).
+    :param key: Callable returning the item key and stack size of an auction, defaults to decoding ``item_bytes``.
+    :param bin_only: Only consume BIN sales (default is False).
+    """
+    def __init__(self, windows: Iterable[float] = (3600.0, 86400.0), relative_accuracy: float = 0.01, max_buckets: int = 512,
+                 key: Callable[[RecentlyAuctionsDetails], Tuple[Optional[str], int]] = ended_auction_item, bin_only: bool = False):
+        self.windows = tuple(windows)
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.key = key
+        self.bin_only = bin_only
+        self._items: Dict[str, ItemPriceStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._items
+
+    def add(self, auction: RecentlyAuctionsDetails) -> Optional[str]:
+        """
+        Consumes one ended auction.
+        :param auction: Ended auction
+        :return: The item key the sale was recorded under, or None if it was skipped.
+        """
+        if auction.price is None or (self.bin_only and not auction.bin):
+            return None
+        item, amount = self.key(auction)
+        if item is None:
+            return None
+        sold = datetime_to_timestamp(auction.time)
+        self.add_price(item, auction.price / amount, sold / 1000 if sold is not None else time.time())
+        return item
+
+    def add_many(self, auctions: Iterable[RecentlyAuctionsDetails]) -> int:
+        """
+        Consumes many ended auctions, for example the ``auctions`` of a RecentlyEndedAuctionsResponse.
+        :param auctions: Ended auctions
+        :return: Number of sales recorded
+        """
+        return sum(1 for auction in auctions if self.add(auction) is not None)
+
+    def add_price(self, item: str, price: float, timestamp: float):
+        stats = self._items.get(item)
+        if stats is None:
+            stats = self._items[item] = ItemPriceStats(self.windows, self.relative_accuracy, self.max_buckets)
+        stats.add(price, timestamp)
+
+    def stats(self, item: str) -> Optional[ItemPriceStats]:
+        return self._items.get(item)
+
+    def quantile(self, item: str, q: float) -> Optional[float]:
+        stats = self._items.get(item)
+        return stats.sketch.quantile(q) if stats else None
+
+    def median(self, item: str) -> Optional[float]:
+        return self.quantile(item, 0.5)
+
+    def ewma(self, item: str, window: Optional[float] = None) -> Optional[float]:
+        window = self.windows[0] if window is None else window
+        if window not in self.windows:
+            raise ValueError(f"Unknown EWMA window: {window}, the aggregator tracks {self.windows}")
+        stats = self._items.get(item)
+        return stats.ewmas[window].value if stats else None
+
+    def items(self) -> Iterable[str]:
+        return self._items.keys()
+
+    def merge(self, other: "PriceAggregator"):
+        """
+        Merges the statistics of another aggregator, e.g. one built on a different worker, into this one.
+        :param other: PriceAggregator with the same windows and accuracy
+        """
+        for item, stats in other._items.items():
+            own = self._items.get(item)
+            if own is None:
+                own = self._items[item] = ItemPriceStats(self.windows, self.relative_accuracy, self.max_buckets)
+            own.merge(stats)
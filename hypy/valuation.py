@@ -0,0 +1,260 @@
+import json
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
+
+from hypy.modals import (
+    ActiveAuctionsResponse,
+    AuctionsDetails,
+    BazaarResponse,
+    MembersDetails,
+    MuseumMembers,
+    MuseumResponse,
+    Pet,
+    ProfilesResponse
+)
+from hypy.nbt import item_stacks, skyblock_id, stack_count
+
+
+def pet_key(pet_type: Optional[str], tier: Optional[str]) -> str:
+    """
+    Returns the price key of a pet, e.g. ``PET:ENDER_DRAGON:LEGENDARY``.
+    :param pet_type: Pet type
+    :param tier: Pet rarity
+    :return: str
+    """
+    return f"PET:{pet_type}:{tier}"
+
+
+def stack_key(stack: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the price key of a decoded item stack. Pets are keyed by type and rarity, everything else by SkyBlock item ID.
+    :param stack: Decoded item stack
+    :return: Optional[str]
+    """
+    item_id = skyblock_id(stack)
+    if item_id == "PET":
+        try:
+            info = json.loads(stack["tag"]["ExtraAttributes"]["petInfo"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return pet_key(info.get("type"), info.get("tier"))
+    return item_id
+
+
+def blob_items(data: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Returns the ``(price key, amount)`` pairs stored in an encoded item blob.
+    :param data: Base64 string
+    :return: Tuple[Tuple[str, int], ...]
+    """
+    try:
+        stacks = item_stacks(data)
+    except (ValueError, OSError, EOFError):
+        return ()
+    items = []
+    for stack in stacks:
+        key = stack_key(stack) if stack else None
+        if key is not None:
+            items.append((key, stack_count(stack)))
+    return tuple(items)
+
+
+# Rough memory cost of a cached blob: the digest key and dict slot, plus one (key, amount) tuple per item.
+_BLOB_OVERHEAD = 160
+_ITEM_SIZE = 120
+
+
+class BlobCache:
+    """
+    LRU cache of decoded item blobs keyed by a 16 byte digest of the blob instead of the blob itself,
+    bounded by the approximate memory of the cached results.
+    :param max_bytes: Approximate memory kept for decoded blobs (default is 16 MiB).
+    """
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[bytes, Tuple[Tuple[str, int], ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self, data: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Returns ``blob_items(data)``, decoding the blob only if it isn't cached yet.
+        """
+        digest = hashlib.blake2b(data.encode(), digest_size=16).digest()
+        items = self._entries.get(digest)
+        if items is not None:
+            self._entries.move_to_end(digest)
+            return items
+        items = blob_items(data)
+        size = _BLOB_OVERHEAD + len(items) * _ITEM_SIZE
+        if size <= self.max_bytes:
+            self._entries[digest] = items
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= _BLOB_OVERHEAD + len(evicted) * _ITEM_SIZE
+        return items
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+def _blobs(container: Any) -> Iterator[str]:
+    if isinstance(container, dict):
+        data = container.get("data")
+        if isinstance(data, str):
+            yield data
+            return
+        for value in container.values():
+            yield from _blobs(value)
+
+
+class PriceTable:
+    """
+    Unit prices keyed by SkyBlock item ID (or ``pet_key`` for pets), shared by every valuation.
+    :param prices: Initial prices
+    """
+    def __init__(self, prices: Optional[Dict[str, float]] = None):
+        self.prices: Dict[str, float] = dict(prices or {})
+        self._bazaar_keys: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def get(self, key: str, default: float = 0.0) -> float:
+        return self.prices.get(key, default)
+
+    def update(self, prices: Dict[str, float]):
+        self.prices.update(prices)
+
+    def update_bazaar(self, response: BazaarResponse, instant_sell: bool = True):
+        """
+        Sets the price of every bazaar product from its quick status.
+        :param response: BazaarResponse
+        :param instant_sell: Use the instant sell price instead of the instant buy price (default is True).
+        """
+        for product_id, product in response.products.items():
+            status = product.quick_status
+            self.prices[product_id] = status.sell_price if instant_sell else status.buy_price
+        self._bazaar_keys = set(response.products)
+
+    def update_lowest_bin(self, pages: ActiveAuctionsResponse | Iterable[ActiveAuctionsResponse]):
+        """
+        Sets the price of every item sold as BIN to its lowest per-unit BIN price across the given pages, replacing the
+        price of the previous sweep. Items that are also sold on the bazaar keep their bazaar price.
+        :param pages: ActiveAuctionsResponse or an iterable of them
+        """
+        if isinstance(pages, ActiveAuctionsResponse):
+            pages = (pages,)
+        lowest: Dict[str, float] = {}
+        for page in pages:
+            for auction in page.auctions or []:
+                entry = _lowest_bin_entry(auction)
+                if entry is not None and entry[1] < lowest.get(entry[0], float("inf")):
+                    lowest[entry[0]] = entry[1]
+        bazaar_keys = self._bazaar_keys
+        for key, price in lowest.items():
+            if key not in bazaar_keys:
+                self.prices[key] = price
+
+
+def _lowest_bin_entry(auction: AuctionsDetails) -> Optional[Tuple[str, float]]:
+    if not auction.bin or not auction.item_bytes or auction.starting_bid is None:
+        return None
+    items = blob_items(auction.item_bytes)
+    if not items:
+        return None
+    key, amount = items[0]
+    return key, auction.starting_bid / (amount or 1)
+
+
+@dataclass(slots=True)
+class Valuation:
+    purse: float = 0.0
+    inventory: float = 0.0
+    sacks: float = 0.0
+    pets: float = 0.0
+    museum: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.purse + self.inventory + self.sacks + self.pets + self.museum
+
+
+class ValuationEngine:
+    """
+    Values SkyBlock profiles in batch against a shared PriceTable.\n
+    Decoded item blobs are kept in the engine's BlobCache, prices are plain dict lookups, so valuing the same profiles
+    again only costs the decoding of inventories that changed since the last run.
+    :param prices: PriceTable used for every valuation
+    :param cache_bytes: Approximate memory kept for decoded blobs (default is 16 MiB), 0 disables the cache.
+    """
+    def __init__(self, prices: PriceTable, cache_bytes: int = 16 * 1024 * 1024):
+        self.prices = prices
+        self.blobs = BlobCache(cache_bytes)
+
+    def clear_cache(self):
+        self.blobs.clear()
+
+    def value_items(self, items: Iterable[Tuple[str, int]]) -> float:
+        get = self.prices.prices.get
+        return sum(get(key, 0.0) * amount for key, amount in items)
+
+    def value_blobs(self, container: Any) -> float:
+        return sum(self.value_items(self.blobs.items(data)) for data in _blobs(container))
+
+    def value_pets(self, pets: Iterable[Pet]) -> float:
+        get = self.prices.prices.get
+        return sum(get(pet_key(pet.type, pet.tier), 0.0) for pet in pets)
+
+    def value_museum(self, museum: MuseumMembers) -> float:
+        total = sum(self.value_items(self.blobs.items(item.items.data)) for item in (museum.items or {}).values() if item.items and item.items.data)
+        for special in museum.special or []:
+            total += self.value_blobs(special.get("items"))
+        return total
+
+    def value_member(self, member: MembersDetails, museum: Optional[MuseumMembers] = None) -> Valuation:
+        """
+        Values a single profile member.
+        :param member: MembersDetails
+        :param museum: The member's museum data, if it should be included
+        :return: Valuation
+        """
+        valuation = Valuation()
+        if member.currencies:
+            valuation.purse = member.currencies.coin_purse
+        inventory = member.inventory or {}
+        sacks = inventory.get("sacks_counts") or {}
+        valuation.sacks = self.value_items(sacks.items())
+        valuation.inventory = self.value_blobs({key: value for key, value in inventory.items() if key != "sacks_counts"})
+        if member.pets_data:
+            valuation.pets = self.value_pets(member.pets_data.pets)
+        if museum is not None:
+            valuation.museum = self.value_museum(museum)
+        return valuation
+
+    def value_profiles(self, responses: Iterable[ProfilesResponse], museums: Optional[Dict[str, MuseumResponse]] = None) -> Dict[Tuple[str, str], Valuation]:
+        """
+        Values every member of every profile.
+        :param responses: ProfilesResponse results
+        :param museums: MuseumResponse results keyed by profile ID
+        :return: Valuations keyed by ``(profile_id, member_uuid)``
+        """
+        museums = museums or {}
+        valuations = {}
+        for response in responses:
+            for profile in response.profiles or []:
+                museum = museums.get(profile.profile_id)
+                museum_members = (museum.members or {}) if museum else {}
+                for member_uuid, member in profile.members.items():
+                    valuations[(profile.profile_id, member_uuid)] = self.value_member(member, museum_members.get(member_uuid))
+        return valuations
+
+    def rank(self, valuations: Dict[Tuple[str, str], Valuation], limit: Optional[int] = None) -> List[Tuple[Tuple[str, str], float]]:
+        ranked = sorted(((key, valuation.total) for key, valuation in valuations.items()), key=lambda entry: entry[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
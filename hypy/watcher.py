@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+from typing import Optional, List, Dict, Any, Callable, Awaitable, AsyncIterator
+
+from pydantic import BaseModel
+
+from hypy.exceptions import HypixelAPIError
+
+
+def snapshot_version(response: BaseModel) -> str:
+    """
+    Returns the version of a response: its ``lastUpdated`` when the endpoint provides one, otherwise a hash of its content.
+    :param response: Validated response
+    :return: str
+    """
+    last_updated = getattr(response, "last_updated", None) or getattr(response, "lastUpdated", None)
+    if last_updated is not None:
+        return str(last_updated)
+    return hashlib.blake2b(response.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+class Subscription:
+    """
+    Bounded queue of changed snapshots for one subscriber.\n
+    When the subscriber falls behind, the oldest queued snapshot is dropped so the newest one is always delivered.
+    """
+    def __init__(self, watcher: "Watcher", endpoint: str, maxsize: int):
+        self.endpoint = endpoint
+        self.dropped = 0
+        self._watcher = watcher
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def publish(self, snapshot: BaseModel):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(snapshot)
+
+    async def get(self) -> BaseModel:
+        return await self._queue.get()
+
+    def __aiter__(self) -> AsyncIterator[BaseModel]:
+        return self
+
+    async def __anext__(self) -> BaseModel:
+        return await self._queue.get()
+
+    def close(self):
+        self._watcher.unsubscribe(self)
+
+
+class _Feed:
+    __slots__ = ("fetch", "interval", "version", "latest", "subscribers", "task")
+
+    def __init__(self, fetch: Callable[[], Awaitable[BaseModel]], interval: float):
+        self.fetch = fetch
+        self.interval = interval
+        self.version: Optional[str] = None
+        self.latest: Optional[BaseModel] = None
+        self.subscribers: List[Subscription] = []
+        self.task: Optional[asyncio.Task] = None
+
+
+class Watcher:
+    """
+    Polls endpoints once and fans changed snapshots out to any number of subscribers.\n
+    Each endpoint is polled by a single task while it has subscribers. A snapshot is published only when its
+    ``lastUpdated`` (or content hash) changed, to bounded per-subscriber queues that drop the oldest snapshot when full.
+    :param client: HypyAsync client used for polling
+    :param intervals: Seconds between polls per endpoint, for endpoints other than the defaults.
+    :param on_error: Called with the endpoint name and the error when a poll fails, polling continues afterwards.
+    """
+    INTERVALS = {
+        "bazaar": 10.0,
+        "elections": 60.0,
+        "firesale": 60.0,
+    }
+
+    def __init__(self, client: Any, intervals: Optional[Dict[str, float]] = None, on_error: Optional[Callable[[str, Exception], None]] = None):
+        self.client = client
+        self.intervals = {**self.INTERVALS, **(intervals or {})}
+        self.on_error = on_error
+        self._feeds: Dict[str, _Feed] = {}
+
+    def subscribe(self, endpoint: str, maxsize: int = 1) -> Subscription:
+        """
+        Subscribes to the changed snapshots of a client endpoint, e.g. ``bazaar``, ``elections`` or ``firesale``.
+        The latest known snapshot, if any, is delivered immediately.
+        :param endpoint: Name of a HypyAsync method taking no arguments
+        :param maxsize: Number of snapshots queued before the oldest is dropped (default is 1).
+        :return: Subscription
+        """
+        feed = self._feeds.get(endpoint)
+        if feed is None:
+            fetch = getattr(self.client, endpoint)
+            feed = self._feeds[endpoint] = _Feed(fetch, self.intervals.get(endpoint, 60.0))
+        subscription = Subscription(self, endpoint, maxsize)
+        feed.subscribers.append(subscription)
+        if feed.latest is not None:
+            subscription.publish(feed.latest)
+        if feed.task is None:
+            feed.task = asyncio.create_task(self._poll(endpoint, feed))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        feed = self._feeds.get(subscription.endpoint)
+        if feed is None or subscription not in feed.subscribers:
+            return
+        feed.subscribers.remove(subscription)
+        if not feed.subscribers and feed.task is not None:
+            feed.task.cancel()
+            feed.task = None
+
+    def latest(self, endpoint: str) -> Optional[BaseModel]:
+        feed = self._feeds.get(endpoint)
+        return feed.latest if feed else None
+
+    async def close(self):
+        tasks = [feed.task for feed in self._feeds.values() if feed.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._feeds.clear()
+
+    async def _poll(self, endpoint: str, feed: _Feed):
+        while True:
+            try:
+                snapshot = await feed.fetch()
+            except HypixelAPIError as e:
+                if self.on_error is not None:
+                    self.on_error(endpoint, e)
+            else:
+                version = snapshot_version(snapshot)
+                if version != feed.version:
+                    feed.version = version
+                    feed.latest = snapshot
+                    for subscription in list(feed.subscribers):
+                        subscription.publish(snapshot)
+            await asyncio.sleep(feed.interval)
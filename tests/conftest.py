@@ -0,0 +1,69 @@
+import gzip
+import json
+import base64
+import struct
+
+import pytest
+import pytest_asyncio
+from respx import MockRouter
+
+from hypy import HypyAsync
+
+URL = "https://api.hypixel.net/v2/"
+
+
+def _string(value: str) -> bytes:
+    raw = value.encode()
+    return struct.pack(">H", len(raw)) + raw
+
+
+def encode_item_bytes(*stacks) -> str:
+    """
+    Encodes ``(item_id, count)`` or ``(item_id, count, pet_info)`` tuples the way the API encodes ``item_bytes``.
+    """
+    payload = b""
+    for stack in stacks:
+        item_id, count = stack[0], stack[1]
+        extra = b"\x08" + _string("id") + _string(item_id)
+        if len(stack) > 2:
+            extra += b"\x08" + _string("petInfo") + _string(json.dumps(stack[2]))
+        tag = b"\x0a" + _string("ExtraAttributes") + extra + b"\x00\x00"
+        payload += b"\x01" + _string("Count") + struct.pack(">b", count) + b"\x0a" + _string("tag") + tag + b"\x00"
+    root = b"\x0a" + _string("") + b"\x09" + _string("i") + b"\x0a" + struct.pack(">i", len(stacks)) + payload + b"\x00"
+    return base64.b64encode(gzip.compress(root)).decode()
+
+
+def active_auctions_page(page, total_pages, *auctions):
+    """
+    Builds an active auctions page from ``(uuid, highest_bid_amount)`` tuples.
+    """
+    return {
+        "success": True,
+        "page": page,
+        "totalPages": total_pages,
+        "totalAuctions": len(auctions),
+        "lastUpdated": 1590854517479,
+        "auctions": [
+            {"uuid": uuid, "start": 1590854517479, "end": 1590858117479, "item_name": "Hyperion", "starting_bid": 100, "highest_bid_amount": bid, "bids": []}
+            for uuid, bid in auctions
+        ]
+    }
+
+
+@pytest.fixture
+def item_bytes():
+    return encode_item_bytes
+
+
+@pytest.fixture
+def respx_router():
+    router = MockRouter(assert_all_called=True)
+    with router:
+        yield router
+
+
+@pytest_asyncio.fixture
+async def api_client():
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz")
+    yield client
+    await client.close()
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync, EndingSoonScheduler
+from hypy.auctions import AuctionDiffer, AuctionEvent, AuctionSnapshot, ADDED, CHANGED, REMOVED
+from hypy.modals import ActiveAuctionsResponse, AuctionsDetails
+from conftest import URL, active_auctions_page
+
+
+def auction(uuid, ends_in, **fields):
+    now = time.time()
+    return AuctionsDetails.model_validate({"uuid": uuid, "start": int(now * 1000), "end": int((now + ends_in) * 1000), "item_name": "Hyperion", **fields})
+
+
+async def ignore(auction):
+    pass
+
+
+def test_due_follows_end_time_and_events():
+    scheduler = EndingSoonScheduler(ignore, lead=10)
+    scheduler.load([auction("late", 300), auction("soon", 60), auction("bin", 30, bin=True), auction("ended", -5)])
+    assert len(scheduler) == 2
+    scheduler.apply([
+        AuctionEvent(ADDED, "new", auction("new", 120)),
+        AuctionEvent(CHANGED, "late", auction("late", 30)),
+        AuctionEvent(REMOVED, "soon", auction("soon", 60)),
+    ])
+    assert scheduler.due(time.time()) == []
+    assert [item.uuid for item in scheduler.due(time.time() + 200)] == ["late", "new"]
+    assert len(scheduler) == 0
+    assert scheduler.next_fire_time() is None
+
+
+@pytest.mark.asyncio
+async def test_fires_callback_before_end():
+    fired = asyncio.Queue()
+
+    async def on_ending(auction):
+        await fired.put((auction.uuid, time.time()))
+    scheduler = EndingSoonScheduler(on_ending, lead=1)
+    scheduler.schedule(auction("later", 5))
+    scheduler.schedule(auction("first", 1.1))
+    uuid, _ = await asyncio.wait_for(fired.get(), timeout=2)
+    assert uuid == "first"
+    assert fired.empty()
+    assert "later" in scheduler
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_auction_differ_streams_pages(api_client: HypyAsync, respx_router: MockRouter):
+    previous = AuctionSnapshot([ActiveAuctionsResponse.model_validate(active_auctions_page(0, 1, ("a", 0), ("b", 0), ("gone", 0)))])
+    respx_router.get(f"{URL}skyblock/auctions?page=0").respond(status_code=200, json=active_auctions_page(0, 2, ("a", 0), ("b", 150)))
+    respx_router.get(f"{URL}skyblock/auctions?page=1").respond(status_code=200, json=active_auctions_page(1, 2, ("c", 0)))
+    differ = AuctionDiffer(previous)
+    events = []
+    async for page in api_client.iter_active_auctions():
+        events.extend((event.kind, event.uuid) for event in differ.feed(page))
+    events.extend((event.kind, event.uuid) for event in differ.finish())
+    assert sorted(events) == [(ADDED, "c"), (CHANGED, "b"), (REMOVED, "gone")]
+    assert len(differ.previous) == 3
+    assert sorted((event.kind, event.uuid) for event in previous.diff(differ.previous)) == sorted(events)
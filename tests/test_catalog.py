@@ -0,0 +1,27 @@
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync
+from conftest import URL
+
+
+@pytest.mark.asyncio
+async def test_item_catalog(api_client: HypyAsync, respx_router: MockRouter):
+    mock_items_data = {
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "items": [
+            {"id": "HYPERION", "name": "Hyperion", "tier": "LEGENDARY", "material": "IRON_SWORD"},
+            {"id": "HYPER_CATALYST", "name": "§6Hyper  Catalyst", "tier": "RARE", "material": "SKULL_ITEM"},
+            {"id": "ASPECT_OF_THE_END", "name": "Aspect of the End", "tier": "RARE", "material": "DIAMOND_SWORD"}
+        ]
+    }
+    route = respx_router.get(f"{URL}resources/skyblock/items").respond(status_code=200, json=mock_items_data)
+    catalog = await api_client.item_catalog()
+    assert catalog["HYPERION"].tier == "LEGENDARY"
+    assert [item.id for item in catalog.search("hyper")] == ["HYPER_CATALYST", "HYPERION"]
+    assert catalog.by_name("hyper catalyst")[0].id == "HYPER_CATALYST"
+    assert {item.id for item in catalog.by_tier("RARE")} == {"HYPER_CATALYST", "ASPECT_OF_THE_END"}
+    assert await api_client.item_catalog() is catalog
+    assert route.call_count == 1
+    assert catalog.update(await api_client.items()) is False
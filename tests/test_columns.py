@@ -0,0 +1,37 @@
+import math
+
+import pytest
+
+from hypy.modals import ProfilesResponse
+
+numpy = pytest.importorskip("numpy")
+
+from hypy.columns import extract_member_columns  # noqa: E402
+
+
+def profiles(*members):
+    return ProfilesResponse.model_validate({
+        "success": True,
+        "profiles": [
+            {"profile_id": f"p{index}", "members": {uuid: {"currencies": {"coin_purse": coins}, "slayer": {"slayer_bosses": {"zombie": {"xp": xp}}}}}}
+            for index, (uuid, coins, xp) in enumerate(members)
+        ]
+    })
+
+
+def test_extract_member_columns():
+    responses = [
+        profiles(("a", 10.0, 100), ("a", 50.0, 20)),
+        profiles(("b", 30.0, 500)),
+        profiles(("c", 5.0, None)),
+    ]
+    columns = extract_member_columns(responses, ["currencies.coin_purse", "slayer.slayer_bosses.zombie.xp", "missing.path"])
+    assert columns.uuids == ["a", "b", "c"]
+    assert columns["currencies.coin_purse"].tolist() == [50.0, 30.0, 5.0]
+    assert columns.row("a")["slayer.slayer_bosses.zombie.xp"] == 100
+    assert math.isnan(columns.row("c")["slayer.slayer_bosses.zombie.xp"])
+    assert columns.top_k("slayer.slayer_bosses.zombie.xp", 5) == [("b", 500.0), ("a", 100.0)]
+    assert columns.percentile("currencies.coin_purse", 50) == 30.0
+    assert columns.percentile_of("a", "currencies.coin_purse") == pytest.approx(200 / 3)
+    summed = extract_member_columns(responses[:1], ["currencies.coin_purse"], reduce="sum")
+    assert summed["currencies.coin_purse"].tolist() == [60.0]
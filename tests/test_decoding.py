@@ -0,0 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from respx import MockRouter
+
+from hypy import AuctionTable, HypyAsync, HypixelValidationError
+from hypy.modals import ActiveAuctionsResponse
+from conftest import URL, active_auctions_page
+
+
+@pytest.mark.asyncio
+async def test_offloaded_decoding(respx_router: MockRouter):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", executor=executor, offload_threshold=0)
+        respx_router.get(f"{URL}skyblock/auctions?page=0").respond(status_code=200, json=active_auctions_page(0, 1, ("a", 0)))
+        respx_router.get(f"{URL}skyblock/bazaar").respond(status_code=200, json={"success": True, "lastUpdated": 1590854517479})
+        response = await client.active_auctions(0)
+        assert isinstance(response, ActiveAuctionsResponse)
+        assert response.auctions[0].uuid == "a"
+        with pytest.raises(HypixelValidationError):
+            await client.bazaar()
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_sweep_auctions_process_pool(api_client: HypyAsync, respx_router: MockRouter):
+    for page in range(3):
+        respx_router.get(f"{URL}skyblock/auctions?page={page}").respond(status_code=200, json=active_auctions_page(page, 3, (f"a{page}", 0), (f"b{page}", 10)))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        table = await api_client.sweep_auctions(executor=executor)
+    assert isinstance(table, AuctionTable)
+    assert table.column("uuid") == ["a0", "b0", "a1", "b1", "a2", "b2"]
+    assert table.column("highest_bid_amount") == [0, 10] * 3
+    assert table.total_pages == 3
+    snapshot = table.to_response()
+    assert isinstance(snapshot, ActiveAuctionsResponse)
+    assert [auction.uuid for auction in snapshot.auctions] == ["a0", "b0", "a1", "b1", "a2", "b2"]
+    assert snapshot.auctions[0].end == "2020-05-30 17:01:57"
+
+
+@pytest.mark.asyncio
+async def test_sweep_auctions_keeps_bids_and_errors(api_client: HypyAsync, respx_router: MockRouter):
+    page = active_auctions_page(0, 2, ("a", 5))
+    page["auctions"][0]["bids"] = [{"auction_id": "a", "bidder": "b", "amount": 5, "timestamp": 1590854517479}]
+    respx_router.get(f"{URL}skyblock/auctions?page=0").respond(status_code=200, json=page)
+    route = respx_router.get(f"{URL}skyblock/auctions?page=1").respond(status_code=200, json={"success": True, "auctions": 1})
+    with pytest.raises(HypixelValidationError):
+        await api_client.sweep_auctions()
+    route.respond(status_code=200, json=active_auctions_page(1, 2))
+    bid = (await api_client.sweep_auctions()).auctions()[0].bids[0]
+    assert (bid.bidder, bid.amount, bid.time) == ("b", 5, "2020-05-30 16:01:57")
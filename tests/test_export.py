@@ -0,0 +1,47 @@
+from hypy.export import SQLiteSink
+from hypy.modals import ActiveAuctionsResponse, BazaarResponse, RecentlyEndedAuctionsResponse
+
+
+def auctions_page(last_updated, highest_bid):
+    return ActiveAuctionsResponse.model_validate({
+        "success": True,
+        "page": 0,
+        "totalPages": 1,
+        "lastUpdated": last_updated,
+        "auctions": [
+            {"uuid": "a", "auctioneer": "p", "start": 1590854517479, "end": 1590858117479, "item_name": "Hyperion", "tier": "LEGENDARY",
+             "starting_bid": 100, "highest_bid_amount": highest_bid, "bin": False, "bids": [], "item_bytes": "H4s"},
+            {"uuid": "b", "auctioneer": "p", "start": 1590854517479, "end": 1590858117479, "item_name": "Wheat", "tier": "COMMON",
+             "starting_bid": 5, "highest_bid_amount": 0, "bin": True, "bids": []}
+        ]
+    })
+
+
+def test_write_auctions_upsert_and_append():
+    with SQLiteSink(":memory:") as sink:
+        assert sink.write_auctions(auctions_page(1590854517479, 150)) == 2
+        assert sink.write_auctions([auctions_page(1590854577479, 200)]) == 2
+        rows = sink.connection.execute("SELECT uuid, highest_bid_amount, bin, end FROM auctions ORDER BY uuid").fetchall()
+        assert rows == [("a", 200, 0, 1590858117000), ("b", 0, 1, 1590858117000)]
+        sink.write_auctions(auctions_page(1590854517479, 150), upsert=False)
+        sink.write_auctions(auctions_page(1590854577479, 200), upsert=False)
+        assert sink.connection.execute("SELECT COUNT(*) FROM auction_snapshots").fetchone() == (4,)
+
+
+def test_write_ended_auctions_and_bazaar():
+    ended = RecentlyEndedAuctionsResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "auctions": [{"auction_id": "a", "price": 100, "bin": True, "timestamp": 1590854517479}]
+    })
+    bazaar = BazaarResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "products": {"INK_SACK:3": {"product_id": "INK_SACK:3", "quick_status": {"productId": "INK_SACK:3", "sellPrice": 4.2}}}
+    })
+    with SQLiteSink(":memory:") as sink:
+        sink.write_ended_auctions(ended)
+        sink.write_ended_auctions(ended)
+        sink.write_bazaar(bazaar)
+        assert sink.connection.execute("SELECT auction_id, price FROM ended_auctions").fetchall() == [("a", 100)]
+        assert sink.connection.execute("SELECT product_id, sell_price FROM bazaar").fetchall() == [("INK_SACK:3", 4.2)]
@@ -1,4 +1,3 @@
-import pytest_asyncio
 import pytest
 from respx import MockRouter
 
@@ -34,19 +33,7 @@ from hypy.modals import (
     RecentlyEndedAuctionsResponse
 )
 
-URL = "https://api.hypixel.net/v2/"
-
-@pytest_asyncio.fixture
-async def api_client():
-    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz")
-    yield client
-    await client.close()
-
-@pytest.fixture
-def respx_router():
-    router = MockRouter(assert_all_called=True)
-    with router:
-        yield router
+from conftest import URL
 
 @pytest.mark.asyncio
 async def test_bazaar(api_client: HypyAsync, respx_router: MockRouter):
@@ -139,4 +126,3 @@ async def test_bazaar_validation_error(api_client: HypyAsync, respx_router: Mock
     with pytest.raises(HypixelValidationError) as excinfo:
         await api_client.bazaar()
     assert "BazaarResponse" in str(excinfo.value)
-    
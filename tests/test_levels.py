@@ -0,0 +1,45 @@
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync
+from conftest import URL
+
+
+@pytest.mark.asyncio
+async def test_level_tables(api_client: HypyAsync, respx_router: MockRouter):
+    mock_skills_data = {
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "version": "0.12.1",
+        "skills": {
+            "FARMING": {
+                "name": "Farming",
+                "maxLevel": 3,
+                "levels": [
+                    {"level": 1, "totalExpRequired": 50.0},
+                    {"level": 2, "totalExpRequired": 175.0},
+                    {"level": 3, "totalExpRequired": 375.0}
+                ]
+            }
+        }
+    }
+    mock_collections_data = {
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "version": "0.12.1",
+        "collections": {
+            "FARMING": {
+                "name": "Farming",
+                "items": {
+                    "WHEAT": {"name": "Wheat", "maxTier": 2, "tiers": [{"tier": 1, "amountRequired": 50}, {"tier": 2, "amountRequired": 100}]}
+                }
+            }
+        }
+    }
+    respx_router.get(f"{URL}resources/skyblock/skills").respond(status_code=200, json=mock_skills_data)
+    respx_router.get(f"{URL}resources/skyblock/collections").respond(status_code=200, json=mock_collections_data)
+    tables = await api_client.level_tables()
+    assert tables.skill_level("FARMING", 49) == 0
+    assert tables.skill_levels("FARMING", [50, 174.9, 375, 10 ** 9]) == [1, 1, 3, 3]
+    assert tables.collection_tiers("WHEAT", [0, 99, 100]) == [0, 1, 2]
+    assert await api_client.level_tables(refresh=True) is tables
@@ -0,0 +1,89 @@
+import time
+
+from hypy.catalog import ItemCatalog
+from hypy.modals import ActiveAuctionsResponse, AuctionsDetails, ItemsResponse
+from hypy.normalize import auction_key, base_name, canonical_key, group_auctions, strip_formatting
+from hypy.valuation import BlobCache
+
+CATALOG = ItemCatalog(ItemsResponse.model_validate({
+    "success": True,
+    "lastUpdated": 1590854517479,
+    "items": [
+        {"id": item_id, "name": name}
+        for item_id, name in (
+            ("HYPERION", "Hyperion"), ("ASPECT_OF_THE_END", "Aspect of the End"), ("LIVID_DAGGER", "Livid Dagger"),
+            ("WISE_DRAGON_HELMET", "Wise Dragon Helmet"), ("UNDEAD_SWORD", "Undead Sword"), ("HEAVY_PEARL", "Heavy Pearl"),
+            ("ODD_SWORD", "Odd Sword"), ("RICH_BAIT", "Rich Bait"), ("FINE_JADE_GEM", "Fine Jade Gemstone"),
+            ("JADE_GEM", "Jade Gemstone"),
+        )
+    ]
+}))
+
+
+def test_canonical_key():
+    assert canonical_key("Heroic Hyperion ✪✪✪✪✪➋", catalog=CATALOG) == "HYPERION"
+    assert canonical_key("§6Withered Aspect of the End", catalog=CATALOG) == "ASPECT_OF_THE_END"
+    assert canonical_key("Ancient Wise Dragon Helmet", catalog=CATALOG) == "WISE_DRAGON_HELMET"
+    assert canonical_key("Wise Dragon Helmet", catalog=CATALOG) == "WISE_DRAGON_HELMET"
+    assert canonical_key("[Lvl 100] Ender Dragon", "LEGENDARY") == "PET:ENDER_DRAGON:LEGENDARY"
+    assert canonical_key("Shiny") == "SHINY"
+    assert canonical_key(None) is None
+    assert base_name("Fabled Livid Dagger ✪✪", CATALOG) == "Livid Dagger"
+    assert base_name("Fabled Livid Dagger ✪✪") == "Fabled Livid Dagger"
+    assert strip_formatting("§7Damage: §c+310") == "Damage: +310"
+
+
+def test_canonical_key_keeps_item_names_starting_with_reforges():
+    assert canonical_key("Undead Sword", catalog=CATALOG) == "UNDEAD_SWORD"
+    assert canonical_key("Spicy Undead Sword", catalog=CATALOG) == "UNDEAD_SWORD"
+    assert canonical_key("Heavy Pearl", catalog=CATALOG) == "HEAVY_PEARL"
+    assert canonical_key("Odd Sword", catalog=CATALOG) == "ODD_SWORD"
+    assert canonical_key("Rich Bait", catalog=CATALOG) == "RICH_BAIT"
+    assert canonical_key("Fine Jade Gemstone", catalog=CATALOG) == "FINE_JADE_GEMSTONE"
+    assert canonical_key("Undead Sword") == "UNDEAD_SWORD"
+    assert canonical_key("Fine Jade Gemstone") == "FINE_JADE_GEMSTONE"
+
+
+def test_auction_key_uses_item_id(item_bytes):
+    auctions = [
+        AuctionsDetails.model_validate({"start": 1590854517479, "end": 1590858117479, "item_name": name, "tier": tier, "item_bytes": data})
+        for name, tier, data in (
+            ("Spicy Undead Sword", "RARE", item_bytes(("UNDEAD_SWORD", 1))),
+            ("Fine Jade Gemstone", "UNCOMMON", item_bytes(("FINE_JADE_GEM", 1))),
+            ("[Lvl 1] Ender Dragon", "EPIC", item_bytes(("PET", 1, {"type": "ENDER_DRAGON", "tier": "LEGENDARY"}))),
+            ("Undead Sword", "COMMON", "not an item"),
+        )
+    ]
+    assert [auction_key(auction) for auction in auctions] == ["UNDEAD_SWORD", "FINE_JADE_GEM", "PET:ENDER_DRAGON:LEGENDARY", "UNDEAD_SWORD"]
+
+
+def test_group_auctions():
+    page = ActiveAuctionsResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "auctions": [
+            {"uuid": "a", "start": 1590854517479, "end": 1590858117479, "item_name": "Heroic Hyperion ✪✪✪✪✪", "tier": "LEGENDARY"},
+            {"uuid": "b", "start": 1590854517479, "end": 1590858117479, "item_name": "Hyperion", "tier": "MYTHIC"},
+            {"uuid": "c", "start": 1590854517479, "end": 1590858117479, "item_name": "[Lvl 1] Ender Dragon", "tier": "EPIC"}
+        ]
+    })
+    groups = group_auctions(page, CATALOG)
+    assert [auction.uuid for auction in groups["HYPERION"]] == ["a", "b"]
+    assert [auction.uuid for auction in groups["PET:ENDER_DRAGON:EPIC"]] == ["c"]
+
+
+def test_grouping_only_decodes_ambiguous_names(item_bytes):
+    hyperion, undead_sword = item_bytes(("HYPERION", 1)), item_bytes(("UNDEAD_SWORD", 1))
+    auctions = [
+        AuctionsDetails.model_construct(item_name=name, tier="LEGENDARY", item_bytes=data)
+        for name, data in (("Heroic Hyperion ✪✪✪✪✪", hyperion), ("Spicy Undead Sword", undead_sword), ("Undead Sword", undead_sword))
+    ] * 20000
+    auctions += [AuctionsDetails.model_construct(item_name="Mystery Item", item_bytes=item_bytes((f"MYSTERY_{i}", 1))) for i in range(10)]
+    cache = BlobCache()
+    start = time.perf_counter()
+    groups = group_auctions(ActiveAuctionsResponse.model_construct(auctions=auctions), CATALOG, cache)
+    elapsed = time.perf_counter() - start
+    assert len(groups["HYPERION"]) == 20000 and len(groups["UNDEAD_SWORD"]) == 40000
+    assert len(groups) == 12
+    assert len(cache) == 10
+    assert elapsed < 1.0
@@ -0,0 +1,53 @@
+import pytest
+
+from hypy.modals import BazaarResponse
+
+numpy = pytest.importorskip("numpy")
+
+from hypy.orderbook import OrderBook  # noqa: E402
+
+
+@pytest.fixture
+def bazaar():
+    def summary(*orders):
+        return [{"amount": amount, "pricePerUnit": price, "orders": 1} for price, amount in orders]
+    return BazaarResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "products": {
+            "INK_SACK:3": {
+                "product_id": "INK_SACK:3",
+                "buy_summary": summary((4.8, 640), (4.9, 640), (5.0, 25957)),
+                "sell_summary": summary((4.2, 20569), (3.8, 140326)),
+                "quick_status": {"productId": "INK_SACK:3"}
+            },
+            "WHEAT": {
+                "product_id": "WHEAT",
+                "buy_summary": summary((2.0, 10)),
+                "quick_status": {"productId": "WHEAT"}
+            }
+        }
+    })
+
+
+def test_fill_every_product(bazaar):
+    book = OrderBook.from_bazaar(bazaar)
+    assert book.depth.tolist() == [27237, 10]
+    fill = book.fill(1000)
+    assert fill.filled.tolist() == [1000, 10]
+    assert fill.cost[0] == pytest.approx(640 * 4.8 + 360 * 4.9)
+    assert fill.vwap[1] == pytest.approx(2.0)
+    assert fill.slippage[0] == pytest.approx(fill.vwap[0] / 4.8 - 1)
+    assert fill.worst_price.tolist() == [4.9, 2.0]
+    assert book.fill_cost("INK_SACK:3", 1000) == pytest.approx(fill.cost[0])
+    assert book.fill_cost("WHEAT", 11) is None
+    assert book.depth_within(0.03).tolist() == [1280, 10]
+
+
+def test_sell_side(bazaar):
+    book = OrderBook.from_bazaar(bazaar, side="sell")
+    fill = book.fill(numpy.array([30000, 5]))
+    assert fill.cost[0] == pytest.approx(20569 * 4.2 + (30000 - 20569) * 3.8)
+    assert fill.slippage[0] > 0
+    assert fill.filled[1] == 0
+    assert numpy.isnan(fill.vwap[1])
@@ -0,0 +1,50 @@
+import pytest
+from respx import MockRouter
+
+from hypy import Hypy, HypyAsync, PlayerCache, HypixelNotFoundError, HypixelUnprocessableEntityError
+from hypy.modals import GardenResponse
+from conftest import URL
+
+GARDEN = {"success": True, "garden": {"uuid": "abc"}}
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = PlayerCache(max_bytes=3000)
+    first, second, third = (cache.key("skyblock/garden", {"profile": name}) for name in "abc")
+    cache.put(first, "first", 1000)
+    cache.put(second, "second", 1000)
+    assert cache.get(first) == "first"
+    cache.put(third, "third", 1000)
+    assert cache.get(second) is None
+    assert cache.get(first) == "first"
+    assert cache.size <= cache.max_bytes
+    cache.put(second, "too big", 5000)
+    assert cache.get(second) is None
+    assert cache.key("skyblock/bazaar") is None
+
+
+def test_client_caches_responses_and_not_found(respx_router: MockRouter):
+    client = Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", player_cache=PlayerCache())
+    route = respx_router.get(f"{URL}skyblock/garden").respond(status_code=200, json=GARDEN)
+    first = client.garden("abc")
+    assert isinstance(first, GardenResponse)
+    assert client.garden("abc") is first
+    assert route.call_count == 1
+
+    missing = respx_router.get(f"{URL}skyblock/bingo").respond(status_code=404, json={"success": False})
+    for _ in range(3):
+        with pytest.raises(HypixelNotFoundError):
+            client.bingo_data("unknown")
+    assert missing.call_count == 1
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_caches_malformed_uuid(respx_router: MockRouter):
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", player_cache=PlayerCache())
+    route = respx_router.get(f"{URL}skyblock/profiles").respond(status_code=422, json={"success": False, "cause": "Malformed UUID"})
+    for _ in range(2):
+        with pytest.raises(HypixelUnprocessableEntityError):
+            await client.profiles("not-a-uuid")
+    assert route.call_count == 1
+    await client.close()
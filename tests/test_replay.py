@@ -0,0 +1,76 @@
+import threading
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from hypy import Hypy, HypyAsync, ResponseArchive, HypixelAPIError, HypixelNotFoundError
+from hypy.modals import BazaarResponse
+from conftest import URL
+
+
+def bazaar(last_updated):
+    return {"success": True, "lastUpdated": last_updated, "products": {}}
+
+
+def test_records_and_replays_through_validation(tmp_path, respx_router: MockRouter):
+    respx_router.get(f"{URL}skyblock/bazaar").mock(side_effect=[
+        httpx.Response(200, json=bazaar(1)),
+        httpx.Response(200, json=bazaar(2)),
+    ])
+    respx_router.get(f"{URL}skyblock/bingo").respond(status_code=404, json={"success": False})
+    recorder = Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", archive=ResponseArchive(str(tmp_path)))
+    recorder.bazaar()
+    recorder.bazaar()
+    with pytest.raises(HypixelNotFoundError):
+        recorder.bingo_data("unknown")
+    recorder.close()
+
+    archive = ResponseArchive(str(tmp_path), mode="replay", sequential=True)
+    assert len(archive) == 3
+    assert len(list(archive.recordings("skyblock/bazaar"))) == 2
+    replayer = Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", archive=archive)
+    first, second = replayer.bazaar(), replayer.bazaar()
+    assert isinstance(first, BazaarResponse)
+    assert (first.last_updated, second.last_updated) == (1, 2)
+    with pytest.raises(HypixelAPIError):
+        replayer.bazaar()
+    with pytest.raises(HypixelNotFoundError):
+        replayer.bingo_data("unknown")
+    with pytest.raises(HypixelAPIError):
+        replayer.bingo_data("never recorded")
+    replayer.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_replays_latest(tmp_path):
+    recorder = ResponseArchive(str(tmp_path))
+    for last_updated in (1, 2):
+        recorder.record("skyblock/bazaar", None, httpx.Response(200, json=bazaar(last_updated)))
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", archive=ResponseArchive(str(tmp_path), mode="replay"))
+    assert (await client.bazaar()).last_updated == 2
+    assert (await client.bazaar()).last_updated == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_archives_off_the_event_loop(tmp_path, respx_router: MockRouter):
+    threads = []
+
+    class TracingArchive(ResponseArchive):
+        def record(self, endpoint, params, response):
+            threads.append(threading.get_ident())
+            super().record(endpoint, params, response)
+
+        def replay(self, url, endpoint, params=None):
+            threads.append(threading.get_ident())
+            return super().replay(url, endpoint, params)
+
+    respx_router.get(f"{URL}skyblock/bazaar").respond(status_code=200, json=bazaar(1))
+    recorder = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", archive=TracingArchive(str(tmp_path)))
+    await recorder.bazaar()
+    await recorder.close()
+    replayer = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", archive=TracingArchive(str(tmp_path), mode="replay"))
+    assert (await replayer.bazaar()).last_updated == 1
+    await replayer.close()
+    assert len(threads) == 2 and threading.get_ident() not in threads
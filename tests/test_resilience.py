@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from hypy import (
+    HypyAsync,
+    AdaptiveConcurrency,
+    CircuitBreaker,
+    HedgePolicy,
+    HypixelCircuitOpenError,
+    HypixelDeadlineExceededError,
+    HypixelHTTPError,
+    HypixelRateLimitError,
+    HypixelServiceUnavailableError
+)
+from conftest import URL
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_and_circuit_breaker(respx_router: MockRouter):
+    concurrency = AdaptiveConcurrency(initial=8, cooldown=0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", concurrency=concurrency, circuit_breaker=breaker)
+    route = respx_router.get(f"{URL}skyblock/firesales")
+    route.mock(side_effect=[
+        httpx.Response(200, json={"success": True, "sales": []}),
+        httpx.Response(429, json={"success": False, "cause": "Key throttle"}),
+        httpx.Response(503, json={"success": False}),
+        httpx.Response(502, json={"success": False}),
+    ])
+    await client.firesale()
+    assert concurrency.limit == 8 + 1 / 8
+    with pytest.raises(HypixelRateLimitError):
+        await client.firesale()
+    assert concurrency.limit == (8 + 1 / 8) / 2
+    assert breaker.state == CircuitBreaker.CLOSED
+    with pytest.raises(HypixelServiceUnavailableError):
+        await client.firesale()
+    with pytest.raises(HypixelHTTPError):
+        await client.firesale()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(HypixelCircuitOpenError):
+        await client.firesale()
+    assert route.call_count == 4
+    assert concurrency.in_flight == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_within_deadline(respx_router: MockRouter):
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", max_retries=2, retry_backoff=0.01)
+    route = respx_router.get(f"{URL}skyblock/firesales").mock(side_effect=[
+        httpx.Response(502, json={"success": False}),
+        httpx.Response(503, json={"success": False}),
+        httpx.Response(200, json={"success": True, "sales": []}),
+    ])
+    await client.firesale()
+    assert route.call_count == 3
+
+    started = []
+
+    async def slow(request):
+        started.append(request)
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={"success": True, "sales": []})
+    route.mock(side_effect=slow)
+    with client.deadline(0.05):
+        with pytest.raises(HypixelDeadlineExceededError):
+            await client.firesale()
+        with pytest.raises(HypixelDeadlineExceededError):
+            await client.firesale()
+    assert len(started) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_takes_first_answer(respx_router: MockRouter):
+    hedge = HedgePolicy(min_samples=1, budget=1.0)
+    hedge.observe("skyblock/firesales", 0.01)
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", hedge=hedge)
+    calls = []
+
+    async def straggler(request):
+        calls.append(request)
+        await asyncio.sleep(5 if len(calls) == 1 else 0)
+        return httpx.Response(200, json={"success": True, "sales": []})
+    respx_router.get(f"{URL}skyblock/firesales").mock(side_effect=straggler)
+    await asyncio.wait_for(client.firesale(), timeout=1)
+    assert len(calls) == 2
+    assert hedge.hedges == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_follows_smoothed_latency():
+    concurrency = AdaptiveConcurrency(initial=8, cooldown=0)
+
+    async def request(latency):
+        await concurrency.acquire()
+        await concurrency.release(latency)
+    for _ in range(5):
+        await request(0.05)
+    assert concurrency.limit > 8 and concurrency.baseline == 0.05
+    limit = concurrency.limit
+    await request(0.12)
+    assert concurrency.limit > limit
+    for _ in range(3):
+        await request(0.2)
+    assert concurrency.limit < limit
+    assert 0.05 < concurrency.baseline < 0.06
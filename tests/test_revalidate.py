@@ -0,0 +1,125 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from hypy import Hypy, HypyAsync, StaleWhileRevalidate
+from hypy.exceptions import HypixelServiceUnavailableError
+from hypy.modals import ActiveAuctionsResponse
+from conftest import URL, active_auctions_page
+
+
+def bazaar(last_updated):
+    return {"success": True, "lastUpdated": last_updated, "products": {}}
+
+
+def test_freshness_follows_last_updated():
+    revalidate = StaleWhileRevalidate(min_interval=0)
+    key = revalidate.key("skyblock/bazaar")
+    now = int(time.time() * 1000)
+    revalidate.put(key, bazaar(now))
+    assert revalidate.is_fresh(revalidate.get(key))
+    revalidate.put(key, bazaar(now - 11000))
+    assert not revalidate.is_fresh(revalidate.get(key))
+    revalidate.put(key, bazaar(now - 400000))
+    assert revalidate.get(key) is None
+    assert revalidate.key("skyblock/auctions", {"page": 0}) is not None
+    assert revalidate.key("skyblock/auctions", {"page": 1}) is None
+
+
+def test_serves_stale_while_refreshing_in_thread(respx_router: MockRouter):
+    stale = int(time.time() * 1000) - 60000
+    revalidate = StaleWhileRevalidate()
+    client = Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=revalidate)
+    route = respx_router.get(f"{URL}skyblock/bazaar").mock(side_effect=[
+        httpx.Response(200, json=bazaar(stale)),
+        httpx.Response(200, json=bazaar(int(time.time() * 1000))),
+    ])
+    assert client.bazaar().last_updated == stale
+    assert client.bazaar().last_updated == stale
+    deadline = time.monotonic() + 2
+    while revalidate._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.bazaar().last_updated > stale
+    assert route.call_count == 2
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_runs_one_background_refresh(respx_router: MockRouter):
+    stale = int(time.time() * 1000) - 60000
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=StaleWhileRevalidate())
+    route = respx_router.get(f"{URL}skyblock/bazaar").mock(side_effect=[
+        httpx.Response(200, json=bazaar(stale)),
+        httpx.Response(200, json=bazaar(int(time.time() * 1000))),
+    ])
+    await client.bazaar()
+    results = await asyncio.gather(*(client.bazaar() for _ in range(5)))
+    assert {result.last_updated for result in results} == {stale}
+    await asyncio.gather(*client._refreshes.values())
+    assert (await client.bazaar()).last_updated > stale
+    assert route.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_refreshes_back_off(respx_router: MockRouter):
+    stale = int(time.time() * 1000) - 60000
+    revalidate = StaleWhileRevalidate(min_interval=0.05, max_backoff=1)
+    revalidate.put(revalidate.key("skyblock/bazaar"), bazaar(stale))
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=revalidate)
+    route = respx_router.get(f"{URL}skyblock/bazaar").respond(status_code=503)
+    end = time.monotonic() + 0.5
+    while time.monotonic() < end:
+        assert (await client.bazaar())["lastUpdated"] == stale
+        await asyncio.sleep(0.005)
+    assert 2 <= route.call_count <= 4
+    assert isinstance(revalidate.last_error, HypixelServiceUnavailableError)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cold_loads_share_one_request(respx_router: MockRouter):
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=StaleWhileRevalidate())
+    route = respx_router.get(f"{URL}skyblock/bazaar").respond(status_code=503)
+    results = await asyncio.gather(*(client.bazaar() for _ in range(5)), return_exceptions=True)
+    assert all(isinstance(result, HypixelServiceUnavailableError) for result in results)
+    assert route.call_count == 1
+    route.respond(status_code=200, json=bazaar(int(time.time() * 1000)))
+    results = await asyncio.gather(*(client.bazaar() for _ in range(5)))
+    assert len({id(result) for result in results}) == 1
+    assert route.call_count == 2
+    await client.close()
+
+
+def test_cold_loads_wait_for_running_request(respx_router: MockRouter):
+    client = Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=StaleWhileRevalidate())
+
+    def slow(request):
+        time.sleep(0.1)
+        return httpx.Response(200, json=bazaar(int(time.time() * 1000)))
+
+    route = respx_router.get(f"{URL}skyblock/bazaar").mock(side_effect=slow)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: client.bazaar(), range(4)))
+    assert len({id(result) for result in results}) == 1
+    assert route.call_count == 1
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_active_auctions_downloads_first_page(respx_router: MockRouter):
+    revalidate = StaleWhileRevalidate()
+    stale = active_auctions_page(0, 1, ("old", 0))
+    stale["lastUpdated"] = int(time.time() * 1000) - 90000
+    revalidate.put(revalidate.key("skyblock/auctions", {"page": 0}), ActiveAuctionsResponse.model_validate(stale))
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", revalidate=revalidate)
+    route = respx_router.get(f"{URL}skyblock/auctions?page=0").respond(status_code=200, json=active_auctions_page(0, 2, ("a", 0)))
+    respx_router.get(f"{URL}skyblock/auctions?page=1").respond(status_code=200, json=active_auctions_page(1, 2, ("b", 0)))
+    uuids = [auction.uuid async for page in client.iter_active_auctions() for auction in page.auctions]
+    assert sorted(uuids) == ["a", "b"]
+    assert route.call_count == 1
+    await client.close()
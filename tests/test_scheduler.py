@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from hypy import PriorityScheduler
+
+
+@pytest.mark.asyncio
+async def test_interactive_skips_queued_background():
+    scheduler = PriorityScheduler(rate=50, burst=2, classes={"interactive": 0.5, "background": 0.5})
+    served = []
+
+    async def request(name, label):
+        with scheduler.priority(name):
+            await scheduler.acquire()
+        served.append(label)
+
+    await asyncio.gather(request("background", "b0"), request("background", "b1"))
+    background = [asyncio.create_task(request("background", f"b{i}")) for i in range(2, 6)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("interactive", "i0"))
+    await asyncio.gather(interactive, *background)
+    assert served[:2] == ["b0", "b1"]
+    assert served.index("i0") <= 3
+
+
+@pytest.mark.asyncio
+async def test_background_uses_idle_interactive_share():
+    scheduler = PriorityScheduler(rate=0.001, burst=10, classes={"interactive": 0.8, "background": 0.2})
+    with scheduler.priority("background"):
+        for _ in range(10):
+            await asyncio.wait_for(scheduler.acquire(), timeout=1)
+    assert scheduler.tokens("interactive") < 1
+
+
+def test_unknown_priority_class():
+    scheduler = PriorityScheduler()
+    with pytest.raises(ValueError):
+        with scheduler.priority("bulk"):
+            pass
+
@@ -0,0 +1,71 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from respx import MockRouter
+
+from hypy import Hypy, HypyAsync, SharedResponseCache
+from hypy.modals import ItemsResponse
+from conftest import URL
+
+ITEMS = {"success": True, "lastUpdated": 1590854517479, "items": [{"id": "HYPERION", "name": "Hyperion"}]}
+
+
+def test_workers_share_payloads(tmp_path, respx_router: MockRouter):
+    route = respx_router.get(f"{URL}resources/skyblock/items").respond(status_code=200, json=ITEMS)
+    workers = [Hypy(api_key="1234567890abcdefghijklmnopstuvwxyz", shared_cache=SharedResponseCache(str(tmp_path))) for _ in range(3)]
+    for worker in workers:
+        items = worker.items()
+        assert isinstance(items, ItemsResponse)
+        assert items.items[0].id == "HYPERION"
+        worker.close()
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_reads_shared_payload(tmp_path, respx_router: MockRouter):
+    route = respx_router.get(f"{URL}resources/skyblock/items").respond(status_code=200, json=ITEMS)
+    cache = SharedResponseCache(str(tmp_path), ttls={"resources/skyblock/items": 60})
+    client = HypyAsync(api_key="1234567890abcdefghijklmnopstuvwxyz", shared_cache=cache)
+    assert (await client.items()).items[0].id == "HYPERION"
+    assert cache.read("resources/skyblock/items") is not None
+    assert (await client.items()).items[0].name == "Hyperion"
+    await client.close()
+    assert route.call_count == 1
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = SharedResponseCache(str(tmp_path), ttls={"skyblock/bazaar": -1})
+    cache.write("skyblock/bazaar", None, b"{}")
+    assert cache.read("skyblock/bazaar") is None
+    assert cache.read("skyblock/profile", {"profile": "x"}) is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_lock(tmp_path):
+    cache = SharedResponseCache(str(tmp_path))
+
+    async def load():
+        return b"{}"
+    with cache.lock("skyblock/bazaar"):
+        waiter = asyncio.ensure_future(cache.fetch_async("skyblock/bazaar", None, load))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    await asyncio.sleep(0.05)
+    assert await asyncio.wait_for(cache.fetch_async("skyblock/bazaar", None, load), timeout=1) == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_waiters_do_not_hold_executor_threads(tmp_path):
+    cache = SharedResponseCache(str(tmp_path))
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return await asyncio.to_thread(lambda: b"{}")
+    results = await asyncio.wait_for(asyncio.gather(*(cache.fetch_async("skyblock/bazaar", None, load) for _ in range(3))), timeout=2)
+    assert results == [b"{}"] * 3
+    assert len(loads) == 1
@@ -0,0 +1,54 @@
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync
+from hypy.modals import ProfilesResponse
+from hypy.snapshots import ProfileTracker, apply, diff
+from conftest import URL
+
+
+def profiles(coins, kills):
+    return {
+        "success": True,
+        "profiles": [{
+            "profile_id": "p1",
+            "members": {"m1": {"currencies": {"coin_purse": coins}, "bestiary": {"kills": {"zombie_1": kills}}}},
+            "banking": {"balance": coins * 2}
+        }]
+    }
+
+
+def test_diff_and_apply_roundtrip():
+    old = {"a": 1, "b": {"c": [1, 2], "d": "x"}, "gone": True}
+    new = {"a": 1, "b": {"c": [1, 2, 3], "d": "x", "e": None}}
+    delta = diff(old, new)
+    assert sorted(operation[0] for operation in delta) == ["del", "set", "set"]
+    assert apply(old, delta) == new
+
+
+def test_tracker_rebuilds_any_point_in_time(tmp_path):
+    tracker = ProfileTracker(str(tmp_path), checkpoint_every=2)
+    for minute in range(6):
+        tracker.record_profiles(profiles(100.0 * minute, minute), timestamp=60.0 * minute)
+    tracker.record_profiles(profiles(500.0, 5), timestamp=360.0)
+    assert tracker.timestamps("p1") == [0.0, 60.0, 120.0, 180.0, 240.0, 300.0]
+    assert tracker.at("p1", 59) == profiles(0.0, 0)["profiles"][0]
+    assert tracker.at("p1", 250)["members"]["m1"]["currencies"]["coin_purse"] == 400.0
+    assert tracker.at("p1", -1) is None
+    reloaded = ProfileTracker(str(tmp_path), checkpoint_every=2)
+    assert reloaded.latest("p1") == tracker.latest("p1")
+    assert reloaded.at("p1", 130) == tracker.at("p1", 130)
+    assert reloaded.at("p1", 250)["banking"]["balance"] == 800.0
+    assert tracker._history("p1").entries == [] and reloaded._history("p1").entries == []
+    lines = (tmp_path / "p1.jsonl").read_text().splitlines()
+    assert [line.split(",")[1] for line in lines] == ['"full"', '"delta"', '"delta"', '"full"', '"delta"', '"delta"']
+
+
+@pytest.mark.asyncio
+async def test_tracker_records_raw_profiles(api_client: HypyAsync, respx_router: MockRouter):
+    respx_router.get(f"{URL}skyblock/profiles").respond(status_code=200, json=profiles(100.0, 1))
+    tracker = ProfileTracker()
+    tracker.record_profiles(await api_client.profiles("m1", raw=True), timestamp=0.0)
+    assert tracker.latest("p1")["banking"] == {"balance": 200.0}
+    with pytest.raises(TypeError):
+        tracker.record_profiles(ProfilesResponse.model_validate(profiles(100.0, 1)))
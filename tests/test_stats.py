@@ -0,0 +1,65 @@
+import pytest
+
+from hypy import PriceAggregator, QuantileSketch
+from hypy.modals import RecentlyAuctionsDetails
+from hypy.nbt import item_stacks, skyblock_id
+
+
+def test_item_bytes_roundtrip(item_bytes):
+    stacks = item_stacks(item_bytes(("HYPERION", 1)))
+    assert skyblock_id(stacks[0]) == "HYPERION"
+    assert stacks[0]["Count"] == 1
+
+
+def test_quantile_sketch_accuracy_and_merge():
+    left, right = QuantileSketch(), QuantileSketch()
+    for value in range(1, 5001):
+        left.add(value)
+    for value in range(5001, 10001):
+        right.add(value)
+    left.merge(right)
+    assert left.count == 10000
+    assert abs(left.quantile(0.5) - 5000) / 5000 <= 0.01
+    assert abs(left.quantile(0.99) - 9901) / 9901 <= 0.01
+
+
+def test_quantile_sketch_bounded_buckets():
+    sketch = QuantileSketch(max_buckets=16)
+    for value in range(1, 100000, 7):
+        sketch.add(value)
+    assert len(sketch._bins) <= 16
+    assert abs(sketch.quantile(1.0) - sketch.max) / sketch.max <= 0.01
+
+
+def test_price_aggregator_per_unit_prices(item_bytes):
+    aggregator = PriceAggregator(windows=(3600,))
+    auctions = [
+        RecentlyAuctionsDetails(auction_id=str(i), price=price, bin=True, timestamp=1590854517479 + i * 1000, item_bytes=item_bytes((item, count)))
+        for i, (item, price, count) in enumerate([("ENCHANTED_DIAMOND", 640, 64), ("ENCHANTED_DIAMOND", 1200, 64), ("HYPERION", 1000000, 1)])
+    ]
+    assert aggregator.add_many(auctions) == 3
+    assert set(aggregator.items()) == {"ENCHANTED_DIAMOND", "HYPERION"}
+    assert abs(aggregator.median("HYPERION") - 1000000) / 1000000 <= 0.01
+    assert 10 < aggregator.ewma("ENCHANTED_DIAMOND") < 18.75
+    other = PriceAggregator(windows=(3600,))
+    other.add_price("HYPERION", 900000, 1590854517.479)
+    aggregator.merge(other)
+    assert aggregator.stats("HYPERION").count == 2
+
+
+def test_quantile_sketch_merges_disjoint_ranges():
+    low, high = QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64)
+    for value in range(1, 101):
+        low.add(value)
+        high.add(value * 10 ** 6)
+    low.merge(high)
+    assert len(low._bins) <= 64
+    assert low.count == 200
+    assert abs(low.quantile(0.75) - 51 * 10 ** 6) / (51 * 10 ** 6) <= 0.01
+    assert abs(low.quantile(1.0) - low.max) / low.max <= 0.01
+
+
+def test_ewma_unknown_window():
+    aggregator = PriceAggregator(windows=(3600,))
+    with pytest.raises(ValueError, match="Unknown EWMA window"):
+        aggregator.ewma("HYPERION", 60)
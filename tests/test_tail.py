@@ -0,0 +1,44 @@
+import httpx
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync, HypixelForbiddenError
+from conftest import URL
+
+
+def ended(last_updated, *auction_ids):
+    return {
+        "success": True,
+        "lastUpdated": last_updated,
+        "auctions": [{"auction_id": auction_id, "price": 100, "bin": True, "timestamp": last_updated} for auction_id in auction_ids]
+    }
+
+
+@pytest.mark.asyncio
+async def test_tail_ended_auctions_deduplicates(api_client: HypyAsync, respx_router: MockRouter):
+    respx_router.get(f"{URL}skyblock/auctions_ended").mock(side_effect=[
+        httpx.Response(200, json=ended(1590854517479, "a", "b")),
+        httpx.Response(200, json=ended(1590854577479, "b", "c")),
+    ])
+    tail = api_client.tail_ended_auctions(retry_interval=0)
+    auction_ids = [(await anext(tail)).auction_id for _ in range(3)]
+    await tail.aclose()
+    assert auction_ids == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_tail_ended_auctions_survives_transient_errors(api_client: HypyAsync, respx_router: MockRouter):
+    route = respx_router.get(f"{URL}skyblock/auctions_ended").mock(side_effect=[
+        httpx.Response(200, json=ended(1590854517479, "a", "b")),
+        httpx.Response(503, json={"success": False}),
+        httpx.Response(502, json={"success": False}),
+        httpx.Response(429, json={"success": False, "cause": "Key throttle"}),
+        httpx.Response(200, json=ended(1590854577479, "b", "c")),
+        httpx.Response(403, json={"success": False, "cause": "Invalid API key"}),
+    ])
+    tail = api_client.tail_ended_auctions(retry_interval=0)
+    auction_ids = [(await anext(tail)).auction_id for _ in range(3)]
+    assert auction_ids == ["a", "b", "c"]
+    assert route.call_count == 5
+    with pytest.raises(HypixelForbiddenError):
+        await anext(tail)
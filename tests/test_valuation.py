@@ -0,0 +1,89 @@
+from hypy.modals import ActiveAuctionsResponse, BazaarResponse, MuseumResponse, ProfilesResponse
+from hypy.valuation import BlobCache, PriceTable, ValuationEngine, pet_key
+
+
+def test_value_profiles(item_bytes):
+    prices = PriceTable({"WHEAT": 2.0})
+    prices.update_bazaar(BazaarResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "products": {"ENCHANTED_DIAMOND": {"product_id": "ENCHANTED_DIAMOND", "quick_status": {"productId": "ENCHANTED_DIAMOND", "sellPrice": 1000.0}}}
+    }))
+    prices.update_lowest_bin(ActiveAuctionsResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "auctions": [
+            {"uuid": "a", "start": 1590854517479, "end": 1590858117479, "bin": True, "starting_bid": 900, "item_bytes": item_bytes(("HYPERION", 1))},
+            {"uuid": "b", "start": 1590854517479, "end": 1590858117479, "bin": True, "starting_bid": 800, "item_bytes": item_bytes(("HYPERION", 1))},
+            {"uuid": "c", "start": 1590854517479, "end": 1590858117479, "bin": False, "starting_bid": 1, "item_bytes": item_bytes(("HYPERION", 1))},
+            {"uuid": "d", "start": 1590854517479, "end": 1590858117479, "bin": True, "starting_bid": 5000,
+             "item_bytes": item_bytes(("PET", 1, {"type": "ENDER_DRAGON", "tier": "LEGENDARY"}))}
+        ]
+    }))
+    assert prices.get("HYPERION") == 800
+    assert prices.get(pet_key("ENDER_DRAGON", "LEGENDARY")) == 5000
+    profiles = ProfilesResponse.model_validate({
+        "success": True,
+        "profiles": [{
+            "profile_id": "p1",
+            "members": {
+                "m1": {
+                    "currencies": {"coin_purse": 10.5},
+                    "inventory": {
+                        "inv_contents": {"type": 0, "data": item_bytes(("HYPERION", 1), ("ENCHANTED_DIAMOND", 2))},
+                        "backpack_contents": {"0": {"type": 0, "data": item_bytes(("WHEAT", 64))}},
+                        "sacks_counts": {"WHEAT": 10}
+                    },
+                    "pets_data": {"pets": [{"type": "ENDER_DRAGON", "tier": "LEGENDARY"}]}
+                }
+            }
+        }]
+    })
+    museum = MuseumResponse.model_validate({
+        "success": True,
+        "members": {"m1": {"items": {"HYPERION": {"items": {"type": 0, "data": item_bytes(("HYPERION", 1))}}}}}
+    })
+    engine = ValuationEngine(prices)
+    valuations = engine.value_profiles([profiles], museums={"p1": museum})
+    valuation = valuations[("p1", "m1")]
+    assert valuation.purse == 10.5
+    assert valuation.inventory == 800 + 2000 + 128
+    assert valuation.sacks == 20
+    assert valuation.pets == 5000
+    assert valuation.museum == 800
+    assert engine.rank(valuations, limit=1) == [(("p1", "m1"), valuation.total)]
+
+
+def test_blob_cache_bounded_by_size(item_bytes):
+    cache = BlobCache(max_bytes=1000)
+    blobs = [item_bytes((f"ITEM_{index}", 1), ("WHEAT", 2)) for index in range(10)]
+    for blob in blobs:
+        assert cache.items(blob)[0][0].startswith("ITEM_")
+    assert 0 < len(cache) < 10
+    assert cache.size <= cache.max_bytes
+    assert cache.items(blobs[-1]) == (("ITEM_9", 1), ("WHEAT", 2))
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_lowest_bin_follows_every_sweep(item_bytes):
+    prices = PriceTable()
+    prices.update_bazaar(BazaarResponse.model_validate({
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "products": {"ENCHANTED_DIAMOND": {"product_id": "ENCHANTED_DIAMOND", "quick_status": {"productId": "ENCHANTED_DIAMOND", "sellPrice": 1000.0}}}
+    }))
+
+    def sweep(hyperion, diamond):
+        return ActiveAuctionsResponse.model_validate({
+            "success": True,
+            "lastUpdated": 1590854517479,
+            "auctions": [
+                {"uuid": "a", "start": 1590854517479, "end": 1590858117479, "bin": True, "starting_bid": hyperion, "item_bytes": item_bytes(("HYPERION", 1))},
+                {"uuid": "b", "start": 1590854517479, "end": 1590858117479, "bin": True, "starting_bid": diamond, "item_bytes": item_bytes(("ENCHANTED_DIAMOND", 1))}
+            ]
+        })
+    prices.update_lowest_bin(sweep(1000, 1))
+    prices.update_lowest_bin(sweep(500, 1))
+    assert prices.get("HYPERION") == 500
+    assert prices.get("ENCHANTED_DIAMOND") == 1000.0
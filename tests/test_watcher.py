@@ -0,0 +1,30 @@
+import asyncio
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from hypy import HypyAsync, Watcher
+from conftest import URL
+
+
+@pytest.mark.asyncio
+async def test_watcher_fans_out_changes(api_client: HypyAsync, respx_router: MockRouter):
+
+    def bazaar(last_updated):
+        return {"success": True, "lastUpdated": last_updated, "products": {}}
+    route = respx_router.get(f"{URL}skyblock/bazaar").mock(side_effect=[
+        httpx.Response(200, json=bazaar(1)),
+        httpx.Response(200, json=bazaar(1)),
+        httpx.Response(200, json=bazaar(2)),
+    ] + [httpx.Response(200, json=bazaar(3))] * 100)
+    watcher = Watcher(api_client, intervals={"bazaar": 0})
+    first = watcher.subscribe("bazaar", maxsize=10)
+    second = watcher.subscribe("bazaar", maxsize=10)
+    versions = [(await asyncio.wait_for(first.get(), timeout=1)).last_updated for _ in range(3)]
+    assert versions == [1, 2, 3]
+    assert (await second.get()).last_updated == 1
+    lagging = watcher.subscribe("bazaar", maxsize=1)
+    assert (await lagging.get()).last_updated == 3
+    await watcher.close()
+    assert route.call_count >= 4